@@ -0,0 +1,339 @@
+"""
+Benchmarks do solucionador do cabo suspenso
+
+Mede separadamente os caminhos críticos de ``CaboProblem``:
+
+- passos RK4 por segundo de cada backend
+- soluções completas pelo método do tiro por segundo, para vários h
+- vazão de ``diferenciacao_numerica`` e ``regressao_polinomial`` em
+  função do tamanho da malha
+- vazão de ``exportar_dados`` em cada formato
+- tempo de importação do módulo (via ``python -X importtime``)
+
+Cada medida é o melhor tempo entre várias repetições, após um
+aquecimento. Os resultados vão para JSON e podem ser comparados com uma
+linha de base armazenada.
+
+Uso:
+    python src/benchmark_cabo.py executar --saida atual.json
+    python src/benchmark_cabo.py comparar base.json atual.json --limite 0.1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from solucao_cabo import CaboProblem, EscritorColunar
+
+
+def medir(funcao, repeticoes=5):
+    """Menor tempo (s) entre ``repeticoes`` execuções de ``funcao``"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def _metrica(valor, unidade, maior_melhor=True):
+    return {'valor': float(valor), 'unidade': unidade,
+            'maior_melhor': maior_melhor}
+
+
+def _malha(n_pontos):
+    """Problema padrão com n_pontos na malha e sua solução analítica"""
+    cabo = CaboProblem(h=20 / (n_pontos - 1), metodo='analitico',
+                       verbose=False)
+    _, x_vals, y_vals, dydx_vals = cabo.resolver()
+    return cabo, x_vals, y_vals, dydx_vals
+
+
+def benchmark_backends(h=0.001, repeticoes=5):
+    """
+    Passos RK4 por segundo de cada backend (trajetória completa)
+
+    Retorna:
+    --------
+    dict
+        backend -> passos por segundo
+    """
+    resultados = {}
+    for backend in CaboProblem.BACKENDS:
+        cabo = CaboProblem(h=h, backend=backend, verbose=False)
+        if cabo.backend != backend:
+            continue  # numba indisponível
+        # Aquecimento (inclui a compilação do numba)
+        cabo.runge_kutta_4(cabo.y0, -0.7)
+        tempo = medir(lambda: cabo.runge_kutta_4(cabo.y0, -0.7), repeticoes)
+        resultados[backend] = cabo.n_steps / tempo
+    return resultados
+
+
+def benchmark_tiro(passos=(0.1, 0.05, 0.01), repeticoes=3):
+    """
+    Soluções completas por segundo (``resolver_metodo_tiro``) para cada h
+
+    Retorna:
+    --------
+    dict
+        h -> soluções por segundo
+    """
+    resultados = {}
+    for h in passos:
+        cabo = CaboProblem(h=h, verbose=False)
+        cabo.resolver_metodo_tiro()
+        resultados[h] = 1.0 / medir(cabo.resolver_metodo_tiro, repeticoes)
+    return resultados
+
+
+def benchmark_verificacao(tamanhos=(1_000, 100_000, 1_000_000),
+                          repeticoes=3):
+    """
+    Pontos por segundo de ``diferenciacao_numerica`` e
+    ``regressao_polinomial`` em função do tamanho da malha
+
+    Retorna:
+    --------
+    dict
+        (rotina, n_pontos) -> pontos por segundo
+    """
+    resultados = {}
+    for n in tamanhos:
+        cabo, x_vals, y_vals, _ = _malha(n)
+        tempo = medir(lambda: cabo.diferenciacao_numerica(x_vals, y_vals),
+                      repeticoes)
+        resultados[('diferenciacao_numerica', n)] = n / tempo
+
+        def regressao():
+            with contextlib.redirect_stdout(io.StringIO()):
+                cabo.regressao_polinomial(x_vals, y_vals)
+        resultados[('regressao_polinomial', n)] = n / medir(regressao,
+                                                             repeticoes)
+    return resultados
+
+
+def benchmark_exportacao(n_pontos=100_000, repeticoes=3):
+    """
+    Pontos por segundo de ``exportar_dados`` em cada formato
+
+    Os arquivos são gravados num diretório temporário.
+
+    Retorna:
+    --------
+    dict
+        formato -> pontos por segundo
+    """
+    cabo, x_vals, y_vals, dydx_vals = _malha(n_pontos)
+    residuos = np.zeros_like(x_vals)
+    polinomio = np.poly1d(np.polyfit(x_vals, y_vals, 4))
+
+    resultados = {}
+    diretorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as diretorio:
+        os.chdir(diretorio)
+        try:
+            for formato in ('csv', 'binario', 'colunar'):
+                def exportar():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        if formato == 'colunar':
+                            with EscritorColunar('dataset') as escritor:
+                                cabo.exportar_dados(
+                                    x_vals, y_vals, dydx_vals, residuos,
+                                    polinomio, formato, escritor)
+                        else:
+                            cabo.exportar_dados(x_vals, y_vals, dydx_vals,
+                                                residuos, polinomio, formato)
+                resultados[formato] = n_pontos / medir(exportar, repeticoes)
+        finally:
+            os.chdir(diretorio_original)
+    return resultados
+
+
+def tempo_importacao(modulos, repeticoes=5):
+    """
+    Tempo de importação (s) de ``modulos`` num interpretador novo
+
+    Soma o tempo cumulativo das importações de primeiro nível reportadas
+    por ``python -X importtime`` e devolve o menor entre as repetições.
+    """
+    codigo = '; '.join(f'import {m}' for m in modulos)
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', codigo],
+            cwd=Path(__file__).resolve().parent, capture_output=True,
+            text=True, check=True).stderr
+        total_us = 0
+        for linha in saida.splitlines():
+            if not linha.startswith('import time:'):
+                continue
+            campos = linha.split('|')
+            nome = campos[2]
+            # Importações de primeiro nível têm um único espaço de recuo
+            if campos[1].strip().isdigit() and not nome.startswith('  '):
+                total_us += int(campos[1])
+        tempos.append(total_us / 1e6)
+    return min(tempos)
+
+
+def benchmark_importacao(repeticoes=5):
+    """
+    Custo de importação do solucionador sozinho e com as dependências de
+    plotagem/exportação (equivalente às importações antes do carregamento
+    sob demanda)
+
+    Retorna:
+    --------
+    dict
+        cenário -> segundos
+    """
+    return {
+        'solucionador': tempo_importacao(['solucao_cabo'], repeticoes),
+        'com matplotlib/pandas': tempo_importacao(
+            ['solucao_cabo', 'matplotlib.pyplot', 'pandas'], repeticoes),
+    }
+
+
+def executar(rapido=False):
+    """
+    Executa todos os benchmarks
+
+    Parâmetros:
+    -----------
+    rapido : bool, default=False
+        Usa malhas menores e menos repetições (para verificações rápidas)
+
+    Retorna:
+    --------
+    dict
+        {'metadados': {...}, 'resultados': {nome: {'valor', 'unidade',
+        'maior_melhor'}}}
+    """
+    repeticoes = 2 if rapido else 5
+    tamanhos = (1_000, 100_000) if rapido else (1_000, 100_000, 1_000_000)
+    resultados = {}
+
+    for backend, valor in benchmark_backends(
+            h=0.01 if rapido else 0.001, repeticoes=repeticoes).items():
+        resultados[f'rk4.{backend}'] = _metrica(valor, 'passos/s')
+
+    for h, valor in benchmark_tiro(repeticoes=min(repeticoes, 3)).items():
+        resultados[f'tiro.h={h:g}'] = _metrica(valor, 'soluções/s')
+
+    for (rotina, n), valor in benchmark_verificacao(
+            tamanhos, min(repeticoes, 3)).items():
+        resultados[f'{rotina}.n={n}'] = _metrica(valor, 'pontos/s')
+
+    for formato, valor in benchmark_exportacao(
+            20_000 if rapido else 100_000, min(repeticoes, 3)).items():
+        resultados[f'exportar_dados.{formato}'] = _metrica(valor, 'pontos/s')
+
+    for cenario, valor in benchmark_importacao(repeticoes).items():
+        nome = 'importacao.' + cenario.replace(' ', '_').replace('/', '_')
+        resultados[nome] = _metrica(valor, 's', maior_melhor=False)
+
+    return {
+        'metadados': {
+            'data': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'processador': platform.processor() or platform.machine(),
+            'rapido': rapido,
+        },
+        'resultados': resultados,
+    }
+
+
+def comparar(base, atual, limite=0.10):
+    """
+    Compara dois conjuntos de resultados
+
+    Uma medida regrediu quando piorou mais que ``limite`` (fração) em
+    relação à linha de base, respeitando o sentido de 'maior_melhor'.
+
+    Retorna:
+    --------
+    list of tuple
+        (nome, valor_base, valor_atual, razão, regrediu) para as medidas
+        presentes nos dois conjuntos; razão > 1 significa melhora
+    """
+    linhas = []
+    for nome, medida in atual['resultados'].items():
+        if nome not in base['resultados']:
+            continue
+        v_base = base['resultados'][nome]['valor']
+        v_atual = medida['valor']
+        if medida['maior_melhor']:
+            razao = v_atual / v_base
+        else:
+            razao = v_base / v_atual
+        linhas.append((nome, v_base, v_atual, razao, razao < 1 - limite))
+    return linhas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks do solucionador do cabo suspenso")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_exec = sub.add_parser('executar', help="executa os benchmarks")
+    p_exec.add_argument('--saida', help="arquivo JSON de resultados")
+    p_exec.add_argument('--rapido', action='store_true',
+                        help="malhas menores e menos repetições")
+
+    p_comp = sub.add_parser('comparar',
+                            help="compara resultados com uma linha de base")
+    p_comp.add_argument('base', help="JSON da linha de base")
+    p_comp.add_argument('atual', help="JSON dos resultados atuais")
+    p_comp.add_argument('--limite', type=float, default=0.10,
+                        help="piora relativa tolerada (padrão: 0.10)")
+
+    args = parser.parse_args(argv)
+
+    if args.comando == 'executar':
+        dados = executar(rapido=args.rapido)
+        print("Medida\t\t\t\t\tValor\t\tUnidade")
+        print("-" * 70)
+        for nome, medida in dados['resultados'].items():
+            print(f"{nome:<36}\t{medida['valor']:.3e}\t{medida['unidade']}")
+        if args.saida:
+            with open(args.saida, 'w', encoding='utf-8') as f:
+                json.dump(dados, f, indent=2, ensure_ascii=False)
+            print(f"\nResultados salvos em: {args.saida}")
+        return 0
+
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.atual, encoding='utf-8') as f:
+        atual = json.load(f)
+
+    linhas = comparar(base, atual, args.limite)
+    print("Medida\t\t\t\t\tBase\t\tAtual\t\tRazão")
+    print("-" * 80)
+    for nome, v_base, v_atual, razao, regrediu in linhas:
+        marca = "  REGRESSÃO" if regrediu else ""
+        print(f"{nome:<36}\t{v_base:.3e}\t{v_atual:.3e}\t{razao:.2f}{marca}")
+
+    regressoes = [linha[0] for linha in linhas if linha[4]]
+    if regressoes:
+        print(f"\n{len(regressoes)} regressão(ões) acima de "
+              f"{100 * args.limite:.0f}%")
+        return 1
+    print("\nNenhuma regressão detectada")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
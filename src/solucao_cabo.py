@@ -10,15 +10,953 @@ Método: Tiro com RK4 e busca de raiz pelo método da secante
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
 import warnings
 from pathlib import Path
 import time
+import math
+import os
+import json
+import contextlib
+import functools
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+# matplotlib e pandas são importados sob demanda (plotar_resultados e
+# exportar_dados), para que quem só resolve o problema carregue apenas NumPy
+
+
+def _pyplot():
+    """Importa matplotlib.pyplot na primeira chamada (só o caminho
+    interativo de ``plotar_resultados`` usa pyplot)"""
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Estilo comum às figuras de ``plotar_resultados`` (interativa e sem
+# interface), aplicado sobre o estilo 'default'
+_ESTILO_FIGURA = {
+    'font.size': 11,
+    'axes.titlesize': 12,
+    'axes.labelsize': 11,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.titlesize': 14
+}
+
+
+def _aplicar_estilo(plt):
+    """Aplica o estilo das figuras ao pyplot (caminho interativo)"""
+    plt.style.use(['default', _ESTILO_FIGURA])
+
+
+def _contexto_estilo():
+    """Estilo das figuras só dentro de um bloco ``with``, sem alterar
+    o rcParams do processo (figuras sem interface)"""
+    import matplotlib.style
+    return matplotlib.style.context(['default', _ESTILO_FIGURA])
+
+
+# Tabela de Butcher do par embutido Dormand-Prince 5(4)
+_DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1])
+_DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+]
+_DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84])
+# Diferença entre os pesos de 4ª e 5ª ordem (estimativa do erro local);
+# o 7º estágio é o FSAL, avaliado no novo ponto
+_DP_E = np.array([-71/57600, 0, 71/16695, -71/1920, 17253/339200,
+                  -22/525, 1/40])
+# Saída densa de 4ª ordem (Hairer/Shampine): y(x + θh) = y + h * K.T @ P @ θ^k
+_DP_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608,
+     -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933,
+     87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304,
+     -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408,
+     701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883,
+     -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+
+def _rk4_escalar_trajetoria(C, h, n_steps, y, dydx, y_vals, dydx_vals):
+    """
+    Núcleo RK4 com escalares float para y'' = C√(1 + y'²)
+
+    Mesmas operações, na mesma ordem, de ``CaboProblem.runge_kutta_4``,
+    mas sem criar arrays a cada estágio. Preenche ``y_vals`` e
+    ``dydx_vals`` (comprimento n_steps + 1). Compatível com numba.
+    """
+    y_vals[0] = y
+    dydx_vals[0] = dydx
+    for i in range(n_steps):
+        k1y = h * dydx
+        k1d = h * (C * math.sqrt(1 + dydx * dydx))
+        d = dydx + k1d / 2
+        k2y = h * d
+        k2d = h * (C * math.sqrt(1 + d * d))
+        d = dydx + k2d / 2
+        k3y = h * d
+        k3d = h * (C * math.sqrt(1 + d * d))
+        d = dydx + k3d
+        k4y = h * d
+        k4d = h * (C * math.sqrt(1 + d * d))
+
+        y = y + (k1y + 2*k2y + 2*k3y + k4y) / 6
+        dydx = dydx + (k1d + 2*k2d + 2*k3d + k4d) / 6
+
+        y_vals[i+1] = y
+        dydx_vals[i+1] = dydx
+
+
+def _rk4_escalar_final(C, h, n_steps, y, dydx):
+    """
+    Como ``_rk4_escalar_trajetoria``, mas devolve apenas (y, dy/dx) em xf
+    """
+    for _ in range(n_steps):
+        k1y = h * dydx
+        k1d = h * (C * math.sqrt(1 + dydx * dydx))
+        d = dydx + k1d / 2
+        k2y = h * d
+        k2d = h * (C * math.sqrt(1 + d * d))
+        d = dydx + k2d / 2
+        k3y = h * d
+        k3d = h * (C * math.sqrt(1 + d * d))
+        d = dydx + k3d
+        k4y = h * d
+        k4d = h * (C * math.sqrt(1 + d * d))
+
+        y = y + (k1y + 2*k2y + 2*k3y + k4y) / 6
+        dydx = dydx + (k1d + 2*k2d + 2*k3d + k4d) / 6
+    return y, dydx
+
+
+# Versões compiladas com numba (carregadas sob demanda)
+_NUCLEOS_NUMBA = None
+
+
+def _nucleos_numba():
+    """
+    Compila os núcleos escalares com numba na primeira chamada
+
+    Retorna None se numba não estiver instalado.
+    """
+    global _NUCLEOS_NUMBA
+    if _NUCLEOS_NUMBA is None:
+        try:
+            import numba
+        except ImportError:
+            return None
+        _NUCLEOS_NUMBA = (numba.njit(_rk4_escalar_trajetoria),
+                          numba.njit(_rk4_escalar_final))
+    return _NUCLEOS_NUMBA
+
+
+def _resolver_tridiagonal(inferior, diagonal, superior, rhs,
+                          pivotamento=False):
+    """
+    Resolve um sistema tridiagonal em O(n)
+
+    ``inferior[i]`` e ``superior[i]`` multiplicam x[i-1] e x[i+1] na
+    linha i (``inferior[0]`` e ``superior[-1]`` são ignorados). Usa
+    ``scipy.linalg.solve_banded`` se scipy estiver instalado e, senão,
+    o algoritmo de Thomas (sem pivotamento, estável para matrizes
+    diagonalmente dominantes) ou, com ``pivotamento``, a eliminação com
+    pivotamento parcial de ``_eliminacao_tridiagonal_pivotada``.
+    """
+    try:
+        from scipy.linalg import solve_banded
+    except ImportError:
+        solve_banded = None
+    n = len(diagonal)
+    if solve_banded is not None:
+        banda = np.zeros((3, n))
+        banda[0, 1:] = superior[:-1]
+        banda[1] = diagonal
+        banda[2, :-1] = inferior[1:]
+        return solve_banded((1, 1), banda, rhs)
+    if pivotamento:
+        return _eliminacao_tridiagonal_pivotada(inferior, diagonal,
+                                                superior, rhs)
+
+    # Listas de floats: o laço em Python é bem mais rápido que indexar
+    # arrays elemento a elemento
+    a, b, c, d = (np.asarray(v, dtype=np.float64).tolist()
+                  for v in (inferior, diagonal, superior, rhs))
+    c_linha = [0.0] * n
+    d_linha = [0.0] * n
+    c_linha[0] = c[0] / b[0]
+    d_linha[0] = d[0] / b[0]
+    for i in range(1, n):
+        m = b[i] - a[i] * c_linha[i-1]
+        c_linha[i] = c[i] / m
+        d_linha[i] = (d[i] - a[i] * d_linha[i-1]) / m
+    x = [0.0] * n
+    x[-1] = d_linha[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = d_linha[i] - c_linha[i] * x[i+1]
+    return np.array(x)
+
+
+def _eliminacao_tridiagonal_pivotada(inferior, diagonal, superior, rhs):
+    """
+    Eliminação de Gauss com pivotamento parcial para um sistema
+    tridiagonal, em O(n) (o esquema do dgtsv do LAPACK)
+
+    A troca das linhas i e i+1 preenche uma segunda superdiagonal, de
+    modo que U tem banda (0, 2). Serve para diagonais com zeros, como a
+    jacobiana do tiro múltiplo. Lança ``np.linalg.LinAlgError`` se a
+    matriz for singular.
+    """
+    n = len(diagonal)
+    dl = np.asarray(inferior, dtype=np.float64)[1:].tolist()
+    d = np.asarray(diagonal, dtype=np.float64).tolist()
+    du = np.asarray(superior, dtype=np.float64)[:-1].tolist()
+    b = np.asarray(rhs, dtype=np.float64).tolist()
+    du2 = [0.0] * max(n - 2, 0)
+    for i in range(n - 1):
+        if abs(d[i]) >= abs(dl[i]):
+            # Sem troca: o pivô é d[i]
+            if d[i] == 0.0:
+                raise np.linalg.LinAlgError("Matriz singular")
+            fator = dl[i] / d[i]
+            d[i+1] -= fator * du[i]
+            b[i+1] -= fator * b[i]
+        else:
+            # Troca das linhas i e i+1: o pivô é dl[i]
+            fator = d[i] / dl[i]
+            d[i] = dl[i]
+            temp = d[i+1]
+            d[i+1] = du[i] - fator * temp
+            if i < n - 2:
+                du2[i] = du[i+1]
+                du[i+1] = -fator * du[i+1]
+            du[i] = temp
+            b[i], b[i+1] = b[i+1], b[i] - fator * b[i+1]
+    if d[-1] == 0.0:
+        raise np.linalg.LinAlgError("Matriz singular")
+
+    x = [0.0] * n
+    x[-1] = b[-1] / d[-1]
+    if n > 1:
+        x[-2] = (b[-2] - du[-1] * x[-1]) / d[-2]
+    for i in range(n - 3, -1, -1):
+        x[i] = (b[i] - du[i] * x[i+1] - du2[i] * x[i+2]) / d[i]
+    return np.array(x)
+
+
+def _rk4_segmentos(tarefa):
+    """
+    Avança em lote os segmentos do tiro múltiplo com RK4
+
+    ``tarefa`` = (C, h, estados, passos): ``estados`` tem forma (4, n_seg)
+    com (y, y', ∂y/∂y'_k, ∂y'/∂y'_k) no início de cada segmento e o
+    segmento j avança ``passos[j]`` passos de tamanho h. As mesmas
+    operações de ``CaboProblem.sistema_sensibilidade``, vetorizadas sobre
+    os segmentos. Função de módulo para poder rodar em processos.
+
+    Retorna:
+    --------
+    ndarray, shape (4, n_seg)
+        Estados no fim de cada segmento
+    """
+    C, h, estado, passos = tarefa
+
+    def f(e):
+        raiz = np.sqrt(1 + e[1]**2)
+        return np.array([e[1], C * raiz, e[3], C * e[1] / raiz * e[3]])
+
+    estado = np.array(estado, dtype=np.float64)
+    passos = np.asarray(passos)
+    for i in range(int(passos.max())):
+        k1 = h * f(estado)
+        k2 = h * f(estado + k1/2)
+        k3 = h * f(estado + k2/2)
+        k4 = h * f(estado + k3)
+        # Segmentos mais curtos (um passo a menos) ficam parados
+        estado = np.where(i < passos, estado + (k1 + 2*k2 + 2*k3 + k4) / 6,
+                          estado)
+    return estado
+
+
+# Pools de trabalhadores do tiro múltiplo, reutilizados entre resoluções
+# (os executores de concurrent.futures são encerrados na saída do
+# interpretador)
+_EXECUTORES = {}
+
+# Trechos por trabalhador abaixo dos quais o tiro múltiplo não divide o
+# lote: um passo RK4 em lote custa ~70 µs fixos de overhead numpy mais
+# ~0.07 µs por trecho, e cada lote paga o custo fixo de novo (com threads,
+# serializado pelo GIL). Dividir só compensa quando a parte por trecho de
+# cada lote supera a fixa, ~1000 trechos; o passo de Newton é O(K) e não
+# muda essa conta
+_SEGMENTOS_POR_LOTE = 1024
+
+
+def _executor_persistente(tipo, n_trabalhadores):
+    """Pool de 'threads' ou 'processos' com n_trabalhadores, criado na
+    primeira chamada e reutilizado nas seguintes"""
+    chave = (tipo, n_trabalhadores)
+    if chave not in _EXECUTORES:
+        classe = (ThreadPoolExecutor if tipo == 'threads'
+                  else ProcessPoolExecutor)
+        _EXECUTORES[chave] = classe(max_workers=n_trabalhadores)
+    return _EXECUTORES[chave]
+
+
+def _passo_newton_segmentos(s, s_linha, r_y, r_d):
+    """
+    Passo de Newton do tiro múltiplo em O(K)
+
+    O sistema bidiagonal por blocos G_k Δs_k - Δs_{k+1} = -r_k, com
+    G_k = [[1, s_k], [0, s'_k]], mais a linha final de y(xf), nas
+    incógnitas ordenadas (Δy'_0, Δy_1, Δy'_1, ..., Δy_{K-1}, Δy'_{K-1}),
+    é tridiagonal de ordem 2K - 1, com zeros na diagonal das linhas de
+    continuidade de y'; é resolvido com pivotamento parcial.
+
+    Retorna:
+    --------
+    tuple
+        (Δy nos nós com Δy_0 = 0, Δy' nos nós)
+    """
+    K = len(s)
+    n = 2 * K - 1
+    diagonal = np.zeros(n)
+    diagonal[0::2] = s
+    inferior = np.empty(n)
+    inferior[0::2] = 1.0
+    inferior[1::2] = s_linha[:-1]
+    superior = np.full(n, -1.0)
+    rhs = np.empty(n)
+    rhs[0::2] = -r_y
+    rhs[1::2] = -r_d
+    u = _resolver_tridiagonal(inferior, diagonal, superior, rhs,
+                              pivotamento=True)
+    return np.concatenate(([0.0], u[1::2])), u[0::2]
+
+
+class CacheInclinacoes:
+    """
+    Cache em processo de inclinações iniciais convergidas
+
+    As entradas são indexadas pelos parâmetros do problema normalizados
+    por translação (C, xf - x0, yf - y0) mais a configuração numérica
+    (h, tol, integrador, ...). Um acerto exato devolve a inclinação
+    convergida; numa falha, os vizinhos mais próximos no espaço
+    adimensional (C*L, Δy/L), do qual a inclinação depende, servem de
+    estimativas iniciais para a secante ou para Newton.
+
+    Parâmetros:
+    -----------
+    tamanho_max : int, default=1024
+        Número máximo de entradas
+    politica : str, default='lru'
+        Descarte quando cheio: 'lru' (menos usada recentemente) ou
+        'fifo' (mais antiga)
+    """
+
+    POLITICAS = ('lru', 'fifo')
+
+    def __init__(self, tamanho_max=1024, politica='lru'):
+        if tamanho_max < 1:
+            raise ValueError("tamanho_max deve ser pelo menos 1")
+        if politica not in self.POLITICAS:
+            raise ValueError(
+                f"Política '{politica}' desconhecida; use uma de {self.POLITICAS}")
+        self.tamanho_max = tamanho_max
+        self.politica = politica
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas = OrderedDict()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def limpar(self):
+        """Remove todas as entradas e zera as estatísticas"""
+        self._entradas.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave):
+        """Inclinação convergida para ``chave``, ou None se ausente"""
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            self.falhas += 1
+            return None
+        self.acertos += 1
+        if self.politica == 'lru':
+            self._entradas.move_to_end(chave)
+        return entrada[1]
+
+    def armazenar(self, chave, coordenadas, dydx_inicial):
+        """Guarda a inclinação convergida, descartando se necessário"""
+        if chave in self._entradas and self.politica == 'lru':
+            self._entradas.move_to_end(chave)
+        self._entradas[chave] = (coordenadas, dydx_inicial)
+        while len(self._entradas) > self.tamanho_max:
+            self._entradas.popitem(last=False)
+
+    def vizinhos(self, coordenadas, k=2):
+        """
+        Inclinações das ``k`` entradas mais próximas de ``coordenadas``
+        (mais próxima primeiro)
+        """
+        if not self._entradas:
+            return []
+        entradas = list(self._entradas.values())
+        pontos = np.array([e[0] for e in entradas])
+        escala = np.maximum(np.abs(pontos).max(axis=0), 1e-12)
+        distancias = np.linalg.norm(
+            (pontos - np.asarray(coordenadas)) / escala, axis=1)
+        ordem = np.argsort(distancias)[:k]
+        return [entradas[i][1] for i in ordem]
+
+
+class Instrumentacao:
+    """
+    Contadores e tempos por etapa do solucionador
+
+    Passada a ``CaboProblem(instrumentacao=...)``, acumula:
+
+    - ``contadores``: avaliações do lado direito da EDO
+      ('avaliacoes_rhs'), passos RK4 ('passos_rk4'), passos adaptativos
+      tentados ('passos_adaptativos'), integrações completas
+      ('integracoes') e iterações da busca de raiz ('iteracoes_tiro')
+    - ``tempos``: tempo total (``time.perf_counter``) e número de
+      chamadas de cada etapa: 'solucao', 'verificacao', 'regressao',
+      'plotagem' e 'exportacao'
+
+    A contagem é feita uma vez por integração (não a cada avaliação da
+    EDO), de modo que o custo é desprezível; sem instrumentação o
+    solucionador só testa ``instrumentacao is None``.
+
+    Parâmetros:
+    -----------
+    callback : callable, opcional
+        Chamado a cada iteração da busca de raiz como
+        ``callback(iteracao, z, F(z))``
+    """
+
+    CONTADORES = ('avaliacoes_rhs', 'passos_rk4', 'passos_adaptativos',
+                  'integracoes', 'iteracoes_tiro')
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.zerar()
+
+    def zerar(self):
+        """Zera contadores e tempos"""
+        self.contadores = dict.fromkeys(self.CONTADORES, 0)
+        self.tempos = {}
+
+    def contar(self, nome, n=1):
+        """Soma ``n`` ao contador ``nome``"""
+        self.contadores[nome] += n
+
+    def registrar_integracao(self, passos, avaliacoes, trajetorias=1,
+                             contador='passos_rk4'):
+        """Contabiliza ``trajetorias`` integrações de ``passos`` passos"""
+        self.contadores['integracoes'] += trajetorias
+        self.contadores[contador] += passos * trajetorias
+        self.contadores['avaliacoes_rhs'] += avaliacoes * trajetorias
+
+    def registrar_iteracao(self, iteracao, z, F):
+        """Conta uma iteração da busca de raiz e aciona o callback"""
+        if iteracao > 0:
+            self.contadores['iteracoes_tiro'] += 1
+        if self.callback is not None:
+            self.callback(iteracao, z, F)
+
+    @contextlib.contextmanager
+    def medir(self, etapa):
+        """Gerenciador de contexto que acumula o tempo de ``etapa``"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            tempo = self.tempos.setdefault(etapa,
+                                           {'total_s': 0.0, 'chamadas': 0})
+            tempo['total_s'] += time.perf_counter() - inicio
+            tempo['chamadas'] += 1
+
+    def como_dict(self):
+        """Contadores e tempos em um dicionário (cópia)"""
+        return {'contadores': dict(self.contadores),
+                'tempos': {etapa: dict(t) for etapa, t in self.tempos.items()}}
+
+    def como_json(self, caminho=None, **kwargs):
+        """
+        Serializa ``como_dict()`` em JSON; se ``caminho`` for dado, grava
+        o arquivo e devolve o caminho, senão devolve a string
+        """
+        texto = json.dumps(self.como_dict(), ensure_ascii=False, **kwargs)
+        if caminho is None:
+            return texto
+        Path(caminho).write_text(texto, encoding='utf-8')
+        return caminho
+
+
+class ResultadoCabo:
+    """
+    Resultado de ``CaboProblem.resolver_resultado``
+
+    Guarda a inclinação convergida, a trajetória e as estatísticas da
+    solução. As grandezas derivadas (propriedades físicas, resíduos da
+    verificação, ajuste polinomial e comparação com a catenária) são
+    calculadas, sem imprimir, no primeiro acesso e então reaproveitadas;
+    quem só precisa da inclinação ou da flecha não paga pelo resto.
+
+    Os parâmetros do problema (C, h, x0, xf, y0, yf, tol) são copiados na
+    construção e as grandezas derivadas usam só essas cópias, de modo
+    que alterar ``cabo`` depois (outro passo, ``resolver_inverso``, ...)
+    não muda um resultado já devolvido.
+
+    Atributos:
+    ----------
+    C, h, x0, xf, y0, yf, tol : float
+        Parâmetros do problema no momento da solução
+    dydx_otimo : float
+        Inclinação inicial convergida
+    x, y, dydx : ndarray
+        Trajetória na malha do problema
+    iteracoes : int
+        Iterações da busca de raiz
+    integracoes : int
+        Integrações completas gastas na busca de raiz
+    historico : list
+        ``(iteração, z, F(z))`` de cada iteração
+    tempo_execucao : float
+        Tempo da solução (s)
+    erro_contorno : float
+        |y(xf) - yf|
+    convergido : bool
+        Se ``erro_contorno`` está dentro da tolerância
+    """
+
+    __slots__ = ('cabo', 'C', 'h', 'x0', 'xf', 'y0', 'yf', 'tol',
+                 'dydx_otimo', 'x', 'y', 'dydx', 'iteracoes',
+                 'integracoes', 'historico', 'tempo_execucao',
+                 'erro_contorno', 'convergido', '_problema',
+                 '_propriedades', '_verificacao', '_regressao',
+                 '_comparacao_analitica', '_densa')
+
+    def __init__(self, cabo, dydx_otimo, x_vals, y_vals, dydx_vals):
+        self.cabo = cabo
+        self.C = cabo.C
+        self.h = cabo.h
+        self.x0, self.xf = cabo.x0, cabo.xf
+        self.y0, self.yf = cabo.y0, cabo.yf
+        self.tol = cabo.tol
+        self.dydx_otimo = dydx_otimo
+        self.x = x_vals
+        self.y = y_vals
+        self.dydx = dydx_vals
+        self.iteracoes = cabo.iteracoes_tiro
+        self.integracoes = cabo.integracoes_tiro
+        self.historico = list(cabo.historico_tiro)
+        self.tempo_execucao = cabo.tempo_execucao
+        self.erro_contorno = abs(y_vals[-1] - self.yf)
+        self.convergido = bool(self.erro_contorno <= self.tol)
+        self._problema = None
+        self._propriedades = None
+        self._verificacao = None
+        self._regressao = None
+        self._comparacao_analitica = None
+        self._densa = None
+
+    def __repr__(self):
+        return (f"ResultadoCabo(dydx_otimo={self.dydx_otimo:.8f}, "
+                f"iteracoes={self.iteracoes}, "
+                f"erro_contorno={self.erro_contorno:.2e})")
+
+    def como_tupla(self):
+        """(dydx_otimo, x_vals, y_vals, dydx_vals), como ``resolver()``"""
+        return self.dydx_otimo, self.x, self.y, self.dydx
+
+    def _congelado(self):
+        """``CaboProblem`` silencioso com os parâmetros copiados, usado
+        nas grandezas derivadas no lugar de ``cabo``"""
+        if self._problema is None:
+            self._problema = CaboProblem(
+                C=self.C, x0=self.x0, y0=self.y0, xf=self.xf, yf=self.yf,
+                h=self.h, tol=self.tol, verbose=False,
+                instrumentacao=self.cabo.instrumentacao)
+        return self._problema
+
+    @property
+    def flecha(self):
+        """Flecha y0 - min(y) (m), sem calcular as demais propriedades"""
+        if self._propriedades is not None:
+            return self._propriedades['flecha']
+        return self.y0 - np.min(self.y)
+
+    @property
+    def densa(self):
+        """``SolucaoDensa`` sobre a trajetória (sem reintegrar)"""
+        if self._densa is None:
+            self._densa = SolucaoDensa(self.x, self.y, self.dydx, self.C,
+                                       self.tol)
+        return self._densa
+
+    @property
+    def propriedades(self):
+        """Dicionário de ``calcular_propriedades_cabo``"""
+        if self._propriedades is None:
+            self._propriedades = self._congelado().calcular_propriedades_cabo(
+                self.x, self.y, self.dydx)
+        return self._propriedades
+
+    @property
+    def verificacao(self):
+        """(residuos, dy_dx_num, d2y_dx2_num) da diferenciação numérica"""
+        if self._verificacao is None:
+            self._verificacao = self._congelado().verificar_equacao_diferencial(
+                self.x, self.y, self.dydx)
+        return self._verificacao
+
+    @property
+    def residuos(self):
+        """Resíduos |y'' - C√(1+y'²)| pela diferenciação numérica"""
+        return self.verificacao[0]
+
+    @property
+    def regressao(self):
+        """(polinomio, residuos_poli, y_poli, dy_poli, d2y_poli)"""
+        if self._regressao is None:
+            self._regressao = self._congelado().regressao_polinomial(self.x,
+                                                                     self.y)
+        return self._regressao
+
+    @property
+    def polinomio(self):
+        """Polinômio de 4º grau ajustado à trajetória"""
+        return self.regressao[0]
+
+    @property
+    def comparacao_analitica(self):
+        """
+        Comparação com ``solucao_analitica_aproximada``: dicionário com
+        'y_analitica', 'a', 'b', 'd', 'erro_maximo' e 'erro_rms'
+        """
+        if self._comparacao_analitica is None:
+            y_analitica, a, b, d = \
+                self._congelado().solucao_analitica_aproximada(
+                    self.x, self.dydx_otimo)
+            erro = np.abs(self.y - y_analitica)
+            self._comparacao_analitica = {
+                'y_analitica': y_analitica, 'a': a, 'b': b, 'd': d,
+                'erro_maximo': np.max(erro),
+                'erro_rms': np.sqrt(np.mean(erro**2)),
+            }
+        return self._comparacao_analitica
+
+
+class SolucaoDensa:
+    """
+    Solução contínua y(x), dy/dx(x) a partir dos nós de uma integração
+
+    Em cada intervalo [x_i, x_{i+1}] usa interpolação cúbica de Hermite
+    com os valores e derivadas nos dois nós: y com (y, y') e dy/dx com
+    (y', y''), onde y'' = C√(1 + y'²) vem da própria EDO. O erro é
+    O(h⁴), a mesma ordem do RK4, e nenhuma consulta reintegra a EDO: o
+    intervalo de cada ponto é localizado por busca binária
+    (``np.searchsorted``), O(log n) por ponto.
+
+    Os nós podem vir da malha uniforme do RK4 ou dos passos aceitos do
+    integrador adaptativo (malha não uniforme).
+
+    Parâmetros:
+    -----------
+    x_vals : array_like
+        Abscissas dos nós (estritamente crescentes)
+    y_vals, dydx_vals : array_like
+        y e dy/dx nos nós
+    C : float
+        Constante da equação diferencial (m⁻¹)
+    tol : float, opcional
+        Precisão em y usada para reconhecer tangências em
+        ``cruzamentos`` (padrão: o limite do erro de interpolação,
+        C³·max(1+y'²)^½·Δ⁴/384 com Δ o maior intervalo, ou o
+        arredondamento de y, o que for maior)
+    """
+
+    __slots__ = ('x', 'y', 'dydx', 'd2ydx2', 'C', 'tol', '_minimos')
+
+    def __init__(self, x_vals, y_vals, dydx_vals, C, tol=None):
+        self.x = np.asarray(x_vals, dtype=np.float64)
+        self.y = np.asarray(y_vals, dtype=np.float64)
+        self.dydx = np.asarray(dydx_vals, dtype=np.float64)
+        if not (self.x.ndim == 1 and self.x.shape == self.y.shape
+                == self.dydx.shape):
+            raise ValueError("x, y e dy/dx devem ser vetores 1-D de mesmo "
+                             "comprimento")
+        if self.x.size < 2 or np.any(np.diff(self.x) <= 0):
+            raise ValueError(
+                "São necessários pelo menos 2 nós com x estritamente crescente")
+        self.C = C
+        self.d2ydx2 = C * np.sqrt(1 + self.dydx**2)
+        if tol is None:
+            tol = max(C**2 * np.max(self.d2ydx2)
+                      * np.max(np.diff(self.x))**4 / 384,
+                      16 * np.finfo(float).eps * np.max(np.abs(self.y)))
+        self.tol = tol
+        self._minimos = {}
+
+    def __repr__(self):
+        return (f"SolucaoDensa({self.x.size} nós em "
+                f"[{self.x[0]:g}, {self.x[-1]:g}])")
+
+    def _intervalos(self, x):
+        """Índice do intervalo de cada ponto, comprimento e coordenada
+        local t ∈ [0, 1]"""
+        x = np.asarray(x, dtype=np.float64)
+        folga = 1e-12 * (self.x[-1] - self.x[0])
+        if np.any(x < self.x[0] - folga) or np.any(x > self.x[-1] + folga):
+            raise ValueError(
+                f"Pontos fora do intervalo [{self.x[0]}, {self.x[-1]}]")
+        i = np.searchsorted(self.x, x, side='right') - 1
+        i = np.clip(i, 0, self.x.size - 2)
+        dx = self.x[i + 1] - self.x[i]
+        return i, dx, (x - self.x[i]) / dx
+
+    @staticmethod
+    def _hermite(t, dx, f0, f1, df0, df1):
+        """Cúbica de Hermite com valores f e derivadas df nos extremos"""
+        t2 = t * t
+        u = 1 - t
+        return ((1 + 2 * t) * u * u * f0 + t * u * u * dx * df0
+                + t2 * (3 - 2 * t) * f1 - t2 * u * dx * df1)
+
+    def avaliar(self, x):
+        """
+        y(x) e dy/dx(x) em um ponto ou array de pontos
+
+        Retorna:
+        --------
+        tuple
+            (y, dydx), com a forma de ``x``
+        """
+        i, dx, t = self._intervalos(x)
+        y = self._hermite(t, dx, self.y[i], self.y[i + 1],
+                          self.dydx[i], self.dydx[i + 1])
+        dydx = self._hermite(t, dx, self.dydx[i], self.dydx[i + 1],
+                             self.d2ydx2[i], self.d2ydx2[i + 1])
+        return y, dydx
+
+    def __call__(self, x):
+        """y(x) em um ponto ou array de pontos"""
+        i, dx, t = self._intervalos(x)
+        return self._hermite(t, dx, self.y[i], self.y[i + 1],
+                             self.dydx[i], self.dydx[i + 1])
+
+    def derivada(self, x):
+        """dy/dx(x) em um ponto ou array de pontos"""
+        i, dx, t = self._intervalos(x)
+        return self._hermite(t, dx, self.dydx[i], self.dydx[i + 1],
+                             self.d2ydx2[i], self.d2ydx2[i + 1])
+
+    def _corredor(self, x_inicio, x_fim):
+        """Limites do corredor, por padrão o vão inteiro"""
+        a = self.x[0] if x_inicio is None else float(x_inicio)
+        b = self.x[-1] if x_fim is None else float(x_fim)
+        if not self.x[0] <= a < b <= self.x[-1]:
+            raise ValueError(
+                f"Corredor [{a}, {b}] deve estar contido em "
+                f"[{self.x[0]}, {self.x[-1]}] e ter x_inicio < x_fim")
+        return a, b
+
+    def _newton_intervalo(self, funcao, lo, hi, alvo, f_lo, f_hi,
+                          max_iteracoes=50):
+        """
+        Raízes de funcao(x) = alvo em [lo, hi] (vetorizado), por Newton
+        com salvaguarda de bisseção, partindo da interpolação linear entre
+        f_lo = funcao(lo) e f_hi = funcao(hi); funcao devolve (valor,
+        derivada) e deve ser monótona em cada intervalo
+        """
+        lo, hi, alvo, f_lo, f_hi = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64)
+              for v in (lo, hi, alvo, f_lo, f_hi)))
+        tol_x = 1e-13 * (self.x[-1] - self.x[0])
+        tol_f = 4 * np.finfo(float).eps * np.maximum(1.0, np.abs(alvo))
+        g_lo = f_lo - alvo
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = lo + (hi - lo) * np.clip((alvo - f_lo) / (f_hi - f_lo), 0, 1)
+        x = np.where(np.isfinite(x), x, (lo + hi) / 2)
+        for _ in range(max_iteracoes):
+            g, dg = funcao(x)
+            g = g - alvo
+            mesmo_sinal = np.sign(g) == np.sign(g_lo)
+            lo = np.where(mesmo_sinal, x, lo)
+            g_lo = np.where(mesmo_sinal, g, g_lo)
+            hi = np.where(mesmo_sinal, hi, x)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x_novo = x - g / dg
+            # Passos que saem do intervalo viram bisseção
+            fora = ~((x_novo > lo) & (x_novo < hi))
+            pequeno = np.abs(g) <= tol_f
+            x_novo = np.where(pequeno, x,
+                              np.where(fora, (lo + hi) / 2, x_novo))
+            convergido = pequeno | (np.abs(x_novo - x) <= tol_x)
+            x = x_novo
+            if np.all(convergido):
+                break
+        return x
+
+    def minimo(self, x_inicio=None, x_fim=None):
+        """
+        Ponto mais baixo do cabo em um corredor [x_inicio, x_fim]
+
+        Como y'' > 0, dy/dx é crescente: o mínimo está num extremo do
+        corredor ou no único zero de dy/dx, isolado entre dois nós por
+        busca binária e refinado por Newton sobre a interpolação de
+        Hermite (com y'' da EDO como derivada). O resultado de cada
+        corredor é guardado para as consultas seguintes.
+
+        Retorna:
+        --------
+        tuple
+            (x_min, y_min)
+        """
+        a, b = self._corredor(x_inicio, x_fim)
+        if (a, b) not in self._minimos:
+            self._minimos[(a, b)] = self._calcular_minimo(a, b)
+        return self._minimos[(a, b)]
+
+    def _calcular_minimo(self, a, b):
+        """Mínimo de y em [a, b] (ver ``minimo``)"""
+        if self.derivada(a) >= 0:
+            return a, float(self(a))
+        if self.derivada(b) <= 0:
+            return b, float(self(b))
+
+        k = int(np.clip(np.searchsorted(self.dydx, 0.0), 1, self.x.size - 1))
+        lo, hi = max(a, self.x[k - 1]), min(b, self.x[k])
+
+        def inclinacao(x):
+            dydx = self.derivada(x)
+            return dydx, self.C * np.sqrt(1 + dydx**2)
+
+        x_min = float(self._newton_intervalo(
+            inclinacao, lo, hi, 0.0, self.derivada(lo), self.derivada(hi)))
+        return x_min, float(self(x_min))
+
+    def _cruzamentos_ramo(self, x_ini, x_fim, alturas):
+        """
+        Cruzamentos de cada altura num ramo monótono [x_ini, x_fim]
+        (NaN onde a altura está fora da faixa de y do ramo)
+        """
+        i0, i1 = np.searchsorted(self.x, [x_ini, x_fim], side='right')
+        xs = np.concatenate(([x_ini], self.x[i0:i1], [x_fim]))
+        xs = xs[np.concatenate(([True], np.diff(xs) > 0))]
+        ys = self(xs)
+        if ys[-1] < ys[0]:
+            # Ramo descendente: inverte para y crescente
+            xs, ys = xs[::-1], ys[::-1]
+        dentro = (alturas >= ys[0]) & (alturas <= ys[-1])
+        resultado = np.full(alturas.shape, np.nan)
+        if not np.any(dentro) or xs.size < 2:
+            return resultado
+        alvo = alturas[dentro]
+        j = np.clip(np.searchsorted(ys, alvo), 1, ys.size - 1)
+        lo = np.minimum(xs[j - 1], xs[j])
+        hi = np.maximum(xs[j - 1], xs[j])
+        resultado[dentro] = self._newton_intervalo(
+            self.avaliar, lo, hi, alvo, self(lo), self(hi))
+        return resultado
+
+    def cruzamentos(self, alturas, x_inicio=None, x_fim=None):
+        """
+        Abscissas onde y(x) cruza cada altura, dentro do corredor
+
+        Pela convexidade há no máximo dois cruzamentos por altura: um no
+        ramo descendente (antes do mínimo) e outro no ascendente. Cada
+        altura é localizada entre dois nós por busca binária e refinada
+        por Newton sobre a interpolação de Hermite, tudo vetorizado sobre
+        o lote de alturas.
+
+        Uma altura a até ``tol`` do mínimo interior é uma tangência: um
+        único cruzamento, em x_min, na coluna de descida. Sem isso, a
+        diferença de arredondamento entre a altura e o mínimo
+        interpolado produziria duas raízes quase iguais.
+
+        Parâmetros:
+        -----------
+        alturas : float ou array_like
+            Alturas de referência (ex.: folgas mínimas exigidas)
+        x_inicio, x_fim : float, opcional
+            Corredor (padrão: vão inteiro)
+
+        Retorna:
+        --------
+        ndarray, shape (n_alturas, 2)
+            Colunas (descida, subida); NaN onde não há cruzamento. Entre
+            as duas abscissas o cabo fica abaixo da altura.
+        """
+        alturas = np.atleast_1d(np.asarray(alturas, dtype=np.float64))
+        a, b = self._corredor(x_inicio, x_fim)
+        x_min, y_min = self.minimo(a, b)
+        resultado = np.full((alturas.size, 2), np.nan)
+        if x_min > a:
+            resultado[:, 0] = self._cruzamentos_ramo(a, x_min, alturas)
+        if x_min < b:
+            resultado[:, 1] = self._cruzamentos_ramo(x_min, b, alturas)
+        if a < x_min < b:
+            # Altura no mínimo, dentro da precisão: tangência, conta uma
+            # vez só
+            tangente = np.abs(alturas - y_min) <= self.tol
+            resultado[tangente, 0] = x_min
+            resultado[tangente | (alturas < y_min), 1] = np.nan
+        return resultado
+
+
+def _etapa(nome):
+    """Decorador que mede o método como a etapa ``nome`` quando o
+    problema tem instrumentação"""
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def envoltorio(self, *args, **kwargs):
+            if self.instrumentacao is None:
+                return metodo(self, *args, **kwargs)
+            with self.instrumentacao.medir(nome):
+                return metodo(self, *args, **kwargs)
+        return envoltorio
+    return decorador
 
 
 class CaboProblem:
-    def __init__(self, C=0.041, x0=0, y0=15, xf=20, yf=10, h=0.01, tol=1e-5):
+    # Métodos de solução do problema de contorno disponíveis em resolver()
+    METODOS = ('tiro', 'analitico', 'diferencas_finitas', 'tiro_multiplo')
+    # Integradores usados pelo método do tiro
+    INTEGRADORES = ('rk4', 'dopri5')
+    # Métodos de busca da inclinação inicial no método do tiro
+    RAIZES = ('secante', 'newton', 'brent')
+    # Implementações do RK4 de uma trajetória
+    BACKENDS = ('numpy', 'escalar', 'numba')
+    # Grandezas de calcular_propriedades_cabo aceitas por resolver_inverso
+    ALVOS_INVERSO = ('comprimento_arco', 'flecha')
+    # Grandezas controláveis por selecionar_passo e sua ordem na malha
+    ORDENS_GRANDEZAS = {'y_final': 4, 'flecha': 2, 'comprimento_arco': 1,
+                        'x_mais_baixo': 1}
+    # Maior C*ℓ de um trecho do tiro múltiplo: a sensibilidade cresce como
+    # e^(Cℓ) ao longo do trecho
+    CL_MAX_TRECHO = 4.0
+
+    def __init__(self, C=0.041, x0=0, y0=15, xf=20, yf=10, h=0.01, tol=1e-5,
+                 metodo='tiro', integrador='rk4', rtol=1e-8, atol=1e-10,
+                 raiz='secante', verbose=True, cache=None, backend='numpy',
+                 instrumentacao=None, segmentos=8, paralelo=None):
         """
         Inicializa o problema do cabo suspenso
 
@@ -30,34 +968,346 @@ class CaboProblem:
             Condições iniciais
         xf, yf : float, default=(20, 10)
             Condições de contorno final
-        h : float, default=0.01
-            Passo de integração
+        h : float ou 'auto', default=0.01
+            Passo de integração. Com 'auto', o maior passo cujo erro
+            estimado em y(xf) e na flecha reportada por
+            ``calcular_propriedades_cabo`` fica abaixo de ``tol`` é
+            escolhido por ``selecionar_passo`` e o relatório fica em
+            ``selecao_passo`` (não disponível com
+            ``metodo='diferencas_finitas'``)
         tol : float, default=1e-5
             Tolerância para convergência
+        metodo : str, default='tiro'
+            Método usado por ``resolver``: 'tiro' (RK4 + secante),
+            'analitico' (catenária em forma fechada) ou
+            'diferencas_finitas' (sistema global na malha, Newton com
+            jacobiana tridiagonal) ou 'tiro_multiplo' (``segmentos``
+            trechos integrados independentemente)
+        integrador : str, default='rk4'
+            Integrador do método do tiro: 'rk4' (passo fixo h) ou 'dopri5'
+            (Dormand-Prince 5(4) com passo adaptativo)
+        rtol, atol : float, default=(1e-8, 1e-10)
+            Tolerâncias relativa e absoluta do integrador adaptativo
+        raiz : str, default='secante'
+            Busca da inclinação inicial no método do tiro: 'secante',
+            'newton' (derivada exata pelas equações variacionais) ou
+            'brent' (intervalo expandido automaticamente e método de
+            Brent; convergência garantida com número limitado de
+            integrações)
+        verbose : bool, default=True
+            Se False, a solução, as verificações, a regressão e a
+            exportação não imprimem tabelas nem mensagens de progresso
+        cache : CacheInclinacoes, opcional
+            Cache de inclinações convergidas usado pelo método do tiro
+            para acertos exatos e estimativas iniciais
+        backend : str, default='numpy'
+            Implementação do RK4 de passo fixo: 'numpy' (arrays por
+            estágio), 'escalar' (floats puros, mesmo resultado bit a bit)
+            ou 'numba' (núcleo escalar compilado; recai em 'escalar' se
+            numba não estiver instalado)
+        instrumentacao : Instrumentacao, opcional
+            Coleta contadores (avaliações da EDO, passos, integrações,
+            iterações) e tempos por etapa; None desativa a coleta
+        segmentos : int, default=8
+            Número mínimo de trechos do tiro múltiplo
+            (``metodo='tiro_multiplo'``); vãos com C*(xf - x0) grande são
+            divididos em mais trechos (ver ``resolver_tiro_multiplo``)
+        paralelo : str, opcional
+            'threads' ou 'processos' para integrar os trechos do tiro
+            múltiplo em trabalhadores (ver ``resolver_tiro_multiplo``);
+            None (padrão) integra tudo no processo atual
         """
         # Validação dos parâmetros
         if C <= 0:
             raise ValueError("Constante C deve ser positiva")
-        if h <= 0 or h >= (xf - x0):
+        passo_automatico = isinstance(h, str)
+        if passo_automatico and h != 'auto':
+            raise ValueError("Passo h deve ser um número ou 'auto'")
+        if not passo_automatico and (h <= 0 or h >= (xf - x0)):
             raise ValueError(
                 "Passo h deve ser positivo e menor que o intervalo")
         if tol <= 0:
             raise ValueError("Tolerância deve ser positiva")
         if xf <= x0:
             raise ValueError("xf deve ser maior que x0")
+        if metodo not in self.METODOS:
+            raise ValueError(
+                f"Método '{metodo}' desconhecido; use um de {self.METODOS}")
+        if integrador not in self.INTEGRADORES:
+            raise ValueError(
+                f"Integrador '{integrador}' desconhecido; "
+                f"use um de {self.INTEGRADORES}")
+        if raiz not in self.RAIZES:
+            raise ValueError(
+                f"Busca de raiz '{raiz}' desconhecida; use uma de {self.RAIZES}")
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Backend '{backend}' desconhecido; use um de {self.BACKENDS}")
+        if backend == 'numba' and _nucleos_numba() is None:
+            warnings.warn("numba não está instalado; usando backend 'escalar'")
+            backend = 'escalar'
+        if rtol <= 0 or atol <= 0:
+            raise ValueError("Tolerâncias rtol e atol devem ser positivas")
+        if int(segmentos) != segmentos or segmentos < 1:
+            raise ValueError("segmentos deve ser um inteiro positivo")
+        if paralelo not in (None, 'threads', 'processos'):
+            raise ValueError("paralelo deve ser None, 'threads' ou 'processos'")
 
         self.C = C
         self.x0 = x0
         self.y0 = y0
         self.xf = xf
         self.yf = yf
-        self.h = h
         self.tol = tol
-        self.n_steps = int((self.xf - self.x0) / self.h)
+        self.metodo = metodo
+        self.integrador = integrador
+        self.rtol = rtol
+        self.atol = atol
+        self.raiz = raiz
+        self.verbose = verbose
+        self.cache = cache
+        self.backend = backend
+        self.instrumentacao = instrumentacao
+        self.segmentos = int(segmentos)
+        self.paralelo = paralelo
+        self.selecao_passo = None
+        if passo_automatico:
+            self._definir_passo((xf - x0) / 16)
+            self.selecionar_passo()
+        else:
+            self._definir_passo(h)
 
         # Para estatísticas
         self.tempo_execucao = 0
         self.iteracoes_tiro = 0
+        self.integracoes_tiro = 0
+        self.historico_tiro = []
+        self.historico_inverso = []
+        self.passos_aceitos = 0
+        self.passos_rejeitados = 0
+
+    def _imprimir(self, *args, **kwargs):
+        """print() condicionado a ``verbose``"""
+        if self.verbose:
+            print(*args, **kwargs)
+
+    @contextlib.contextmanager
+    def _silencioso(self):
+        """Desativa ``verbose`` temporariamente"""
+        verbose, self.verbose = self.verbose, False
+        try:
+            yield
+        finally:
+            self.verbose = verbose
+
+    def _definir_passo(self, h):
+        """
+        Define o passo h e o número de passos da malha uniforme
+
+        Quando o intervalo não é múltiplo de h, o número de passos é
+        arredondado para cima e h é reduzido para que a malha termine
+        exatamente em xf (antes o último trecho era descartado).
+        """
+        razao = (self.xf - self.x0) / h
+        n_steps = round(razao)
+        if abs(razao - n_steps) <= 1e-9 * razao:
+            self.h = h
+        else:
+            n_steps = int(np.ceil(razao))
+            self.h = (self.xf - self.x0) / n_steps
+        self.n_steps = n_steps
+
+    @contextlib.contextmanager
+    def _com_passo(self, h):
+        """Usa temporariamente o passo ``h`` (ajustado à malha)"""
+        h_original, n_original = self.h, self.n_steps
+        self._definir_passo(h)
+        try:
+            yield
+        finally:
+            self.h, self.n_steps = h_original, n_original
+
+    def _minimo_refinado(self, x_vals, y_vals, dydx_vals):
+        """
+        Ponto mais baixo (x, y) corrigido entre os nós
+
+        Como y'' > 0, dy/dx é crescente e o mínimo interior fica entre
+        os nós onde dy/dx troca de sinal. No nó de menor |dy/dx| a
+        expansão de Taylor com y'' = C√(1+y'²) dá o mínimo em
+        x - y'/y'', com valor y - y'²/(2y''); o erro é de ordem C³δ⁴
+        (δ < h), bem menor que o do RK4. A diferença para o nó mais baixo
+        é o erro de amostragem de ``calcular_propriedades_cabo``.
+        """
+        k = int(np.searchsorted(dydx_vals, 0.0))
+        if k == 0:
+            return x_vals[0], y_vals[0]
+        if k == len(dydx_vals):
+            return x_vals[-1], y_vals[-1]
+        i = k if abs(dydx_vals[k]) < abs(dydx_vals[k - 1]) else k - 1
+        d = dydx_vals[i]
+        curvatura = self.C * np.sqrt(1 + d * d)
+        return x_vals[i] - d / curvatura, y_vals[i] - d * d / (2 * curvatura)
+
+    def _estimar_erro_passo(self, h, dydx_inicial):
+        """
+        Erros, com passo h, das grandezas que o usuário vê
+
+        Integra a partir de ``dydx_inicial`` com h e h/2 e estima o erro
+        de y(xf) e de cada grandeza de ``calcular_propriedades_cabo``
+        com a ordem que ela tem na malha:
+
+        - y(xf): Richardson para o RK4 (4ª ordem), 16/15·|Q(h/2) - Q(h)|
+        - flecha (e a ordenada do ponto mais baixo): a mesma estimativa
+          do RK4 para o mínimo refinado entre os nós, mais o erro de
+          amostragem |mínimo refinado - nó mais baixo| (2ª ordem)
+        - comprimento_arco: a soma à esquerda é de 1ª ordem, erro(h) ≈
+          2·|S(h/2) - S(h)|
+        - abscissa do ponto mais baixo: distância do nó ao mínimo
+          refinado (até h/2, 1ª ordem)
+
+        Retorna:
+        --------
+        dict
+            h, n_steps, erro_y_final, erro_flecha, erro_comprimento_arco,
+            erro_x_mais_baixo, os valores extrapolados de y(xf) e da
+            flecha e o número de passos RK4 gastos
+        """
+        valores = []
+        for passo in (h, h / 2):
+            with self._com_passo(passo):
+                if not valores:
+                    h, n_h = self.h, self.n_steps
+                else:
+                    n_h2 = self.n_steps
+                x_vals, y_vals, dydx_vals = self.runge_kutta_4(self.y0,
+                                                               dydx_inicial)
+                propriedades = self.calcular_propriedades_cabo(
+                    x_vals, y_vals, dydx_vals)
+                valores.append((y_vals[-1], propriedades,
+                                self._minimo_refinado(x_vals, y_vals,
+                                                      dydx_vals)))
+        (y_h, p_h, (xr_h, yr_h)), (y_h2, p_h2, (_, yr_h2)) = valores
+        x_no, y_no = p_h['ponto_mais_baixo']
+        f_h, f_h2 = self.y0 - yr_h, self.y0 - yr_h2
+        return {
+            'h': h,
+            'n_steps': n_h,
+            'erro_y_final': 16 / 15 * abs(y_h2 - y_h),
+            'erro_flecha': 16 / 15 * abs(f_h2 - f_h) + abs(y_no - yr_h),
+            'erro_comprimento_arco': 2 * abs(p_h2['comprimento_arco']
+                                             - p_h['comprimento_arco']),
+            'erro_x_mais_baixo': abs(x_no - xr_h),
+            'y_final_extrapolado': y_h2 + (y_h2 - y_h) / 15,
+            'flecha_extrapolada': f_h2 + (f_h2 - f_h) / 15,
+            'passos_rk4': n_h + n_h2,
+        }
+
+    def selecionar_passo(self, precisao=None, h_inicial=None,
+                         max_tentativas=8, grandezas=('y_final', 'flecha')):
+        """
+        Escolhe o maior passo h que atende ``precisao`` nas grandezas
+        reportadas
+
+        Os erros são os das grandezas como ``calcular_propriedades_cabo``
+        e ``ResultadoCabo`` as reportam (ver ``_estimar_erro_passo``),
+        avaliados ao longo da trajetória da catenária que satisfaz o
+        contorno (``_parametros_catenaria``), sem resolver o problema de
+        contorno a cada tentativa. Cada estimativa prevê o próximo passo
+        pela ordem da grandeza que mais limita:
+        h ← 0.9·h·(precisao/erro)^(1/ordem), tanto para refinar quanto
+        para engrossar a malha. O passo escolhido fica em
+        ``h``/``n_steps`` (ajustado para terminar em xf).
+
+        Por padrão são controlados y(xf) e a flecha (que também dá a
+        ordenada do ponto mais baixo). O comprimento do arco, uma soma à
+        esquerda de 1ª ordem, e a abscissa do ponto mais baixo, que é a
+        de um nó, exigiriam malhas muito mais finas (h ~ precisao); seus
+        erros são sempre estimados e reportados, e entram no critério se
+        incluídos em ``grandezas``.
+
+        O modelo de erro é o do RK4, por isso o passo automático não se
+        aplica a ``metodo='diferencas_finitas'``.
+
+        Parâmetros:
+        -----------
+        precisao : float, opcional
+            Erro máximo aceito em cada grandeza controlada (padrão:
+            ``tol``)
+        h_inicial : float, opcional
+            Primeiro passo testado (padrão: intervalo/16)
+        max_tentativas : int, default=8
+            Limite de estimativas
+        grandezas : tuple de str, default=('y_final', 'flecha')
+            Grandezas controladas, entre 'y_final', 'flecha',
+            'comprimento_arco' e 'x_mais_baixo'
+
+        Retorna:
+        --------
+        dict
+            Relatório do passo escolhido (também em ``selecao_passo``):
+            h, n_steps, erro_y_final, erro_flecha, erro_comprimento_arco,
+            erro_x_mais_baixo, y_final_extrapolado, flecha_extrapolada,
+            precisao, grandezas, tentativas e passos_rk4 (total gasto na
+            seleção)
+        """
+        if self.metodo == 'diferencas_finitas':
+            raise ValueError(
+                "Passo automático não disponível para "
+                "metodo='diferencas_finitas' (esquema de 2ª ordem); "
+                "informe h")
+        if precisao is None:
+            precisao = self.tol
+        if precisao <= 0:
+            raise ValueError("Precisão deve ser positiva")
+        grandezas = tuple(grandezas)
+        desconhecidas = set(grandezas) - set(self.ORDENS_GRANDEZAS)
+        if not grandezas or desconhecidas:
+            raise ValueError(
+                f"grandezas deve conter apenas {tuple(self.ORDENS_GRANDEZAS)}")
+        L = self.xf - self.x0
+        # Pelo menos 4 passos (a verificação numérica usa 4 pontos)
+        h_max = L / 4
+        h = min(h_inicial if h_inicial is not None else L / 16, h_max)
+
+        a, b, _ = self._parametros_catenaria()
+        dydx_inicial = np.sinh((self.x0 - b) / a)
+
+        melhor = None
+        passos_rk4 = 0
+        for tentativa in range(1, max_tentativas + 1):
+            estimativa = self._estimar_erro_passo(h, dydx_inicial)
+            passos_rk4 += estimativa['passos_rk4']
+            erros = {g: estimativa[f'erro_{g}'] for g in grandezas}
+            if (max(erros.values()) <= precisao
+                    and (melhor is None or estimativa['h'] > melhor['h'])):
+                melhor = estimativa
+
+            fator = min(2.0 if erro == 0 else
+                        0.9 * (precisao / erro) ** (1 / self.ORDENS_GRANDEZAS[g])
+                        for g, erro in erros.items())
+            h_novo = min(h * min(fator, 2.0), h_max)
+            # Para quando a previsão não promete um passo maior que o aceito
+            if melhor is not None and h_novo <= melhor['h'] * 1.05:
+                break
+            h = h_novo
+        else:
+            if melhor is None:
+                warnings.warn(
+                    f"Precisão {precisao:.2e} não atingida em "
+                    f"{max_tentativas} tentativas; usando h = {h:.3e}")
+                melhor = self._estimar_erro_passo(h, dydx_inicial)
+                passos_rk4 += melhor['passos_rk4']
+
+        self._definir_passo(melhor['h'])
+        melhor.update({'precisao': precisao, 'grandezas': grandezas,
+                       'tentativas': tentativa, 'passos_rk4': passos_rk4})
+        self.selecao_passo = melhor
+        self._imprimir(
+            f"Passo escolhido: h = {self.h:.6g} ({self.n_steps} passos), "
+            f"erro estimado em y(xf) = {melhor['erro_y_final']:.2e}, "
+            f"na flecha = {melhor['erro_flecha']:.2e}, "
+            f"no comprimento = {melhor['erro_comprimento_arco']:.2e}")
+        return melhor
 
     def sistema_edo(self, x, y):
         """
@@ -67,7 +1317,20 @@ class CaboProblem:
         _ = x  # x não é usado nesta EDO autônoma
         return np.array([y[1], self.C * np.sqrt(1 + y[1]**2)])
 
-    def runge_kutta_4(self, y_inicial, dydx_inicial):
+    def sistema_sensibilidade(self, x, y):
+        """
+        Sistema de EDOs aumentado com as equações variacionais
+        y[0] = y, y[1] = dy/dx, y[2] = ∂y/∂z, y[3] = ∂(dy/dx)/∂z
+
+        z é a inclinação inicial; a sensibilidade parte de (0, 1) e
+        obedece à linearização de y'' = C√(1 + y'²).
+        """
+        _ = x  # x não é usado nesta EDO autônoma
+        raiz = np.sqrt(1 + y[1]**2)
+        return np.array([y[1], self.C * raiz,
+                         y[3], self.C * y[1] / raiz * y[3]])
+
+    def runge_kutta_4(self, y_inicial, dydx_inicial, saida=None):
         """
         Integração usando Runge-Kutta de 4ª ordem
 
@@ -77,6 +1340,10 @@ class CaboProblem:
             Valor inicial de y
         dydx_inicial : float
             Valor inicial de dy/dx
+        saida : tuple de ndarray, opcional
+            Arrays (x_vals, y_vals, dydx_vals) de comprimento n_steps+1
+            onde a trajetória é escrita diretamente (ex.: linhas de um
+            ``numpy.memmap``), sem alocar arrays próprios
 
         Retorna:
         --------
@@ -87,87 +1354,1033 @@ class CaboProblem:
         dydx_vals : ndarray
             Array de valores dy/dx
         """
-        # Inicialização dos arrays (pré-alocação para eficiência)
-        x_vals = np.linspace(self.x0, self.xf, self.n_steps + 1)
-        y_vals = np.zeros(self.n_steps + 1)
-        dydx_vals = np.zeros(self.n_steps + 1)
+        # Inicialização dos arrays (pré-alocação para eficiência)
+        if saida is None:
+            x_vals = np.linspace(self.x0, self.xf, self.n_steps + 1)
+            y_vals = np.zeros(self.n_steps + 1)
+            dydx_vals = np.zeros(self.n_steps + 1)
+        else:
+            x_vals, y_vals, dydx_vals = saida
+            if not (len(x_vals) == len(y_vals) == len(dydx_vals)
+                    == self.n_steps + 1):
+                raise ValueError(
+                    "Arrays de saída devem ter comprimento n_steps + 1")
+            self._preencher_malha(x_vals)
+
+        if self.backend != 'numpy':
+            nucleo = (_nucleos_numba()[0] if self.backend == 'numba'
+                      else _rk4_escalar_trajetoria)
+            nucleo(float(self.C), float(self.h), self.n_steps,
+                   float(y_inicial), float(dydx_inicial), y_vals, dydx_vals)
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_integracao(
+                    self.n_steps, 4 * self.n_steps)
+            return x_vals, y_vals, dydx_vals
+
+        # Condições iniciais
+        y_vals[0] = y_inicial
+        dydx_vals[0] = dydx_inicial
+
+        # Estado inicial
+        estado = np.array([y_inicial, dydx_inicial], dtype=np.float64)
+
+        # Integração RK4
+        for i in range(self.n_steps):
+            x = x_vals[i]
+
+            # Coeficientes RK4
+            k1 = self.h * self.sistema_edo(x, estado)
+            k2 = self.h * self.sistema_edo(x + self.h/2, estado + k1/2)
+            k3 = self.h * self.sistema_edo(x + self.h/2, estado + k2/2)
+            k4 = self.h * self.sistema_edo(x + self.h, estado + k3)
+
+            # Atualização do estado
+            estado = estado + (k1 + 2*k2 + 2*k3 + k4) / 6
+
+            # Armazenamento dos valores
+            y_vals[i+1] = estado[0]
+            dydx_vals[i+1] = estado[1]
+
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_integracao(self.n_steps,
+                                                     4 * self.n_steps)
+        return x_vals, y_vals, dydx_vals
+
+    def _preencher_malha(self, x_vals, tamanho_bloco=1 << 20):
+        """
+        Escreve a malha uniforme de ``np.linspace(x0, xf, n_steps+1)`` em
+        ``x_vals``, por blocos, sem criar o array completo
+        """
+        passo_malha = (self.xf - self.x0) / self.n_steps
+        for inicio in range(0, self.n_steps + 1, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, self.n_steps + 1)
+            x_vals[inicio:fim] = (np.arange(inicio, fim) * passo_malha
+                                  + self.x0)
+        x_vals[-1] = self.xf
+
+    def runge_kutta_4_lote(self, y_iniciais, dydx_iniciais, C=None):
+        """
+        Integração RK4 vetorizada de várias trajetórias simultaneamente
+
+        Todas as trajetórias avançam juntas com operações NumPy sobre o
+        lote, de modo que um único laço sobre ``n_steps`` atende o lote
+        inteiro. As operações são as mesmas de ``runge_kutta_4`` e na
+        mesma ordem, logo cada linha coincide bit a bit com a integração
+        individual da mesma condição inicial.
+
+        Parâmetros:
+        -----------
+        y_iniciais : array_like, shape (n_lote,)
+            Valores iniciais de y (um escalar é replicado para o lote)
+        dydx_iniciais : array_like, shape (n_lote,)
+            Valores iniciais de dy/dx
+        C : array_like, shape (n_lote,), opcional
+            Constante da EDO de cada trajetória (padrão: ``self.C`` para
+            todo o lote)
+
+        Retorna:
+        --------
+        x_vals : ndarray, shape (n_steps+1,)
+            Array de valores x (comum a todo o lote)
+        y_vals : ndarray, shape (n_lote, n_steps+1)
+            Valores de y de cada trajetória
+        dydx_vals : ndarray, shape (n_lote, n_steps+1)
+            Valores de dy/dx de cada trajetória
+        """
+        y_iniciais, dydx_iniciais = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(y_iniciais, dtype=np.float64)),
+            np.atleast_1d(np.asarray(dydx_iniciais, dtype=np.float64)))
+        if y_iniciais.ndim != 1:
+            raise ValueError("As condições iniciais devem ser vetores 1-D")
+        n_lote = y_iniciais.shape[0]
+
+        if C is None:
+            f = self.sistema_edo
+        else:
+            C_lote = np.broadcast_to(np.asarray(C, dtype=np.float64),
+                                     (n_lote,))
+
+            def f(x, e):
+                return np.array([e[1], C_lote * np.sqrt(1 + e[1]**2)])
+
+        x_vals = np.linspace(self.x0, self.xf, self.n_steps + 1)
+        y_vals = np.empty((n_lote, self.n_steps + 1))
+        dydx_vals = np.empty((n_lote, self.n_steps + 1))
+
+        y_vals[:, 0] = y_iniciais
+        dydx_vals[:, 0] = dydx_iniciais
+
+        # Estado do lote: linha 0 = y, linha 1 = dy/dx (sistema_edo
+        # opera coluna a coluna sem alterações)
+        estado = np.array([y_iniciais, dydx_iniciais], dtype=np.float64)
+
+        for i in range(self.n_steps):
+            x = x_vals[i]
+
+            k1 = self.h * f(x, estado)
+            k2 = self.h * f(x + self.h/2, estado + k1/2)
+            k3 = self.h * f(x + self.h/2, estado + k2/2)
+            k4 = self.h * f(x + self.h, estado + k3)
+
+            estado = estado + (k1 + 2*k2 + 2*k3 + k4) / 6
+
+            y_vals[:, i+1] = estado[0]
+            dydx_vals[:, i+1] = estado[1]
+
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_integracao(
+                self.n_steps, 4 * self.n_steps, trajetorias=n_lote)
+        return x_vals, y_vals, dydx_vals
+
+    def integrar_ponto_final(self, y_inicial, dydx_inicial):
+        """
+        Integração RK4 que mantém apenas o estado corrente
+
+        Usa o mesmo esquema (e a mesma ordem de operações) de
+        ``runge_kutta_4``, mas não armazena a trajetória: devolve apenas o
+        estado em xf, idêntico a ``y_vals[-1]`` e ``dydx_vals[-1]``.
+        Aceita escalares ou vetores (lote) como condições iniciais.
+
+        Retorna:
+        --------
+        tuple
+            (y_final, dydx_final)
+        """
+        if self.backend != 'numpy' and np.ndim(y_inicial) == 0 \
+                and np.ndim(dydx_inicial) == 0:
+            return self._ponto_final_escalar(y_inicial, dydx_inicial)
+
+        estado = np.array(np.broadcast_arrays(y_inicial, dydx_inicial),
+                          dtype=np.float64)
+        estado = self._rk4_ponto_final(self.sistema_edo, estado)
+        return estado[0], estado[1]
+
+    def _ponto_final_escalar(self, y_inicial, dydx_inicial):
+        """
+        Estado em xf pelo núcleo escalar (compilado com backend 'numba'),
+        bit a bit igual ao do backend 'numpy'
+        """
+        nucleo = (_nucleos_numba()[1] if self.backend == 'numba'
+                  else _rk4_escalar_final)
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_integracao(self.n_steps,
+                                                     4 * self.n_steps)
+        return nucleo(float(self.C), float(self.h), self.n_steps,
+                      float(y_inicial), float(dydx_inicial))
+
+    def _rk4_ponto_final(self, f, estado):
+        """
+        Avança ``estado`` de x0 até xf com RK4 de passo h sem armazenar
+        a trajetória
+        """
+        for i in range(self.n_steps):
+            x = self.x0 + i * self.h
+
+            k1 = self.h * f(x, estado)
+            k2 = self.h * f(x + self.h/2, estado + k1/2)
+            k3 = self.h * f(x + self.h/2, estado + k2/2)
+            k4 = self.h * f(x + self.h, estado + k3)
+
+            estado = estado + (k1 + 2*k2 + 2*k3 + k4) / 6
+
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_integracao(
+                self.n_steps, 4 * self.n_steps,
+                trajetorias=estado.shape[1] if estado.ndim == 2 else 1)
+        return estado
+
+    def _rk4_trecho(self, y, dydx, n_passos, y_vals, dydx_vals):
+        """
+        Integra ``n_passos`` passos RK4 a partir de (y, dydx), escrevendo
+        o estado inicial e os seguintes em ``y_vals``/``dydx_vals``
+        (comprimento >= n_passos + 1) com o backend configurado
+        """
+        if self.backend != 'numpy':
+            nucleo = (_nucleos_numba()[0] if self.backend == 'numba'
+                      else _rk4_escalar_trajetoria)
+            nucleo(float(self.C), float(self.h), n_passos, float(y),
+                   float(dydx), y_vals, dydx_vals)
+        else:
+            y_vals[0] = y
+            dydx_vals[0] = dydx
+            estado = np.array([y, dydx], dtype=np.float64)
+            for i in range(n_passos):
+                k1 = self.h * self.sistema_edo(None, estado)
+                k2 = self.h * self.sistema_edo(None, estado + k1/2)
+                k3 = self.h * self.sistema_edo(None, estado + k2/2)
+                k4 = self.h * self.sistema_edo(None, estado + k3)
+
+                estado = estado + (k1 + 2*k2 + 2*k3 + k4) / 6
+
+                y_vals[i+1] = estado[0]
+                dydx_vals[i+1] = estado[1]
+
+        if self.instrumentacao is not None:
+            # Um trecho é parte de uma integração (contada pelo chamador)
+            self.instrumentacao.contar('passos_rk4', n_passos)
+            self.instrumentacao.contar('avaliacoes_rhs', 4 * n_passos)
+
+    def gerar_trajetoria_em_blocos(self, y_inicial, dydx_inicial,
+                                   tamanho_bloco=65536):
+        """
+        Gera a trajetória RK4 em blocos de tamanho fixo
+
+        Cada bloco é produzido à medida que a integração avança, de modo
+        que a memória usada não depende de ``n_steps``. A concatenação dos
+        blocos é idêntica à saída de ``runge_kutta_4``.
+
+        Parâmetros:
+        -----------
+        y_inicial, dydx_inicial : float
+            Condições iniciais
+        tamanho_bloco : int, default=65536
+            Número máximo de pontos por bloco
+
+        Gera:
+        -----
+        tuple
+            (x, y, dydx) de cada bloco
+        """
+        if tamanho_bloco < 2:
+            raise ValueError("tamanho_bloco deve ser pelo menos 2")
+
+        passo_malha = (self.xf - self.x0) / self.n_steps
+        y_buf = np.empty(tamanho_bloco + 1)
+        dydx_buf = np.empty(tamanho_bloco + 1)
+        y, dydx = y_inicial, dydx_inicial
+
+        # O primeiro bloco inclui o ponto inicial; os demais começam no
+        # ponto seguinte ao último do bloco anterior
+        inicio, restantes = 0, self.n_steps
+        n_passos = min(tamanho_bloco - 1, restantes)
+        primeiro = True
+        if self.instrumentacao is not None:
+            self.instrumentacao.contar('integracoes')
+        while True:
+            self._rk4_trecho(y, dydx, n_passos, y_buf, dydx_buf)
+            y, dydx = y_buf[n_passos], dydx_buf[n_passos]
+            fatia = slice(0 if primeiro else 1, n_passos + 1)
+            n_bloco = fatia.stop - fatia.start
+
+            x = np.arange(inicio, inicio + n_bloco) * passo_malha + self.x0
+            restantes -= n_passos
+            if restantes == 0:
+                x[-1] = self.xf
+            yield x, y_buf[fatia].copy(), dydx_buf[fatia].copy()
+
+            if restantes == 0:
+                return
+            inicio += n_bloco
+            primeiro = False
+            n_passos = min(tamanho_bloco, restantes)
+
+    def _dormand_prince(self, f, estado_inicial, x_saida=None):
+        """
+        Integração adaptativa Dormand-Prince 5(4) de x0 até xf
+
+        Parâmetros:
+        -----------
+        f : callable
+            Lado direito f(x, estado) do sistema de EDOs
+        estado_inicial : array_like
+            Estado em x0
+        x_saida : array_like, opcional
+            Pontos (crescentes, em [x0, xf]) onde a solução é desejada,
+            obtidos pela saída densa de 4ª ordem. Se None, devolve os
+            pontos aceitos pelo controle de passo.
+
+        Retorna:
+        --------
+        x_vals : ndarray
+            Abscissas da saída
+        estados : ndarray, shape (n_estado, len(x_vals))
+            Estado em cada abscissa
+        """
+        x = float(self.x0)
+        estado = np.array(estado_inicial, dtype=np.float64)
+        k = np.empty((7, estado.size))
+        k[0] = f(x, estado)
+
+        if x_saida is not None:
+            x_saida = np.asarray(x_saida, dtype=np.float64)
+            estados_saida = np.empty((estado.size, x_saida.size))
+            i_saida = 0
+            while i_saida < x_saida.size and x_saida[i_saida] <= x:
+                estados_saida[:, i_saida] = estado
+                i_saida += 1
+        else:
+            x_passos = [x]
+            estados_passos = [estado]
+
+        def norma(v):
+            return np.sqrt(np.mean(v**2))
+
+        # Passo inicial (Hairer, Nørsett & Wanner, II.4)
+        escala = self.atol + self.rtol * np.abs(estado)
+        d0, d1 = norma(estado / escala), norma(k[0] / escala)
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h0 = min(h0, self.xf - x)
+        d2 = norma((f(x + h0, estado + h0 * k[0]) - k[0]) / escala) / h0
+        if d1 <= 1e-15 and d2 <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+        passo = min(100 * h0, h1, self.xf - x)
+
+        fim = False
+        tentativas = 0
+        while not fim:
+            tentativas += 1
+            if x + passo >= self.xf or (self.xf - x - passo) < 1e-12 * passo:
+                passo = self.xf - x
+                fim = True
+
+            for s in range(1, 6):
+                k[s] = f(x + _DP_C[s] * passo,
+                         estado + passo * np.dot(_DP_A[s], k[:s]))
+            estado_novo = estado + passo * np.dot(_DP_B, k[:6])
+            k[6] = f(x + passo, estado_novo)
+
+            escala = self.atol + self.rtol * np.maximum(np.abs(estado),
+                                                        np.abs(estado_novo))
+            erro = norma(passo * np.dot(_DP_E, k) / escala)
+
+            if erro > 1:
+                # Passo rejeitado: reduz e tenta novamente
+                self.passos_rejeitados += 1
+                passo *= max(0.2, 0.9 * erro ** (-1 / 5))
+                fim = False
+                continue
+
+            self.passos_aceitos += 1
+            x_novo = self.xf if fim else x + passo
+
+            if x_saida is not None:
+                # Saída densa para os pontos que caem neste passo
+                Q = k.T @ _DP_P
+                while i_saida < x_saida.size and (
+                        x_saida[i_saida] <= x_novo or fim):
+                    theta = (x_saida[i_saida] - x) / passo
+                    estados_saida[:, i_saida] = estado + passo * (
+                        Q @ (theta ** np.arange(1, 5)))
+                    i_saida += 1
+            else:
+                x_passos.append(x_novo)
+                estados_passos.append(estado_novo)
+
+            x, estado = x_novo, estado_novo
+            k[0] = k[6]
+            fator = 10 if erro == 0 else min(10, 0.9 * erro ** (-1 / 5))
+            passo *= fator
+
+        if self.instrumentacao is not None:
+            # 2 avaliações na escolha do passo inicial + 6 por tentativa
+            self.instrumentacao.registrar_integracao(
+                tentativas, 2 + 6 * tentativas,
+                contador='passos_adaptativos')
+
+        if x_saida is not None:
+            return x_saida, estados_saida
+        return np.array(x_passos), np.array(estados_passos).T
+
+    def runge_kutta_adaptativo(self, y_inicial, dydx_inicial, x_saida=None):
+        """
+        Integração com passo adaptativo (Dormand-Prince 5(4))
+
+        O passo é controlado por ``rtol``/``atol`` e os contadores
+        ``passos_aceitos`` e ``passos_rejeitados`` são acumulados (o
+        método do tiro os zera no início de cada solução).
+
+        Parâmetros:
+        -----------
+        y_inicial, dydx_inicial : float
+            Condições iniciais
+        x_saida : array_like, opcional
+            Pontos onde avaliar a solução (saída densa). Se None, devolve
+            os pontos aceitos pelo controle de passo.
+
+        Retorna:
+        --------
+        tuple
+            (x_vals, y_vals, dydx_vals)
+        """
+        x_vals, estados = self._dormand_prince(
+            self.sistema_edo, [y_inicial, dydx_inicial], x_saida)
+        return x_vals, estados[0], estados[1]
+
+    def solucao_densa(self, dydx_inicial):
+        """
+        Integra a partir de ``dydx_inicial`` e devolve a solução contínua
+
+        Com o integrador 'rk4' os nós são os da malha uniforme de passo h.
+        Com 'dopri5' os passos aceitos são poucos e longos demais para a
+        cúbica de Hermite; os nós são então reamostrados pela saída densa
+        de 4ª ordem do Dormand-Prince numa malha uniforme fina o bastante
+        para que o erro de interpolação fique abaixo de ``tol``/2 (a outra
+        metade fica para a integração). Na catenária y⁽ⁿ⁾ = Cⁿ⁻¹·cosh ou
+        Cⁿ⁻¹·sinh, e o erro da cúbica de Hermite é no máximo
+        max|f⁽⁴⁾|·Δ⁴/384 (f = y ou dy/dx), o que dá
+        Δ ≤ (192·tol / (C³·max(1, C)·√(1 + max y'²)))^(1/4).
+
+        Retorna:
+        --------
+        SolucaoDensa
+        """
+        if self.integrador == 'dopri5':
+            _, _, dydx_passos = self.runge_kutta_adaptativo(self.y0,
+                                                            dydx_inicial)
+            L = self.xf - self.x0
+            derivada_4 = (self.C**3 * max(1.0, self.C)
+                          * np.sqrt(1 + np.max(dydx_passos**2)))
+            n_nos = max(dydx_passos.size - 1, int(np.ceil(
+                L / (192 * self.tol / derivada_4) ** 0.25)))
+            x_vals, y_vals, dydx_vals = self.runge_kutta_adaptativo(
+                self.y0, dydx_inicial,
+                np.linspace(self.x0, self.xf, n_nos + 1))
+        else:
+            x_vals, y_vals, dydx_vals = self.runge_kutta_4(self.y0,
+                                                           dydx_inicial)
+        return SolucaoDensa(x_vals, y_vals, dydx_vals, self.C, self.tol)
+
+    def funcao_erro(self, dydx_inicial):
+        """
+        Função de erro para o método do tiro
+        Retorna a diferença entre y(xf) calculado e o valor alvo
+
+        Durante a busca de raiz só o ponto final interessa, então a
+        trajetória não é armazenada (ver ``integrar_ponto_final``).
+        Cada chamada soma uma integração a ``integracoes_tiro``.
+        """
+        self.integracoes_tiro += 1
+        if self.integrador == 'dopri5':
+            _, y_vals, _ = self.runge_kutta_adaptativo(self.y0, dydx_inicial)
+            return y_vals[-1] - self.yf
+        y_final, _ = self.integrar_ponto_final(self.y0, dydx_inicial)
+        return y_final - self.yf
+
+    def funcao_erro_com_derivada(self, dydx_inicial):
+        """
+        Função de erro do método do tiro e sua derivada exata
+
+        Integra o estado e a sensibilidade ∂(y, dy/dx)/∂z na mesma
+        varredura (``sistema_sensibilidade``), com o integrador escolhido.
+
+        Retorna:
+        --------
+        tuple
+            (F(z), F'(z)) com F(z) = y(xf; z) - yf
+        """
+        self.integracoes_tiro += 1
+        estado = np.array([self.y0, dydx_inicial, 0.0, 1.0], dtype=np.float64)
+        if self.integrador == 'dopri5':
+            _, estados = self._dormand_prince(self.sistema_sensibilidade,
+                                              estado)
+            estado = estados[:, -1]
+        else:
+            estado = self._rk4_ponto_final(self.sistema_sensibilidade, estado)
+        return estado[0] - self.yf, estado[2]
+
+    def resolver(self):
+        """
+        Resolve o problema de contorno com o método escolhido em ``metodo``
+
+        Retorna:
+        --------
+        tuple
+            (dydx_otimo, x_vals, y_vals, dydx_vals)
+        """
+        if self.metodo == 'analitico':
+            return self.resolver_analitico()
+        if self.metodo == 'diferencas_finitas':
+            return self.resolver_diferencas_finitas()
+        if self.metodo == 'tiro_multiplo':
+            return self.resolver_tiro_multiplo()
+        return self.resolver_metodo_tiro()
+
+    def _residuo_diferencas(self, y_vals, C):
+        """
+        Resíduo da EDO discretizada por diferenças centrais nos pontos
+        interiores e os ingredientes da jacobiana
+
+        Retorna:
+        --------
+        tuple
+            (R, p, raiz) com p = (y[i+1] - y[i-1])/2h e raiz = √(1 + p²)
+        """
+        h = self.h
+        p = (y_vals[2:] - y_vals[:-2]) / (2 * h)
+        raiz = np.sqrt(1 + p**2)
+        R = (y_vals[2:] - 2 * y_vals[1:-1] + y_vals[:-2]) / h**2 - C * raiz
+        return R, p, raiz
+
+    def _estimativa_diferencas(self, x_vals, C):
+        """Parábola pelos apoios com a curvatura C√(1 + m²) da corda m"""
+        m = (self.yf - self.y0) / (self.xf - self.x0)
+        y_vals = (self.y0 + m * (x_vals - self.x0)
+                  + C * np.sqrt(1 + m**2) / 2
+                  * (x_vals - self.x0) * (x_vals - self.xf))
+        y_vals[-1] = self.yf
+        return y_vals
+
+    def _newton_diferencas(self, y_vals, C, max_iteracoes):
+        """
+        Iterações de Newton amortecido do sistema de diferenças finitas
+        para a constante C, a partir de ``y_vals``
+
+        Retorna:
+        --------
+        tuple
+            (y_vals, convergiu); as iterações são somadas a
+            ``iteracoes_tiro`` e registradas em ``historico_tiro``
+        """
+        h = self.h
+        R, p, raiz = self._residuo_diferencas(y_vals, C)
+        norma = np.sqrt(np.mean(R**2))
+        diagonal = np.full(R.size, -2 / h**2)
+
+        while self.iteracoes_tiro < max_iteracoes:
+            # Jacobiana tridiagonal de R em relação a y[1:-1]
+            g = C * p / raiz / (2 * h)
+            delta = _resolver_tridiagonal(1 / h**2 + g, diagonal,
+                                          1 / h**2 - g, -R)
+            passo = np.max(np.abs(delta))
+            # Critério relativo à escala de y (vãos íngremes chegam a
+            # ordens de grandeza acima de y0)
+            convergiu = passo <= self.tol * 1e-3 * max(
+                1.0, np.max(np.abs(y_vals)))
+
+            # Busca linear: reduz o passo até a norma RMS do resíduo
+            # diminuir (a direção de Newton é de descida para ela); perto
+            # da solução o passo completo é aceito
+            lam = 1.0
+            while True:
+                y_teste = y_vals.copy()
+                y_teste[1:-1] += lam * delta
+                R, p, raiz = self._residuo_diferencas(y_teste, C)
+                norma_teste = np.sqrt(np.mean(R**2))
+                if convergiu or norma_teste < norma:
+                    break
+                lam /= 2
+                if lam < 1 / 1024:
+                    return y_vals, False
+
+            y_vals, norma = y_teste, norma_teste
+            self.iteracoes_tiro += 1
+            inclinacao = (y_vals[1] - y_vals[0]) / h
+            self.historico_tiro.append((self.iteracoes_tiro, inclinacao,
+                                        norma))
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_iteracao(
+                    self.iteracoes_tiro, inclinacao, norma)
+            self._imprimir(f"{self.iteracoes_tiro}\t{C:.4g}\t"
+                           f"{lam * passo:.2e}\t{norma:.2e}\t{lam:g}")
+            if convergiu:
+                return y_vals, True
+        return y_vals, False
+
+    @_etapa('solucao')
+    def resolver_diferencas_finitas(self, max_iteracoes=100):
+        """
+        Resolve o problema de contorno por diferenças finitas globais
+
+        A EDO é discretizada na malha de ``runge_kutta_4`` com diferenças
+        centrais de 2ª ordem,
+
+            (y[i+1] - 2y[i] + y[i-1])/h² = C√(1 + ((y[i+1] - y[i-1])/2h)²)
+
+        e as duas condições de contorno entram diretamente como y[0] = y0
+        e y[n] = yf. O sistema não linear nos pontos interiores é
+        resolvido por Newton com busca linear. A jacobiana é tridiagonal,
+        então cada iteração custa O(n) (``_resolver_tridiagonal``); para
+        h < 2/C ela é diagonalmente dominante. Sem integração de valor
+        inicial, o problema não fica mal condicionado quando
+        C*(xf - x0) cresce, ao contrário do tiro simples.
+
+        A estimativa inicial é a parábola pelos apoios com a curvatura da
+        corda. Se Newton não progride a partir dela (vãos muito longos ou
+        C grande), usa continuação em C: resolve para C menor, onde a
+        parábola é boa, e aumenta C em passos que encolhem quando Newton
+        falha, partindo sempre da solução anterior.
+
+        O número total de iterações de Newton fica em ``iteracoes_tiro``
+        e o histórico ``(iteração, inclinação inicial, RMS de R)`` em
+        ``historico_tiro``.
+
+        Parâmetros:
+        -----------
+        max_iteracoes : int, default=100
+            Limite de iterações de Newton (somando a continuação)
+
+        Retorna:
+        --------
+        tuple
+            (dydx_otimo, x_vals, y_vals, dydx_vals); dy/dx vem de
+            ``diferenciacao_numerica`` (2ª ordem)
+        """
+        self._imprimir("Resolvendo por diferenças finitas (Newton tridiagonal)...")
+        inicio_tempo = time.time()
+        self.iteracoes_tiro = 0
+        self.integracoes_tiro = 0
+
+        x_vals = np.linspace(self.x0, self.xf, self.n_steps + 1)
+        y_vals = self._estimativa_diferencas(x_vals, self.C)
+        self.historico_tiro = [(0, (y_vals[1] - y_vals[0]) / self.h, None)]
+
+        self._imprimir("Iter\tC\tmax|Δy|\t\tRMS(R)\t\tAmortecimento")
+        self._imprimir("-" * 60)
+
+        y_vals, convergiu = self._newton_diferencas(y_vals, self.C,
+                                                    max_iteracoes)
+        if not convergiu and self.iteracoes_tiro < max_iteracoes:
+            self._imprimir("Newton não progrediu; usando continuação em C")
+            C_atual = min(self.C, 2 / (self.xf - self.x0))
+            y_vals = self._estimativa_diferencas(x_vals, C_atual)
+            y_vals, convergiu = self._newton_diferencas(y_vals, C_atual,
+                                                        max_iteracoes)
+            fator = 2.0
+            while convergiu and C_atual < self.C:
+                C_prox = min(C_atual * fator, self.C)
+                y_prox, convergiu = self._newton_diferencas(
+                    y_vals, C_prox, max_iteracoes)
+                if convergiu:
+                    C_atual, y_vals = C_prox, y_prox
+                    fator = min(fator * 1.5, 4.0)
+                elif (self.iteracoes_tiro < max_iteracoes
+                      and fator > 1.01):
+                    convergiu = True
+                    fator = np.sqrt(fator)
+            convergiu = convergiu and C_atual == self.C
+
+        if not convergiu:
+            warnings.warn(
+                f"Diferenças finitas não convergiram "
+                f"({self.iteracoes_tiro} iterações de Newton)")
+        else:
+            self._imprimir(
+                f"\nConvergência atingida em {self.iteracoes_tiro} iterações")
+
+        dydx_vals, _ = self.diferenciacao_numerica(x_vals, y_vals)
+        dydx_otimo = dydx_vals[0]
+
+        self.tempo_execucao = time.time() - inicio_tempo
+        self._imprimir(f"Inclinação inicial: {dydx_otimo:.8f}")
+        self._imprimir(
+            f"Tempo de execução das diferenças finitas: {self.tempo_execucao:.3f} segundos")
+
+        return dydx_otimo, x_vals, y_vals, dydx_vals
+
+    def _integrar_segmentos(self, estados, passos, C, executor=None,
+                            n_partes=1):
+        """
+        Estados finais e sensibilidades de todos os segmentos para a
+        constante C
+
+        Com ``executor`` os segmentos são divididos em ``n_partes`` lotes
+        integrados em paralelo por ``_rk4_segmentos``.
+        """
+        if executor is None or n_partes < 2:
+            finais = _rk4_segmentos((C, self.h, estados, passos))
+        else:
+            partes = np.array_split(np.arange(len(passos)), n_partes)
+            tarefas = [(C, self.h, estados[:, p], passos[p])
+                       for p in partes if p.size]
+            finais = np.concatenate(
+                list(executor.map(_rk4_segmentos, tarefas)), axis=1)
+        self.integracoes_tiro += 1
+        if self.instrumentacao is not None:
+            total = int(np.sum(passos))
+            self.instrumentacao.registrar_integracao(total, 4 * total)
+        return finais
+
+    def _estimativa_tiro_multiplo(self, x_nos, C):
+        """Estados (y, y') da parábola pelos apoios com a curvatura
+        C√(1 + m²) da corda m nos nós do tiro múltiplo"""
+        m = (self.yf - self.y0) / (self.xf - self.x0)
+        kappa = C * np.sqrt(1 + m**2)
+        y_nos = (self.y0 + m * (x_nos - self.x0)
+                 + kappa / 2 * (x_nos - self.x0) * (x_nos - self.xf))
+        dydx_nos = m + kappa / 2 * (2 * x_nos - self.x0 - self.xf)
+        return y_nos, dydx_nos
+
+    def _newton_tiro_multiplo(self, y_nos, dydx_nos, C, passos, executor,
+                              n_partes, max_iteracoes):
+        """
+        Iterações de Newton amortecido do tiro múltiplo para a constante
+        C, a partir dos estados ``y_nos``, ``dydx_nos`` nos nós
+
+        Retorna:
+        --------
+        tuple
+            (y_nos, dydx_nos, norma, convergiu), com norma = max|resíduo|;
+            as iterações são somadas a ``iteracoes_tiro`` e registradas em
+            ``historico_tiro``. convergiu é False quando a busca linear
+            não reduz o resíduo nem com passos curtos, quando o sistema é
+            singular ou quando o limite de iterações é atingido
+        """
+        K = len(passos)
+
+        def residuo(y_nos, dydx_nos):
+            """Estados finais dos trechos, resíduos das condições e suas
+            normas máxima (convergência) e RMS (busca linear)"""
+            estados = np.array([y_nos, dydx_nos, np.zeros(K), np.ones(K)])
+            finais = self._integrar_segmentos(estados, passos, C, executor,
+                                              n_partes)
+            r_y = np.append(finais[0, :-1] - y_nos[1:], finais[0, -1] - self.yf)
+            r_d = finais[1, :-1] - dydx_nos[1:]
+            r = np.concatenate((r_y, r_d))
+            return finais, r_y, r_d, np.max(np.abs(r)), np.sqrt(np.mean(r**2))
+
+        finais, r_y, r_d, norma, rms = residuo(y_nos, dydx_nos)
+        while norma > self.tol:
+            if self.iteracoes_tiro >= max_iteracoes:
+                return y_nos, dydx_nos, norma, False
+            try:
+                delta_y, delta_d = _passo_newton_segmentos(
+                    finais[2], finais[3], r_y, r_d)
+            except np.linalg.LinAlgError:
+                return y_nos, dydx_nos, norma, False
+
+            # Busca linear na norma RMS do resíduo (a direção de Newton é
+            # de descida para ela)
+            lam = 1.0
+            while True:
+                y_teste = y_nos + lam * delta_y
+                d_teste = dydx_nos + lam * delta_d
+                finais_t, r_y_t, r_d_t, norma_t, rms_t = residuo(
+                    y_teste, d_teste)
+                if rms_t < rms:
+                    break
+                lam /= 2
+                if lam < 1 / 1024:
+                    return y_nos, dydx_nos, norma, False
+
+            y_nos, dydx_nos = y_teste, d_teste
+            finais, r_y, r_d = finais_t, r_y_t, r_d_t
+            norma, rms = norma_t, rms_t
+            self.iteracoes_tiro += 1
+            self.historico_tiro.append(
+                (self.iteracoes_tiro, dydx_nos[0], norma))
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_iteracao(
+                    self.iteracoes_tiro, dydx_nos[0], norma)
+            self._imprimir(f"{self.iteracoes_tiro}\t{C:.4g}\t"
+                           f"{dydx_nos[0]:.8f}\t{norma:.2e}\t{lam:g}")
+        return y_nos, dydx_nos, norma, True
+
+    @_etapa('solucao')
+    def resolver_tiro_multiplo(self, paralelo=None, max_workers=None,
+                               max_iteracoes=100):
+        """
+        Resolve o problema de contorno por tiro múltiplo
+
+        [x0, xf] é dividido em ``segmentos`` trechos com fronteiras em
+        nós da malha, ou mais se preciso para que C*ℓ <= ``CL_MAX_TRECHO``
+        em cada trecho de comprimento ℓ. As incógnitas são o estado (y, y') no início de
+        cada trecho (com y = y0 fixo no primeiro); as condições são a
+        continuidade entre trechos e y(xf) = yf. Como cada trecho é curto,
+        o crescimento tipo cosh da sensibilidade fica limitado a e^(Cℓ)
+        em um trecho e Newton converge de forma confiável em vãos longos
+        e íngremes, onde o tiro simples é mal condicionado; com trechos
+        longos demais (poucos segmentos em vãos com C*(xf - x0) grande)
+        o problema volta a ser o do tiro simples.
+
+        A cada iteração todos os trechos são integrados juntos (em lote,
+        opcionalmente em paralelo) com a sensibilidade ∂(y, y')/∂y'_k pelas
+        equações variacionais; ∂/∂y_k é (1, 0), pois a EDO não depende de
+        y. O passo de Newton vem do sistema bidiagonal por blocos 2x2
+        (G_k Δs_k - Δs_{k+1} = -r_k, mais a linha de y(xf)), que é
+        tridiagonal e é resolvido em O(segmentos) por eliminação com
+        pivotamento parcial (``_passo_newton_segmentos``). A condensação
+        em uma única equação em Δy'(x0) também seria O(segmentos), mas
+        multiplicaria os G_k e traria de volta o mau condicionamento do
+        tiro simples.
+
+        A estimativa inicial é a parábola pelos apoios com a curvatura da
+        corda. O passo de Newton é reduzido à metade enquanto a norma RMS
+        do resíduo não diminui; a convergência é max|resíduo| <= tol. A
+        parábola só é boa para C*(xf - x0) pequeno: em vãos longos a
+        solução cresce como cosh e o passo de Newton a partir dela
+        ultrapassa a solução em ordens de grandeza. Como em
+        ``resolver_diferencas_finitas``, se Newton não progride a partir
+        da parábola, usa continuação em C (começando em C*(xf - x0) = 2
+        e aumentando C em passos que encolhem quando Newton falha).
+
+        Parâmetros:
+        -----------
+        paralelo : str, opcional
+            'threads' ou 'processos' para integrar os lotes de trechos
+            em trabalhadores; None usa ``self.paralelo``. O pool é criado
+            uma vez e reutilizado entre resoluções, e só é usado quando
+            cada trabalhador recebe pelo menos ``_SEGMENTOS_POR_LOTE``
+            trechos: o custo de um passo RK4 em lote é dominado pelo
+            overhead fixo das operações numpy, então lotes menores não
+            ganham nada ao serem divididos
+        max_workers : int, opcional
+            Número de trabalhadores (padrão: ``os.cpu_count()``)
+        max_iteracoes : int, default=100
+            Limite de iterações de Newton (somando a continuação)
+
+        Retorna:
+        --------
+        tuple
+            (dydx_otimo, x_vals, y_vals, dydx_vals); a trajetória é
+            montada trecho a trecho a partir dos estados convergidos
+        """
+        if paralelo is None:
+            paralelo = self.paralelo
+        if paralelo not in (None, 'threads', 'processos'):
+            raise ValueError("paralelo deve ser None, 'threads' ou 'processos'")
+        K = min(max(self.segmentos, math.ceil(
+            self.C * (self.xf - self.x0) / self.CL_MAX_TRECHO)), self.n_steps)
+        self._imprimir(f"Iniciando tiro múltiplo com {K} segmentos...")
+        inicio_tempo = time.time()
+        self.iteracoes_tiro = 0
+        self.integracoes_tiro = 0
+
+        # Fronteiras dos trechos em índices da malha
+        fronteiras = np.round(np.linspace(0, self.n_steps, K + 1)).astype(int)
+        passos = np.diff(fronteiras)
+        x_vals = np.linspace(self.x0, self.xf, self.n_steps + 1)
+        x_nos = x_vals[fronteiras[:-1]]
+
+        n_partes = 1
+        if paralelo is not None:
+            n_partes = min(max_workers or os.cpu_count() or 1,
+                           K // _SEGMENTOS_POR_LOTE)
+        executor = (_executor_persistente(paralelo, n_partes)
+                    if n_partes >= 2 else None)
+
+        y_nos, dydx_nos = self._estimativa_tiro_multiplo(x_nos, self.C)
+        self.historico_tiro = [(0, dydx_nos[0], None)]
+
+        self._imprimir("Iter\tC\tz_n\t\tmax|resíduo|\tAmortecimento")
+        self._imprimir("-" * 60)
+
+        y_nos, dydx_nos, norma, convergiu = self._newton_tiro_multiplo(
+            y_nos, dydx_nos, self.C, passos, executor, n_partes,
+            max_iteracoes)
+        if not convergiu and self.iteracoes_tiro < max_iteracoes:
+            self._imprimir("Newton não progrediu; usando continuação em C")
+            C_atual = min(self.C, 2 / (self.xf - self.x0))
+            y_nos, dydx_nos = self._estimativa_tiro_multiplo(x_nos, C_atual)
+            y_nos, dydx_nos, norma, convergiu = self._newton_tiro_multiplo(
+                y_nos, dydx_nos, C_atual, passos, executor, n_partes,
+                max_iteracoes)
+            fator = 2.0
+            while convergiu and C_atual < self.C:
+                C_prox = min(C_atual * fator, self.C)
+                y_prox, d_prox, norma, convergiu = self._newton_tiro_multiplo(
+                    y_nos, dydx_nos, C_prox, passos, executor, n_partes,
+                    max_iteracoes)
+                if convergiu:
+                    C_atual, y_nos, dydx_nos = C_prox, y_prox, d_prox
+                    fator = min(fator * 1.5, 4.0)
+                elif (self.iteracoes_tiro < max_iteracoes
+                      and fator > 1.01):
+                    convergiu = True
+                    fator = np.sqrt(fator)
+            convergiu = convergiu and C_atual == self.C
+
+        if not convergiu:
+            warnings.warn(
+                f"Tiro múltiplo não convergiu em {self.iteracoes_tiro} "
+                f"iterações (resíduo {norma:.2e})")
+        else:
+            self._imprimir(
+                f"\nConvergência atingida em {self.iteracoes_tiro} iterações "
+                f"({self.integracoes_tiro} integrações dos {K} segmentos)")
+
+        # Trajetória final, trecho a trecho a partir dos estados dos nós
+        y_vals = np.empty(self.n_steps + 1)
+        dydx_vals = np.empty(self.n_steps + 1)
+        for k in range(K):
+            i = fronteiras[k]
+            self._rk4_trecho(y_nos[k], dydx_nos[k], passos[k],
+                             y_vals[i:], dydx_vals[i:])
+
+        dydx_otimo = dydx_nos[0]
+        self.tempo_execucao = time.time() - inicio_tempo
+        self._imprimir(f"Inclinação inicial convergida: {dydx_otimo:.8f}")
+        self._imprimir(
+            f"Tempo de execução do tiro múltiplo: {self.tempo_execucao:.3f} segundos")
+
+        erro_final = abs(y_vals[-1] - self.yf)
+        self._imprimir(f"Erro final na condição de contorno: {erro_final:.2e}")
+        return dydx_otimo, x_vals, y_vals, dydx_vals
+
+    def _parametros_catenaria(self):
+        """
+        Parâmetros (a, b, d) da catenária y = a*cosh((x-b)/a) + d que
+        passa pelos dois apoios (ver ``resolver_analitico``)
+        """
+        a = 1.0 / self.C
+        L = self.xf - self.x0
+        xm = (self.x0 + self.xf) / 2
+
+        b = xm - a * np.arcsinh((self.yf - self.y0) /
+                                (2 * a * np.sinh(L / (2 * a))))
+        d = self.y0 - a * np.cosh((self.x0 - b) / a)
+        return a, b, d
+
+    def resolver_resultado(self):
+        """
+        Resolve o problema sem imprimir nada e devolve um ``ResultadoCabo``
+
+        Usa o método de ``resolver``. As grandezas derivadas do resultado
+        só são calculadas quando acessadas.
+
+        Retorna:
+        --------
+        ResultadoCabo
+        """
+        with self._silencioso():
+            dydx_otimo, x_vals, y_vals, dydx_vals = self.resolver()
+        return ResultadoCabo(self, dydx_otimo, x_vals, y_vals, dydx_vals)
 
-        # Condições iniciais
-        y_vals[0] = y_inicial
-        dydx_vals[0] = dydx_inicial
+    @_etapa('solucao')
+    def resolver_analitico(self):
+        """
+        Resolve o problema de contorno pela forma fechada da catenária
 
-        # Estado inicial
-        estado = np.array([y_inicial, dydx_inicial], dtype=np.float64)
+        A solução é y = a*cosh((x-b)/a) + d com a = 1/C. Subtraindo as duas
+        condições de contorno:
 
-        # Integração RK4
-        for i in range(self.n_steps):
-            x = x_vals[i]
+            yf - y0 = 2a * sinh((xm - b)/a) * sinh(L/(2a))
 
-            # Coeficientes RK4
-            k1 = self.h * self.sistema_edo(x, estado)
-            k2 = self.h * self.sistema_edo(x + self.h/2, estado + k1/2)
-            k3 = self.h * self.sistema_edo(x + self.h/2, estado + k2/2)
-            k4 = self.h * self.sistema_edo(x + self.h, estado + k3)
+        com xm = (x0 + xf)/2 e L = xf - x0, o que dá b diretamente por
+        arcsinh; d vem de y(x0) = y0. Não há iterações: o custo é o de
+        avaliar cosh/sinh na malha de saída.
 
-            # Atualização do estado
-            estado = estado + (k1 + 2*k2 + 2*k3 + k4) / 6
+        Retorna:
+        --------
+        tuple
+            (dydx_otimo, x_vals, y_vals, dydx_vals), na mesma malha de
+            ``runge_kutta_4``
+        """
+        self._imprimir("Resolvendo pela forma fechada da catenária...")
+        inicio_tempo = time.time()
 
-            # Armazenamento dos valores
-            y_vals[i+1] = estado[0]
-            dydx_vals[i+1] = estado[1]
+        a, b, d = self._parametros_catenaria()
 
-        return x_vals, y_vals, dydx_vals
+        x_vals = np.linspace(self.x0, self.xf, self.n_steps + 1)
+        y_vals = a * np.cosh((x_vals - b) / a) + d
+        dydx_vals = np.sinh((x_vals - b) / a)
+        dydx_otimo = dydx_vals[0]
 
-    def funcao_erro(self, dydx_inicial):
-        """
-        Função de erro para o método do tiro
-        Retorna a diferença entre y(xf) calculado e o valor alvo
-        """
-        _, y_vals, _ = self.runge_kutta_4(self.y0, dydx_inicial)
-        return y_vals[-1] - self.yf
+        self.iteracoes_tiro = 0
+        self.integracoes_tiro = 0
+        self.tempo_execucao = time.time() - inicio_tempo
 
-    def resolver_metodo_tiro(self):
+        self._imprimir(
+            f"Parâmetros da catenária: a = {a:.3f} m, b = {b:.6f} m, d = {d:.6f} m")
+        self._imprimir(f"Inclinação inicial: {dydx_otimo:.8f}")
+        self._imprimir(
+            f"Erro final na condição de contorno: {abs(y_vals[-1] - self.yf):.2e}")
+
+        return dydx_otimo, x_vals, y_vals, dydx_vals
+
+    def _raiz_secante(self, max_iteracoes, z0=-1.0, z1=-0.5):
         """
-        Resolve o problema usando o método do tiro com método da secante
+        Busca da inclinação inicial pelo método da secante
+
+        Parâmetros:
+        -----------
+        max_iteracoes : int
+            Limite de iterações
+        z0, z1 : float, default=(-1.0, -0.5)
+            Duas estimativas iniciais para a inclinação
 
         Retorna:
         --------
         tuple
-            (dydx_otimo, x_vals, y_vals, dydx_vals)
+            (z, F(z)) da última iteração
         """
-        print("Iniciando método do tiro com método da secante...")
-        inicio_tempo = time.time()
-
-        # Implementação do método da secante conforme especificado no documento
-        # Duas estimativas iniciais para a inclinação
-        z0 = -1.0  # Primeira estimativa
-        z1 = -0.5  # Segunda estimativa
 
         # Calcula F(z0) e F(z1)
         F_z0 = self.funcao_erro(z0)
         F_z1 = self.funcao_erro(z1)
 
-        print(f"Estimativa inicial z0 = {z0:.6f}, F(z0) = {F_z0:.6f}")
-        print(f"Estimativa inicial z1 = {z1:.6f}, F(z1) = {F_z1:.6f}")
+        self._imprimir(f"Estimativa inicial z0 = {z0:.6f}, F(z0) = {F_z0:.6f}")
+        self._imprimir(f"Estimativa inicial z1 = {z1:.6f}, F(z1) = {F_z1:.6f}")
 
         # Inicialização das variáveis do método da secante
         z_anterior = z0
         z_atual = z1
         F_anterior = F_z0
         F_atual = F_z1
+        self.historico_tiro = [(0, z1, F_z1)]
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_iteracao(0, z1, F_z1)
 
-        self.iteracoes_tiro = 0
-        max_iteracoes = 100
-
-        print("\nIterações do método da secante:")
-        print("Iter\tz_n\t\tF(z_n)\t\tErro absoluto")
-        print("-" * 55)
+        self._imprimir("\nIterações do método da secante:")
+        self._imprimir("Iter\tz_n\t\tF(z_n)\t\tErro absoluto")
+        self._imprimir("-" * 55)
 
         # Laço do método da secante
         while abs(F_atual) > self.tol and self.iteracoes_tiro < max_iteracoes:
             # Fórmula do método da secante: z_{n+1} = z_n - F(z_n) * (z_n - z_{n-1}) / (F(z_n) - F(z_{n-1}))
             if abs(F_atual - F_anterior) < 1e-14:
-                print("Aviso: Denominador muito pequeno no método da secante")
+                self._imprimir("Aviso: Denominador muito pequeno no método da secante")
                 break
 
             z_novo = z_atual - F_atual * \
@@ -175,8 +2388,12 @@ class CaboProblem:
             F_novo = self.funcao_erro(z_novo)
 
             self.iteracoes_tiro += 1
+            self.historico_tiro.append((self.iteracoes_tiro, z_novo, F_novo))
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_iteracao(
+                    self.iteracoes_tiro, z_novo, F_novo)
 
-            print(
+            self._imprimir(
                 f"{self.iteracoes_tiro}\t{z_novo:.8f}\t{F_novo:.8f}\t{abs(F_novo):.2e}")
 
             # Atualização das variáveis para a próxima iteração
@@ -185,28 +2402,335 @@ class CaboProblem:
             F_anterior = F_atual
             F_atual = F_novo
 
-        dydx_otimo = z_atual
+        return z_atual, F_atual
+
+    def _raiz_newton(self, max_iteracoes, z0=None):
+        """
+        Busca da inclinação inicial pelo método de Newton
+
+        A derivada F'(z) vem das equações variacionais integradas junto
+        com o estado (``funcao_erro_com_derivada``), então cada iteração
+        custa uma única integração e a convergência é quadrática.
+
+        Parâmetros:
+        -----------
+        max_iteracoes : int
+            Limite de iterações
+        z0 : float, opcional
+            Estimativa inicial (padrão: inclinação da corda entre os apoios)
+
+        Retorna:
+        --------
+        tuple
+            (z, F(z)) da última iteração
+        """
+        if z0 is None:
+            z0 = (self.yf - self.y0) / (self.xf - self.x0)
+        z_atual = z0
+        F_atual, dF_atual = self.funcao_erro_com_derivada(z_atual)
+        self.historico_tiro = [(0, z_atual, F_atual)]
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_iteracao(0, z_atual, F_atual)
+
+        self._imprimir(f"Estimativa inicial z0 = {z_atual:.6f}, F(z0) = {F_atual:.6f}")
+
+        self._imprimir("\nIterações do método de Newton:")
+        self._imprimir("Iter\tz_n\t\tF(z_n)\t\tErro absoluto")
+        self._imprimir("-" * 55)
+
+        while abs(F_atual) > self.tol and self.iteracoes_tiro < max_iteracoes:
+            if abs(dF_atual) < 1e-14:
+                self._imprimir("Aviso: Derivada muito pequena no método de Newton")
+                break
+
+            z_atual = z_atual - F_atual / dF_atual
+            F_atual, dF_atual = self.funcao_erro_com_derivada(z_atual)
+
+            self.iteracoes_tiro += 1
+            self.historico_tiro.append((self.iteracoes_tiro, z_atual, F_atual))
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_iteracao(
+                    self.iteracoes_tiro, z_atual, F_atual)
+
+            self._imprimir(
+                f"{self.iteracoes_tiro}\t{z_atual:.8f}\t{F_atual:.8f}\t{abs(F_atual):.2e}")
+
+        return z_atual, F_atual
+
+    def _expandir_intervalo(self, z0, max_expansoes):
+        """
+        Intervalo [a, b] de inclinações com F(a) e F(b) de sinais opostos
+
+        F(z) = y(xf; z) - yf é crescente em z (∂y(xf)/∂z > 0), então basta
+        andar no sentido de -F(z0). O primeiro passo, -F(z0)/L, é exato
+        para C → 0; os seguintes dobram de tamanho, o que limita as
+        expansões a O(log|z* - z0|).
+
+        Um F(z) não finito (estouro de y em vãos com C*(xf - x0) grande)
+        é tratado como passo longo demais: o passo é reduzido à metade a
+        partir do último ponto finito, e essas reduções contam como
+        expansões.
+
+        Retorna:
+        --------
+        tuple
+            (a, F(a), b, F(b), expansões); se |F(a)| já atende ``tol``, b
+            é None. F(a) e F(b) são sempre finitos: se F(z0) não for
+            finito ou não houver intervalo finito com troca de sinal em
+            ``max_expansoes`` expansões, lança ValueError
+        """
+        F0 = self.funcao_erro(z0)
+        if not np.isfinite(F0):
+            raise ValueError(
+                f"y(xf) não é finito para a estimativa inicial z0 = {z0:.6g} "
+                f"(C*(xf - x0) = {self.C * (self.xf - self.x0):.6g})")
+        if abs(F0) <= self.tol:
+            return z0, F0, None, None, 0
+        passo = -F0 / (self.xf - self.x0)
+        if passo == 0:
+            passo = -np.copysign(1.0, F0)
+        z1 = z0 + passo
+        F1 = self.funcao_erro(z1)
+        expansoes = 0
+        while not np.isfinite(F1) or (np.sign(F1) == np.sign(F0)
+                                      and abs(F1) > self.tol):
+            if expansoes >= max_expansoes or z1 == z0:
+                raise ValueError(
+                    f"Não foi possível isolar a raiz em {max_expansoes} "
+                    f"expansões do intervalo (último z = {z1:.6g}, "
+                    f"F = {F1:.6g})")
+            if np.isfinite(F1):
+                # O extremo mais próximo da raiz passa a ser o ponto de
+                # partida
+                z0, F0 = z1, F1
+                passo *= 2
+            else:
+                passo /= 2
+            z1 = z0 + passo
+            F1 = self.funcao_erro(z1)
+            expansoes += 1
+        return z0, F0, z1, F1, expansoes
+
+    def _raiz_brent(self, max_iteracoes, z0=None, max_expansoes=60):
+        """
+        Busca da inclinação inicial pelo método de Brent com expansão
+        automática do intervalo
+
+        Depois de isolar a raiz (``_expandir_intervalo``), combina
+        interpolação quadrática inversa, secante e bisseção mantendo o
+        intervalo com troca de sinal, o que garante a convergência
+        mesmo em vãos íngremes ou invertidos. O número de integrações é
+        limitado por 2 + ``max_expansoes`` + ``max_iteracoes``.
+
+        Parâmetros:
+        -----------
+        max_iteracoes : int
+            Limite de iterações de Brent
+        z0 : float, opcional
+            Estimativa inicial (padrão: inclinação da corda entre os apoios)
+        max_expansoes : int, default=60
+            Limite de duplicações do passo na busca do intervalo
+
+        Retorna:
+        --------
+        tuple
+            (z, F(z)) da última iteração
+        """
+        if z0 is None:
+            z0 = (self.yf - self.y0) / (self.xf - self.x0)
+        a, F_a, b, F_b, expansoes = self._expandir_intervalo(z0,
+                                                             max_expansoes)
+        if b is None:
+            # A estimativa inicial já atende a tolerância
+            self.historico_tiro = [(0, a, F_a)]
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_iteracao(0, a, F_a)
+            self._imprimir(f"Estimativa inicial z0 = {a:.6f}, F(z0) = {F_a:.6f}")
+            return a, F_a
+        self.historico_tiro = [(0, b, F_b)]
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_iteracao(0, b, F_b)
+
+        self._imprimir(f"Intervalo [{min(a, b):.6f}, {max(a, b):.6f}] isolado "
+                       f"após {expansoes} expansões "
+                       f"({self.integracoes_tiro} integrações)")
+
+        self._imprimir("\nIterações do método de Brent:")
+        self._imprimir("Iter\tz_n\t\tF(z_n)\t\tErro absoluto")
+        self._imprimir("-" * 55)
+
+        # c é o extremo oposto a b (F(b)·F(c) < 0); d e e são o último e
+        # o penúltimo passo
+        c, F_c = a, F_a
+        d = e = b - a
+        while abs(F_b) > self.tol and self.iteracoes_tiro < max_iteracoes:
+            if np.sign(F_b) == np.sign(F_c):
+                c, F_c = a, F_a
+                d = e = b - a
+            if abs(F_c) < abs(F_b):
+                a, b, c = b, c, b
+                F_a, F_b, F_c = F_b, F_c, F_b
+
+            tol_z = 2 * np.finfo(float).eps * abs(b) + 1e-15
+            meio = (c - b) / 2
+            if abs(meio) <= tol_z:
+                self._imprimir("Aviso: Intervalo reduzido ao limite da "
+                               "precisão de ponto flutuante")
+                break
+
+            if abs(e) >= tol_z and abs(F_a) > abs(F_b):
+                s = F_b / F_a
+                if a == c:
+                    # Secante
+                    p = 2 * meio * s
+                    q = 1 - s
+                else:
+                    # Interpolação quadrática inversa
+                    q = F_a / F_c
+                    r = F_b / F_c
+                    p = s * (2 * meio * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2 * p < min(3 * meio * q - abs(tol_z * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = meio
+            else:
+                d = e = meio
+
+            a, F_a = b, F_b
+            b += d if abs(d) > tol_z else np.copysign(tol_z, meio)
+            F_b = self.funcao_erro(b)
+            if not np.isfinite(F_b):
+                raise ValueError(
+                    f"y(xf) não é finito para z = {b:.6g} dentro do "
+                    f"intervalo isolado")
+
+            self.iteracoes_tiro += 1
+            self.historico_tiro.append((self.iteracoes_tiro, b, F_b))
+            if self.instrumentacao is not None:
+                self.instrumentacao.registrar_iteracao(
+                    self.iteracoes_tiro, b, F_b)
+
+            self._imprimir(
+                f"{self.iteracoes_tiro}\t{b:.8f}\t{F_b:.8f}\t{abs(F_b):.2e}")
+
+        return b, F_b
+
+    def _chave_cache(self):
+        """
+        Chave exata e coordenadas normalizadas do problema para o cache
+
+        Retorna:
+        --------
+        tuple
+            (chave, (C*L, Δy/L)) com L = xf - x0 e Δy = yf - y0
+        """
+        L = self.xf - self.x0
+        dy = self.yf - self.y0
+        chave = (self.C, L, dy, self.h, self.tol, self.integrador,
+                 self.rtol, self.atol)
+        return chave, (self.C * L, dy / L)
+
+    def _trajetoria(self, dydx_inicial):
+        """
+        Trajetória completa na malha uniforme com o integrador escolhido
+
+        Com 'dopri5' usa a saída densa nos nós do RK4, para que as
+        verificações e propriedades (que usam h) continuem válidas.
+        """
+        if self.integrador == 'dopri5':
+            return self.runge_kutta_adaptativo(
+                self.y0, dydx_inicial,
+                np.linspace(self.x0, self.xf, self.n_steps + 1))
+        return self.runge_kutta_4(self.y0, dydx_inicial)
+
+    @_etapa('solucao')
+    def resolver_metodo_tiro(self):
+        """
+        Resolve o problema usando o método do tiro com método da secante
+        (ou de Newton, se ``raiz='newton'``, ou de Brent, se
+        ``raiz='brent'``)
+
+        O número de iterações fica em ``iteracoes_tiro``, o de integrações
+        da busca de raiz em ``integracoes_tiro`` e o histórico
+        ``(iteração, z, F(z))`` em ``historico_tiro``.
+
+        Retorna:
+        --------
+        tuple
+            (dydx_otimo, x_vals, y_vals, dydx_vals)
+        """
+        nome_raiz = {'secante': 'da secante', 'newton': 'de Newton',
+                     'brent': 'de Brent'}[self.raiz]
+        self._imprimir(f"Iniciando método do tiro com método {nome_raiz}...")
+        inicio_tempo = time.time()
+
+        self.iteracoes_tiro = 0
+        self.integracoes_tiro = 0
+        self.passos_aceitos = 0
+        self.passos_rejeitados = 0
+        max_iteracoes = 100
+
+        # Estimativas iniciais: padrão, ou a partir do cache
+        chutes = ()
+        dydx_cache = None
+        if self.cache is not None:
+            chave, coordenadas = self._chave_cache()
+            dydx_cache = self.cache.obter(chave)
+            if dydx_cache is None:
+                vizinhos = self.cache.vizinhos(coordenadas)
+                if len(vizinhos) == 1 or (len(vizinhos) == 2 and
+                                          vizinhos[0] == vizinhos[1]):
+                    vizinhos = [vizinhos[0],
+                                vizinhos[0] + 1e-3 * (1 + abs(vizinhos[0]))]
+                chutes = tuple(vizinhos if self.raiz == 'secante'
+                               else vizinhos[:1])
+
+        if dydx_cache is not None:
+            dydx_otimo, F_atual = dydx_cache, None
+            self.historico_tiro = []
+            self._imprimir("Inclinação inicial obtida do cache")
+        elif self.raiz == 'newton':
+            dydx_otimo, F_atual = self._raiz_newton(max_iteracoes, *chutes)
+        elif self.raiz == 'brent':
+            dydx_otimo, F_atual = self._raiz_brent(max_iteracoes, *chutes)
+        else:
+            dydx_otimo, F_atual = self._raiz_secante(max_iteracoes, *chutes)
+
+        if (self.cache is not None and F_atual is not None
+                and abs(F_atual) <= self.tol):
+            self.cache.armazenar(chave, coordenadas, dydx_otimo)
 
         # Verificação da convergência
-        if self.iteracoes_tiro >= max_iteracoes:
-            print(
+        if F_atual is None:
+            pass
+        elif self.iteracoes_tiro >= max_iteracoes:
+            self._imprimir(
                 f"\nAviso: Número máximo de iterações ({max_iteracoes}) atingido")
-            print(f"Erro final: {abs(F_atual):.2e}")
+            self._imprimir(f"Erro final: {abs(F_atual):.2e}")
         else:
-            print(
-                f"\nConvergência atingida em {self.iteracoes_tiro} iterações")
+            self._imprimir(
+                f"\nConvergência atingida em {self.iteracoes_tiro} iterações "
+                f"({self.integracoes_tiro} integrações)")
 
         self.tempo_execucao = time.time() - inicio_tempo
-        print(f"Inclinação inicial convergida: {dydx_otimo:.8f}")
-        print(
+        self._imprimir(f"Inclinação inicial convergida: {dydx_otimo:.8f}")
+        self._imprimir(
             f"Tempo de execução do método do tiro: {self.tempo_execucao:.3f} segundos")
 
-        # Solução final
-        x_vals, y_vals, dydx_vals = self.runge_kutta_4(self.y0, dydx_otimo)
+        # Solução final: a trajetória completa é construída uma única vez,
+        # após a convergência
+        x_vals, y_vals, dydx_vals = self._trajetoria(dydx_otimo)
+        if self.integrador == 'dopri5':
+            self._imprimir(f"Passos adaptativos: {self.passos_aceitos} aceitos, "
+                           f"{self.passos_rejeitados} rejeitados")
 
         # Verificação da precisão
         erro_final = abs(y_vals[-1] - self.yf)
-        print(f"Erro final na condição de contorno: {erro_final:.2e}")
+        self._imprimir(f"Erro final na condição de contorno: {erro_final:.2e}")
 
         if erro_final > self.tol * 10:
             warnings.warn(
@@ -214,134 +2738,627 @@ class CaboProblem:
 
         return dydx_otimo, x_vals, y_vals, dydx_vals
 
-    def diferenciacao_numerica(self, x_vals, y_vals):
+    def _tiro_aquecido(self, dydx_inicial, max_iteracoes=8):
+        """
+        Inclinação inicial e trajetória para o C atual, por Newton a
+        partir de uma boa estimativa
+
+        Cada iteração é uma única integração até o ponto final, sem
+        armazenar a trajetória; com RK4 ela usa o núcleo escalar
+        (``_ponto_final_escalar``), bit a bit igual ao backend 'numpy' e
+        bem mais rápido que ele para uma só trajetória. A trajetória
+        completa, com o integrador e o backend escolhidos, é montada uma
+        vez, para a inclinação convergida. A derivada ∂y(xf)/∂z vem da
+        catenária exata y' = sinh(w + C(x - x0)), w = asinh(z):
+        (sinh(w + CL) - sinh(w)) / (C√(1+z²)); ela difere da derivada
+        discreta apenas pelo erro de truncamento, então a convergência
+        continua praticamente quadrática sem a integração das equações
+        variacionais. Se Newton não convergir, recorre ao método de
+        Brent a partir da mesma estimativa. Todas as integrações somam-se
+        a ``integracoes_tiro``.
+
+        Retorna:
+        --------
+        tuple
+            (dydx_inicial, x_vals, y_vals, dydx_vals)
+        """
+        CL = self.C * (self.xf - self.x0)
+        z = dydx_inicial
+        for _ in range(max_iteracoes):
+            if self.integrador == 'dopri5':
+                F = self.funcao_erro(z)
+            else:
+                self.integracoes_tiro += 1
+                F = self._ponto_final_escalar(self.y0, z)[0] - self.yf
+            if abs(F) <= self.tol:
+                break
+            w = np.arcsinh(z)
+            dF = (np.sinh(w + CL) - np.sinh(w)) / (self.C * np.sqrt(1 + z * z))
+            if not (np.isfinite(F) and np.isfinite(dF) and dF > 0):
+                break
+            z -= F / dF
+        else:
+            F = np.inf
+
+        if not abs(F) <= self.tol:
+            self.iteracoes_tiro = 0
+            with self._silencioso():
+                z, F = self._raiz_brent(100, dydx_inicial)
+            if not abs(F) <= self.tol:
+                raise ValueError(
+                    f"Método do tiro não convergiu para C = {self.C:.6g}")
+        x_vals, y_vals, dydx_vals = self._trajetoria(z)
+        self.integracoes_tiro += 1
+        return z, x_vals, y_vals, dydx_vals
+
+    @_etapa('solucao')
+    def resolver_inverso(self, alvo, valor, C_inicial=None, max_iteracoes=50):
+        """
+        Determina C a partir do comprimento do cabo ou da flecha
+
+        Resolve juntos C e a forma do cabo para que a grandeza ``alvo``,
+        como definida em ``calcular_propriedades_cabo``, valha ``valor``.
+        A busca externa em C é uma secante salvaguardada em ln C sobre
+        ln(P - P_min), onde P_min é o limite de P quando C → 0 (a corda
+        para o comprimento, max(0, y0 - yf) para a flecha). Como o excesso
+        P - P_min cresce aproximadamente como C² (comprimento) ou C
+        (flecha), essa função é quase linear e o primeiro passo já usa
+        esse expoente; uma vez isolado o valor, passos para fora do
+        intervalo viram bisseções.
+
+        Cada valor de C só exige um tiro aquecido (``_tiro_aquecido``):
+        asinh(z)/C (x0 - b na catenária) é extrapolado linearmente em
+        ln C a partir das duas últimas soluções, e em geral bastam uma ou
+        duas integrações até o ponto final e uma da trajetória por
+        iteração externa.
+
+        Se o tiro falha já na primeira estimativa de C, C é dividido por
+        e² até o tiro convergir. Ao final ``C`` guarda o valor encontrado
+        (ou, sem convergência, o da última solução; se a busca lança
+        uma exceção, o C original), ``iteracoes_tiro`` o
+        número de iterações em C, ``integracoes_tiro`` o total de
+        integrações (incluindo as trajetórias) e ``historico_inverso`` as
+        tuplas ``(iteração, C, dydx_inicial, P - valor)``.
+
+        Parâmetros:
+        -----------
+        alvo : str
+            'comprimento_arco' ou 'flecha'
+        valor : float
+            Valor desejado de ``alvo`` (m); deve exceder P_min
+        C_inicial : float, opcional
+            Estimativa inicial de C (padrão: o C atual)
+        max_iteracoes : int, default=50
+            Limite de iterações em C
+
+        Retorna:
+        --------
+        tuple
+            (C, dydx_otimo, x_vals, y_vals, dydx_vals)
+        """
+        if alvo not in self.ALVOS_INVERSO:
+            raise ValueError(
+                f"Alvo '{alvo}' desconhecido; use um de {self.ALVOS_INVERSO}")
+        if C_inicial is not None and C_inicial <= 0:
+            raise ValueError("C_inicial deve ser positivo")
+        L = self.xf - self.x0
+        if alvo == 'comprimento_arco':
+            P_min, expoente = np.hypot(L, self.yf - self.y0), 2
+        else:
+            P_min, expoente = max(0.0, self.y0 - self.yf), 1
+        if valor <= P_min + self.tol:
+            raise ValueError(
+                f"{alvo} = {valor:.6g} m não é atingível; deve exceder "
+                f"{P_min:.6g} m")
+
+        self._imprimir(f"Iniciando solução inversa para {alvo} = {valor:.6f} m...")
+        inicio_tempo = time.time()
+        self.integracoes_tiro = 0
+        self.historico_inverso = []
+        log_excesso_alvo = np.log(valor - P_min)
+
+        u = np.log(self.C if C_inicial is None else C_inicial)
+        u_baixo = u_alto = None
+        solucoes = []     # (ln C, asinh(dydx_inicial)/C) já resolvidos
+        pontos = []       # (ln C, ln(P - P_min) - ln(valor - P_min))
+        expansao = np.log(2.0)
+        convergiu = False
+
+        self._imprimir("Iter\tC\t\tdydx(x0)\tErro")
+        self._imprimir("-" * 55)
+
+        C_original = self.C
+        concluido = False
+        try:
+            for iteracao in range(1, max_iteracoes + 1):
+                self.C = float(np.exp(u))
+                # Estimativa de z: q = asinh(z)/C é x0 - b na catenária e varia
+                # pouco com C, enquanto z cresce como sinh(CL/2)
+                if len(solucoes) >= 2:
+                    (u1, q1), (u2, q2) = solucoes[-2:]
+                    q = q2 + (q2 - q1) * (u - u2) / (u2 - u1)
+                elif solucoes:
+                    q = solucoes[-1][1]
+                else:
+                    _, b, _ = self._parametros_catenaria()
+                    q = self.x0 - b
+                try:
+                    z, x_vals, y_vals, dydx_vals = self._tiro_aquecido(
+                        np.sinh(self.C * q))
+                except ValueError:
+                    # Só C grande demais (cosh(CL) enorme) faz o tiro falhar:
+                    # recua até o meio do caminho desde a última solução ou,
+                    # antes da primeira, divide C por e²
+                    self._imprimir(f"{iteracao}\t{self.C:.8f}\t(tiro falhou)")
+                    u_alto = u
+                    u = (u + solucoes[-1][0]) / 2 if solucoes else u - 2.0
+                    continue
+                solucoes.append((u, np.arcsinh(z) / self.C))
+
+                P = self.calcular_propriedades_cabo(
+                    x_vals, y_vals, dydx_vals)[alvo]
+                erro = P - valor
+                self.historico_inverso.append((iteracao, self.C, z, erro))
+                self._imprimir(f"{iteracao}\t{self.C:.8f}\t{z:.8f}\t{erro:.2e}")
+                if abs(erro) <= self.tol:
+                    convergiu = True
+                    break
+
+                # P cresce com C: o sinal do erro atualiza o intervalo
+                if erro < 0:
+                    u_baixo = u
+                else:
+                    u_alto = u
+
+                if P > P_min:
+                    pontos.append((u, np.log(P - P_min) - log_excesso_alvo))
+                if pontos and pontos[-1][0] == u:
+                    phi = pontos[-1][1]
+                    if len(pontos) >= 2 and pontos[-2][1] != phi:
+                        u_ant, phi_ant = pontos[-2]
+                        u_novo = u - phi * (u - u_ant) / (phi - phi_ant)
+                    else:
+                        u_novo = u - phi / expoente
+                else:
+                    # Flecha ainda no apoio mais baixo: P não depende de C
+                    u_novo = u + expansao
+                    expansao *= 2
+                u_novo = u + np.clip(u_novo - u, -2.0, 2.0)
+
+                if u_baixo is not None and u_alto is not None:
+                    if abs(u_alto - u_baixo) <= 4 * np.finfo(float).eps * abs(u):
+                        break
+                    if not min(u_baixo, u_alto) < u_novo < max(u_baixo, u_alto):
+                        u_novo = (u_baixo + u_alto) / 2
+                u = u_novo
+
+            if not solucoes:
+                raise ValueError(
+                    f"Método do tiro falhou para todos os C tentados "
+                    f"(o último foi {self.C:.6g})")
+            # Se a última tentativa falhou, C volta ao da última solução
+            self.C = float(np.exp(solucoes[-1][0]))
+            concluido = True
+        finally:
+            # Em caso de exceção o problema não fica com um C de tentativa
+            if not concluido:
+                self.C = C_original
+
+        self.iteracoes_tiro = iteracao
+        self.tempo_execucao = time.time() - inicio_tempo
+        if convergiu:
+            self._imprimir(
+                f"\nConvergência atingida em {iteracao} iterações "
+                f"({self.integracoes_tiro} integrações)")
+        else:
+            warnings.warn(
+                f"Solução inversa não convergiu em {iteracao} iterações "
+                f"(erro em {alvo}: {abs(erro):.2e} m)")
+        self._imprimir(f"Constante C: {self.C:.8f} m⁻¹")
+        self._imprimir(f"Inclinação inicial: {z:.8f}")
+        self._imprimir(
+            f"Tempo de execução da solução inversa: {self.tempo_execucao:.3f} segundos")
+        return self.C, z, x_vals, y_vals, dydx_vals
+
+    def diferenciacao_numerica(self, x_vals, y_vals, ordem=2, saida=None):
         """
-        Calcula derivadas numéricas de ordem 2
+        Calcula derivadas numéricas de ordem 2 (ou 4)
+
+        Implementação vetorizada por fatiamento. Com ``ordem=4`` usa
+        estênceis centrais de 5 pontos no interior e estênceis laterais de
+        4ª ordem nos dois primeiros e nos dois últimos pontos.
+
+        Parâmetros:
+        -----------
+        x_vals, y_vals : ndarray
+            Malha uniforme (passo h) e valores de y
+        ordem : int, default=2
+            Ordem de precisão dos estênceis (2 ou 4)
+        saida : tuple de ndarray, opcional
+            Buffers (dy_dx, d2y_dx2) pré-alocados, com o comprimento de
+            x_vals, onde o resultado é escrito (evita alocações em lote)
 
         Retorna:
         dy_dx: primeira derivada numérica
         d2y_dx2: segunda derivada numérica
         """
+        if ordem not in (2, 4):
+            raise ValueError("Ordem da diferenciação deve ser 2 ou 4")
         n = len(x_vals)
-        dy_dx = np.zeros(n)
-        d2y_dx2 = np.zeros(n)
+        if n < (4 if ordem == 2 else 6):
+            raise ValueError(
+                f"São necessários pelo menos {4 if ordem == 2 else 6} pontos")
+        y = np.asarray(y_vals)
+        h = self.h
+
+        if saida is None:
+            dy_dx = np.empty(n)
+            d2y_dx2 = np.empty(n)
+        else:
+            dy_dx, d2y_dx2 = saida
+            if len(dy_dx) != n or len(d2y_dx2) != n:
+                raise ValueError(
+                    "Buffers de saída devem ter o comprimento de x_vals")
 
-        # Primeira derivada (diferenças centrais)
-        for i in range(1, n-1):
-            dy_dx[i] = (y_vals[i+1] - y_vals[i-1]) / (2 * self.h)
+        if ordem == 2:
+            # Primeira derivada (diferenças centrais)
+            d1 = dy_dx[1:-1]
+            np.subtract(y[2:], y[:-2], out=d1)
+            d1 /= 2 * h
 
-        # Pontos extremos (diferenças progressiva e regressiva)
-        dy_dx[0] = (-3*y_vals[0] + 4*y_vals[1] - y_vals[2]) / (2 * self.h)
-        dy_dx[-1] = (3*y_vals[-1] - 4*y_vals[-2] + y_vals[-3]) / (2 * self.h)
+            # Pontos extremos (diferenças progressiva e regressiva)
+            dy_dx[0] = (-3*y[0] + 4*y[1] - y[2]) / (2 * h)
+            dy_dx[-1] = (3*y[-1] - 4*y[-2] + y[-3]) / (2 * h)
 
-        # Segunda derivada (diferenças centrais)
-        for i in range(1, n-1):
-            d2y_dx2[i] = (y_vals[i+1] - 2*y_vals[i] +
-                          y_vals[i-1]) / (self.h**2)
+            # Segunda derivada (diferenças centrais)
+            d2 = d2y_dx2[1:-1]
+            np.multiply(y[1:-1], 2, out=d2)
+            np.subtract(y[2:], d2, out=d2)
+            d2 += y[:-2]
+            d2 /= h**2
 
-        # Pontos extremos para segunda derivada
-        d2y_dx2[0] = (2*y_vals[0] - 5*y_vals[1] + 4 *
-                      y_vals[2] - y_vals[3]) / (self.h**2)
-        d2y_dx2[-1] = (2*y_vals[-1] - 5*y_vals[-2] + 4 *
-                       y_vals[-3] - y_vals[-4]) / (self.h**2)
+            # Pontos extremos para segunda derivada
+            d2y_dx2[0] = (2*y[0] - 5*y[1] + 4*y[2] - y[3]) / (h**2)
+            d2y_dx2[-1] = (2*y[-1] - 5*y[-2] + 4*y[-3] - y[-4]) / (h**2)
+        else:
+            # Primeira derivada: (-y[i+2] + 8y[i+1] - 8y[i-1] + y[i-2]) / 12h
+            d1 = dy_dx[2:-2]
+            np.subtract(y[3:-1], y[1:-3], out=d1)
+            d1 *= 8
+            d1 += y[:-4]
+            d1 -= y[4:]
+            d1 /= 12 * h
+
+            # Segunda derivada:
+            # (-y[i+2] + 16y[i+1] - 30y[i] + 16y[i-1] - y[i-2]) / 12h²
+            d2 = d2y_dx2[2:-2]
+            np.add(y[3:-1], y[1:-3], out=d2)
+            d2 *= 16
+            d2 -= 30 * y[2:-2]
+            d2 -= y[4:]
+            d2 -= y[:-4]
+            d2 /= 12 * h**2
+
+            # Estênceis laterais de 4ª ordem (espelhados no fim, com sinal
+            # trocado para a primeira derivada)
+            c1 = np.array([[-25, 48, -36, 16, -3, 0],
+                           [-3, -10, 18, -6, 1, 0]]) / (12 * h)
+            c2 = np.array([[45, -154, 214, -156, 61, -10],
+                           [10, -15, -4, 14, -6, 1]]) / (12 * h**2)
+            inicio, fim = y[:6], y[-1:-7:-1]
+            dy_dx[:2] = c1 @ inicio
+            dy_dx[-1:-3:-1] = -(c1 @ fim)
+            d2y_dx2[:2] = c2 @ inicio
+            d2y_dx2[-1:-3:-1] = c2 @ fim
 
         return dy_dx, d2y_dx2
 
-    def verificar_equacao_diferencial(self, x_vals, y_vals, dydx_vals):
+    @_etapa('verificacao')
+    def verificar_equacao_diferencial(self, x_vals, y_vals, dydx_vals,
+                                      ordem=2, saida=None):
         """
         Verifica se a solução satisfaz a equação diferencial
-        usando diferenciação numérica
+        usando diferenciação numérica (estênceis de ordem ``ordem``)
+
+        Parâmetros:
+        -----------
+        x_vals, y_vals, dydx_vals : ndarray
+            Trajetória na malha uniforme
+        ordem : int, default=2
+            Ordem de precisão dos estênceis (2 ou 4)
+        saida : tuple de ndarray, opcional
+            Buffers (residuos, dy_dx, d2y_dx2) pré-alocados, com o
+            comprimento de x_vals, onde o resultado é escrito (ver
+            ``diferenciacao_numerica``); permite verificar várias
+            trajetórias sem alocar arrays a cada chamada
+
+        Retorna:
+        --------
+        tuple
+            (residuos, dy_dx, d2y_dx2)
         """
-        print("\n=== VERIFICAÇÃO POR DIFERENCIAÇÃO NUMÉRICA ===")
+        self._imprimir("\n=== VERIFICAÇÃO POR DIFERENCIAÇÃO NUMÉRICA ===")
+
+        if saida is None:
+            residuos = np.empty(len(x_vals))
+            derivadas = None
+        else:
+            residuos, *derivadas = saida
+            if len(residuos) != len(x_vals):
+                raise ValueError(
+                    "Buffers de saída devem ter o comprimento de x_vals")
 
         # Calcula derivadas numéricas
-        dy_dx_num, d2y_dx2_num = self.diferenciacao_numerica(x_vals, y_vals)
+        dy_dx_num, d2y_dx2_num = self.diferenciacao_numerica(
+            x_vals, y_vals, ordem, saida=derivadas)
 
-        # Calcula o lado direito da equação
-        rhs = self.C * np.sqrt(1 + dy_dx_num**2)
+        # Lado direito da equação, C√(1 + (dy/dx)²), calculado no próprio
+        # buffer dos resíduos
+        np.multiply(dy_dx_num, dy_dx_num, out=residuos)
+        residuos += 1
+        np.sqrt(residuos, out=residuos)
+        residuos *= self.C
 
         # Calcula resíduos
-        residuos = np.abs(d2y_dx2_num - rhs)
+        np.subtract(d2y_dx2_num, residuos, out=residuos)
+        np.abs(residuos, out=residuos)
 
         # Estatísticas
         residuo_max = np.max(residuos)
         residuo_medio = np.mean(residuos)
         residuo_rms = np.sqrt(np.mean(residuos**2))
 
-        print(f"Resíduo máximo: {residuo_max:.2e}")
-        print(f"Resíduo médio: {residuo_medio:.2e}")
-        print(f"Resíduo RMS: {residuo_rms:.2e}")
+        self._imprimir(f"Resíduo máximo: {residuo_max:.2e}")
+        self._imprimir(f"Resíduo médio: {residuo_medio:.2e}")
+        self._imprimir(f"Resíduo RMS: {residuo_rms:.2e}")
 
         # Tabela de pontos específicos
         indices_amostra = [
             0, len(x_vals)//4, len(x_vals)//2, 3*len(x_vals)//4, -1]
 
-        print("\nPontos de verificação:")
-        print("x (m)\t\tLHS (d²y/dx²)\tRHS (C√(1+(dy/dx)²))\tResíduo")
-        print("-" * 65)
+        self._imprimir("\nPontos de verificação:")
+        self._imprimir("x (m)\t\tLHS (d²y/dx²)\tRHS (C√(1+(dy/dx)²))\tResíduo")
+        self._imprimir("-" * 65)
 
         for i in indices_amostra:
             x = x_vals[i]
             lhs = d2y_dx2_num[i]
-            rhs_val = rhs[i]
+            rhs_val = self.C * np.sqrt(1 + dy_dx_num[i]**2)
             res = residuos[i]
-            print(f"{x:.2f}\t\t{lhs:.6f}\t\t{rhs_val:.6f}\t\t\t{res:.2e}")
+            self._imprimir(f"{x:.2f}\t\t{lhs:.6f}\t\t{rhs_val:.6f}\t\t\t{res:.2e}")
 
         return residuos, dy_dx_num, d2y_dx2_num
 
-    def calcular_propriedades_cabo(self, x_vals, y_vals, dydx_vals):
-        """
-        Calcula propriedades físicas adicionais do cabo
+    def calcular_propriedades_cabo(self, x_vals, y_vals, dydx_vals):
+        """
+        Calcula propriedades físicas adicionais do cabo
+
+        Retorna:
+        --------
+        dict : Dicionário com propriedades calculadas
+        """
+        # Comprimento do arco do cabo
+        ds = np.sqrt(1 + dydx_vals**2) * self.h
+        comprimento_total = np.sum(ds[:-1])  # Remove o último ponto duplicado
+
+        # Ponto mais baixo
+        idx_min = np.argmin(y_vals)
+        x_min = x_vals[idx_min]
+        y_min = y_vals[idx_min]
+
+        # Tensão ao longo do cabo (assumindo T_H = 1/C)
+        T_H = 1.0 / self.C  # Componente horizontal da tensão
+        tensao = T_H * np.sqrt(1 + dydx_vals**2)
+        tensao_min = np.min(tensao)
+        tensao_max = np.max(tensao)
+
+        # Curvatura
+        d2y_dx2 = np.gradient(np.gradient(y_vals, self.h), self.h)
+        curvatura = np.abs(d2y_dx2) / (1 + dydx_vals**2)**(3/2)
+        curvatura_max = np.max(curvatura)
+
+        propriedades = {
+            'comprimento_arco': comprimento_total,
+            'ponto_mais_baixo': (x_min, y_min),
+            'tensao_minima': tensao_min,
+            'tensao_maxima': tensao_max,
+            'curvatura_maxima': curvatura_max,
+            'flecha': self.y0 - y_min,  # Deflexão máxima
+            'parametro_a': 1.0 / self.C  # Parâmetro da catenária
+        }
+
+        return propriedades
+
+    def _residuos_em_blocos(self, blocos):
+        """
+        Resíduos da equação diferencial sobre uma trajetória em blocos
+
+        Usa os mesmos estênceis de 2ª ordem de ``diferenciacao_numerica``.
+        Como a derivada central em um ponto precisa do vizinho à direita,
+        a saída fica atrasada em um ponto em relação à entrada.
+
+        Gera:
+        -----
+        tuple
+            (x, y, dydx, d2y_dx2_num, residuo) de cada bloco
+        """
+        h = self.h
+        pendente = None  # último ponto, ainda sem vizinho à direita
+        y_anterior = None  # y do ponto anterior ao primeiro pendente
+        ultimos_y = np.empty(0)  # últimos 4 valores de y (fronteira final)
+
+        for x, y, dydx in blocos:
+            ultimos_y = np.concatenate((ultimos_y, y[-4:]))[-4:]
+            if pendente is not None:
+                x, y, dydx = (np.concatenate((p, v))
+                              for p, v in zip(pendente, (x, y, dydx)))
+            if y_anterior is None and len(y) < 4:
+                pendente = (x, y, dydx)
+                continue
+
+            ye = y if y_anterior is None else np.concatenate(([y_anterior], y))
+            dy_num = (ye[2:] - ye[:-2]) / (2 * h)
+            d2y_num = (ye[2:] - 2*ye[1:-1] + ye[:-2]) / (h**2)
+            if y_anterior is None:
+                dy_num = np.concatenate((
+                    [(-3*y[0] + 4*y[1] - y[2]) / (2 * h)], dy_num))
+                d2y_num = np.concatenate((
+                    [(2*y[0] - 5*y[1] + 4*y[2] - y[3]) / (h**2)], d2y_num))
+
+            residuos = np.abs(d2y_num - self.C * np.sqrt(1 + dy_num**2))
+            yield x[:-1], y[:-1], dydx[:-1], d2y_num, residuos
+
+            y_anterior = y[-2]
+            pendente = (x[-1:], y[-1:], dydx[-1:])
+
+        if y_anterior is None:
+            raise ValueError("São necessários pelo menos 4 pontos")
+
+        u = ultimos_y
+        dy_num = (3*u[-1] - 4*u[-2] + u[-3]) / (2 * h)
+        d2y_num = (2*u[-1] - 5*u[-2] + 4*u[-3] - u[-4]) / (h**2)
+        residuo = abs(d2y_num - self.C * np.sqrt(1 + dy_num**2))
+        yield (*pendente, np.array([d2y_num]), np.array([residuo]))
+
+    def processar_em_blocos(self, dydx_inicial, nome_arquivo=None,
+                            tamanho_bloco=65536, formato='csv',
+                            escritor=None):
+        """
+        Integra, verifica e exporta a solução sem materializar a trajetória
+
+        Numa única passada sobre ``gerar_trajetoria_em_blocos``, calcula as
+        estatísticas dos resíduos, acumula as propriedades de
+        ``calcular_propriedades_cabo`` e, opcionalmente, grava cada bloco
+        no formato escolhido, com as colunas de ``exportar_dados`` (sem
+        as do polinômio): CSV, o binário de ``exportar_binario`` (escrito
+        por fatias no ``numpy.memmap``) ou um vão de um
+        ``EscritorColunar`` (um row group por bloco). A memória é
+        constante em n_steps.
+
+        A curvatura máxima usa a segunda derivada dos estênceis de
+        resíduo (em vez de ``np.gradient`` aplicado duas vezes).
+
+        Parâmetros:
+        -----------
+        dydx_inicial : float
+            Inclinação inicial (ex.: a convergida pelo método do tiro)
+        nome_arquivo : str, opcional
+            Caminho do CSV de saída ou, com ``formato='binario'``, nome
+            base do .bin/.json; se None (e sem ``escritor``), nada é
+            gravado
+        tamanho_bloco : int, default=65536
+            Número máximo de pontos por bloco
+        formato : str, default='csv'
+            'csv', 'binario' ou 'colunar'
+        escritor : EscritorColunar, opcional
+            Conjunto de dados que recebe o vão com ``formato='colunar'``
 
         Retorna:
         --------
-        dict : Dicionário com propriedades calculadas
+        dict
+            'n_pontos', 'residuo_maximo', 'residuo_medio', 'residuo_rms',
+            'propriedades' e 'arquivo' (.csv, .bin ou o arquivo de dados
+            do escritor)
         """
-        # Comprimento do arco do cabo
-        ds = np.sqrt(1 + dydx_vals**2) * self.h
-        comprimento_total = np.sum(ds[:-1])  # Remove o último ponto duplicado
+        if formato not in ('csv', 'binario', 'colunar'):
+            raise ValueError("Formato deve ser 'csv', 'binario' ou 'colunar'")
+        if formato == 'colunar' and escritor is None:
+            raise ValueError(
+                "formato='colunar' requer um EscritorColunar em 'escritor'")
+        blocos = self._residuos_em_blocos(self.gerar_trajetoria_em_blocos(
+            self.y0, dydx_inicial, tamanho_bloco))
 
-        # Ponto mais baixo
-        idx_min = np.argmin(y_vals)
-        x_min = x_vals[idx_min]
-        y_min = y_vals[idx_min]
+        n_pontos = 0
+        soma_res = soma_res2 = 0.0
+        res_max = 0.0
+        comprimento = 0.0
+        y_min, x_min = np.inf, None
+        tensao_min, tensao_max = np.inf, -np.inf
+        curvatura_max = 0.0
+        T_H = 1.0 / self.C
 
-        # Tensão ao longo do cabo (assumindo T_H = 1/C)
-        T_H = 1.0 / self.C  # Componente horizontal da tensão
-        tensao = T_H * np.sqrt(1 + dydx_vals**2)
-        tensao_min = np.min(tensao)
-        tensao_max = np.max(tensao)
+        arquivo = dados = None
+        vao_id = escritor.n_vaos if formato == 'colunar' else None
+        if formato == 'binario' and nome_arquivo is not None:
+            dados, nome_arquivo = self._criar_memmap(
+                nome_arquivo, ['x', 'y', 'dydx', 'residuo_numerico'])
+        elif formato == 'csv' and nome_arquivo is not None:
+            arquivo = open(nome_arquivo, 'w', encoding='utf-8')
+            arquivo.write("x (m),y (m),dy/dx,residuo_numerico\n")
+        try:
+            for x, y, dydx, d2y_num, residuos in blocos:
+                n_pontos += len(x)
+                soma_res += np.sum(residuos)
+                soma_res2 += np.sum(residuos**2)
+                res_max = max(res_max, np.max(residuos))
 
-        # Curvatura
-        d2y_dx2 = np.gradient(np.gradient(y_vals, self.h), self.h)
-        curvatura = np.abs(d2y_dx2) / (1 + dydx_vals**2)**(3/2)
-        curvatura_max = np.max(curvatura)
+                fator = np.sqrt(1 + dydx**2)
+                comprimento += np.sum(fator) * self.h
+                i_min = np.argmin(y)
+                if y[i_min] < y_min:
+                    y_min, x_min = y[i_min], x[i_min]
+                tensao = T_H * fator
+                tensao_min = min(tensao_min, np.min(tensao))
+                tensao_max = max(tensao_max, np.max(tensao))
+                curvatura_max = max(curvatura_max, np.max(
+                    np.abs(d2y_num) / fator**3))
+
+                if arquivo is not None:
+                    np.savetxt(arquivo,
+                               np.column_stack((x, y, dydx, residuos)),
+                               fmt='%.8f', delimiter=',')
+                elif dados is not None:
+                    fatia = slice(n_pontos - len(x), n_pontos)
+                    for linha, coluna in enumerate((x, y, dydx, residuos)):
+                        dados[linha, fatia] = coluna
+                elif vao_id is not None:
+                    escritor.adicionar_bloco(vao_id, x, y, dydx, residuos)
+        finally:
+            if arquivo is not None:
+                arquivo.close()
+            if dados is not None:
+                dados.flush()
+
+        # O último ponto não entra no comprimento (como em
+        # calcular_propriedades_cabo)
+        comprimento -= fator[-1] * self.h
 
         propriedades = {
-            'comprimento_arco': comprimento_total,
+            'comprimento_arco': comprimento,
             'ponto_mais_baixo': (x_min, y_min),
             'tensao_minima': tensao_min,
             'tensao_maxima': tensao_max,
             'curvatura_maxima': curvatura_max,
-            'flecha': self.y0 - y_min,  # Deflexão máxima
-            'parametro_a': 1.0 / self.C  # Parâmetro da catenária
+            'flecha': self.y0 - y_min,
+            'parametro_a': 1.0 / self.C
         }
+        if vao_id is not None:
+            escritor.registrar_vao(self, propriedades)
+            nome_arquivo = escritor.caminho_dados
 
-        return propriedades
+        return {
+            'n_pontos': n_pontos,
+            'residuo_maximo': res_max,
+            'residuo_medio': soma_res / n_pontos,
+            'residuo_rms': np.sqrt(soma_res2 / n_pontos),
+            'propriedades': propriedades,
+            'arquivo': nome_arquivo,
+        }
 
+    @_etapa('regressao')
     def regressao_polinomial(self, x_vals, y_vals):
         """
         Ajusta um polinômio de 4º grau aos dados e verifica a equação
         """
-        print("\n=== VERIFICAÇÃO POR REGRESSÃO POLINOMIAL DE 4º GRAU ===")
+        self._imprimir("\n=== VERIFICAÇÃO POR REGRESSÃO POLINOMIAL DE 4º GRAU ===")
 
         # Ajuste polinomial
         coeficientes = np.polyfit(x_vals, y_vals, 4)
         polinomio = np.poly1d(coeficientes)
 
-        print("Coeficientes do polinômio P(x) = c₄x⁴ + c₃x³ + c₂x² + c₁x + c₀:")
+        self._imprimir("Coeficientes do polinômio P(x) = c₄x⁴ + c₃x³ + c₂x² + c₁x + c₀:")
         for i, coef in enumerate(coeficientes):
-            print(f"c_{4-i} = {coef:.8e}")
+            self._imprimir(f"c_{4-i} = {coef:.8e}")
 
         # Derivadas analíticas do polinômio
         dp_dx = np.polyder(polinomio, 1)  # primeira derivada
@@ -363,49 +3380,64 @@ class CaboProblem:
         residuo_medio_poli = np.mean(residuos_poli)
         residuo_rms_poli = np.sqrt(np.mean(residuos_poli**2))
 
-        print(f"\nResíduo máximo: {residuo_max_poli:.2e}")
-        print(f"Resíduo médio: {residuo_medio_poli:.2e}")
-        print(f"Resíduo RMS: {residuo_rms_poli:.2e}")
+        self._imprimir(f"\nResíduo máximo: {residuo_max_poli:.2e}")
+        self._imprimir(f"Resíduo médio: {residuo_medio_poli:.2e}")
+        self._imprimir(f"Resíduo RMS: {residuo_rms_poli:.2e}")
 
         # R² do ajuste
         ss_res = np.sum((y_vals - y_poli) ** 2)
         ss_tot = np.sum((y_vals - np.mean(y_vals)) ** 2)
         r_squared = 1 - (ss_res / ss_tot)
-        print(f"R² do ajuste polinomial: {r_squared:.8f}")
+        self._imprimir(f"R² do ajuste polinomial: {r_squared:.8f}")
 
         # Tabela de pontos específicos
         indices_amostra = [
             0, len(x_vals)//4, len(x_vals)//2, 3*len(x_vals)//4, -1]
 
-        print("\nPontos de verificação do polinômio:")
-        print("x (m)\t\tLHS (P''(x))\tRHS (C√(1+(P'(x))²))\tResíduo")
-        print("-" * 65)
+        self._imprimir("\nPontos de verificação do polinômio:")
+        self._imprimir("x (m)\t\tLHS (P''(x))\tRHS (C√(1+(P'(x))²))\tResíduo")
+        self._imprimir("-" * 65)
 
         for i in indices_amostra:
             x = x_vals[i]
             lhs = d2y_poli[i]
             rhs_val = rhs_poli[i]
             res = residuos_poli[i]
-            print(f"{x:.2f}\t\t{lhs:.6f}\t\t{rhs_val:.6f}\t\t\t{res:.2e}")
+            self._imprimir(f"{x:.2f}\t\t{lhs:.6f}\t\t{rhs_val:.6f}\t\t\t{res:.2e}")
 
         return polinomio, residuos_poli, y_poli, dy_poli, d2y_poli
 
+    @_etapa('plotagem')
     def plotar_resultados(self, x_vals, y_vals, dydx_vals, residuos,
-                          polinomio=None, y_poli=None, residuos_poli=None):
+                          polinomio=None, y_poli=None, residuos_poli=None,
+                          headless=False, nome_arquivo=None, dpi=None):
         """
         Plota os resultados da análise
+
+        Com ``headless=True`` (execuções em lote) desenha numa figura Agg
+        fora do pyplot (o backend do processo não muda), não chama
+        ``plt.show()``, reaproveita uma única figura entre chamadas
+        e reduz cada série à largura em pixels do painel (LTTB) antes de
+        desenhar, de modo que o custo não depende de n_steps.
+
+        Retorna:
+        --------
+        str : caminho do PNG gravado
         """
-        # Configurações de estilo melhoradas
-        plt.style.use('default')
-        plt.rcParams.update({
-            'font.size': 11,
-            'axes.titlesize': 12,
-            'axes.labelsize': 11,
-            'xtick.labelsize': 10,
-            'ytick.labelsize': 10,
-            'legend.fontsize': 10,
-            'figure.titlesize': 14
-        })
+        if headless:
+            if nome_arquivo is None:
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                nome_arquivo = f'resultados_cabo_{timestamp}.png'
+            if y_poli is None and polinomio is not None:
+                y_poli = polinomio(x_vals)
+            _modelo_figura(dpi or 100).desenhar(
+                self, x_vals, y_vals, dydx_vals, residuos, y_poli,
+                residuos_poli, nome_arquivo)
+            return nome_arquivo
+
+        plt = _pyplot()
+
+        _aplicar_estilo(plt)
 
         fig = plt.figure(figsize=(16, 10))
 
@@ -500,16 +3532,194 @@ class CaboProblem:
         plt.tight_layout(rect=[0, 0.02, 1, 0.94])
 
         # Salva com timestamp para evitar sobrescrever
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        nome_arquivo = f'resultados_cabo_{timestamp}.png'
-        plt.savefig(nome_arquivo, dpi=300, bbox_inches='tight',
+        if nome_arquivo is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            nome_arquivo = f'resultados_cabo_{timestamp}.png'
+        plt.savefig(nome_arquivo, dpi=dpi or 300, bbox_inches='tight',
                     facecolor='white', edgecolor='none')
-        print(f"Gráficos salvos em: {nome_arquivo}")
+        self._imprimir(f"Gráficos salvos em: {nome_arquivo}")
         plt.show()
+        return nome_arquivo
+
+    def _parametros_problema(self):
+        """Parâmetros do problema em um dicionário serializável"""
+        return {
+            'C': self.C, 'x0': self.x0, 'y0': self.y0, 'xf': self.xf,
+            'yf': self.yf, 'h': self.h, 'n_steps': self.n_steps,
+            'tol': self.tol, 'metodo': self.metodo,
+            'integrador': self.integrador, 'raiz': self.raiz,
+        }
+
+    def _criar_memmap(self, nome_base, colunas, n_pontos=None):
+        """
+        Cria o arquivo binário ``<nome_base>.bin`` (uma linha contígua por
+        coluna, float64) e o cabeçalho JSON ``<nome_base>.json``
+
+        ``n_pontos`` é o comprimento de cada coluna (padrão: n_steps+1,
+        a malha uniforme).
+
+        Retorna:
+        --------
+        tuple
+            (memmap de forma (n_colunas, n_pontos), caminho do .bin)
+        """
+        caminho_bin = f'{nome_base}.bin'
+        if n_pontos is None:
+            n_pontos = self.n_steps + 1
+        forma = (len(colunas), n_pontos)
+        dados = np.memmap(caminho_bin, dtype='<f8', mode='w+', shape=forma)
+        cabecalho = {
+            'dtype': '<f8',
+            'shape': list(forma),
+            'ordem': 'colunas',
+            'colunas': list(colunas),
+            'parametros': self._parametros_problema(),
+        }
+        with open(f'{nome_base}.json', 'w', encoding='utf-8') as f:
+            json.dump(cabecalho, f, indent=2)
+        return dados, caminho_bin
+
+    def exportar_binario(self, x_vals, y_vals, dydx_vals, residuos,
+                         polinomio=None, nome_base=None):
+        """
+        Exporta os dados para um arquivo binário mapeado em memória
+
+        Mesmas colunas de ``exportar_dados``, gravadas sem formatação de
+        texto e com precisão total (ver ``ler_trajetoria_binaria``). O
+        arquivo tem o comprimento de ``x_vals``, que não precisa ser a
+        malha de n_steps+1 pontos (ex.: saída densa ou outra malha).
+
+        Retorna:
+        --------
+        str : caminho do arquivo .bin
+        """
+        if nome_base is None:
+            nome_base = f'dados_cabo_{time.strftime("%Y%m%d_%H%M%S")}'
+        colunas = ['x', 'y', 'dydx', 'residuo_numerico']
+        if polinomio is not None:
+            colunas += ['y_polinomio', 'diferenca_abs']
+
+        if not len(x_vals) == len(y_vals) == len(dydx_vals) == len(residuos):
+            raise ValueError("As colunas devem ter o mesmo comprimento")
+        dados, caminho_bin = self._criar_memmap(nome_base, colunas,
+                                                len(x_vals))
+        dados[0] = x_vals
+        dados[1] = y_vals
+        dados[2] = dydx_vals
+        dados[3] = residuos
+        if polinomio is not None:
+            dados[4] = polinomio(x_vals)
+            np.subtract(y_vals, dados[4], out=dados[5])
+            np.abs(dados[5], out=dados[5])
+        dados.flush()
+        return caminho_bin
+
+    def integrar_para_binario(self, dydx_inicial, nome_base=None,
+                              polinomio=None, tamanho_bloco=65536):
+        """
+        Integra a solução diretamente em um arquivo binário mapeado
+
+        O RK4 escreve x, y e dy/dx nas linhas do ``numpy.memmap`` e os
+        resíduos são calculados no próprio arquivo, por blocos de
+        ``tamanho_bloco`` pontos, sem cópia intermediária da trajetória:
+        a memória extra é de dois buffers do tamanho de um bloco.
+
+        Retorna:
+        --------
+        str : caminho do arquivo .bin
+        """
+        if tamanho_bloco < 4:
+            raise ValueError("tamanho_bloco deve ser pelo menos 4")
+        if nome_base is None:
+            nome_base = f'dados_cabo_{time.strftime("%Y%m%d_%H%M%S")}'
+        colunas = ['x', 'y', 'dydx', 'residuo_numerico']
+        if polinomio is not None:
+            colunas += ['y_polinomio', 'diferenca_abs']
+
+        dados, caminho_bin = self._criar_memmap(nome_base, colunas)
+        x_vals, y_vals, dydx_vals, residuos = dados[0], dados[1], dados[2], \
+            dados[3]
+        self.runge_kutta_4(self.y0, dydx_inicial,
+                           saida=(x_vals, y_vals, dydx_vals))
+
+        # Resíduo = |y'' - C√(1 + y'²)|, bloco a bloco. Cada bloco é
+        # derivado com um ponto de sobreposição de cada lado, de modo que
+        # os estênceis centrais dão os mesmos valores da malha inteira (e
+        # os laterais só entram nos extremos da malha); a primeira
+        # derivada é copiada para a coluna de resíduos e transformada no
+        # lugar
+        # (uma cauda com menos de 4 pontos é anexada ao último bloco)
+        n = self.n_steps + 1
+        dy_buf = np.empty(min(tamanho_bloco + 3, n) + 2)
+        d2y_buf = np.empty_like(dy_buf)
+        inicio = 0
+        while inicio < n:
+            fim = min(inicio + tamanho_bloco, n)
+            if n - fim < 4:
+                fim = n
+            a, b = max(inicio - 1, 0), min(fim + 1, n)
+            self.diferenciacao_numerica(
+                x_vals[a:b], y_vals[a:b],
+                saida=(dy_buf[:b - a], d2y_buf[:b - a]))
+            bloco = residuos[inicio:fim]
+            bloco[:] = dy_buf[inicio - a:fim - a]
+            bloco **= 2
+            bloco += 1
+            np.sqrt(bloco, out=bloco)
+            bloco *= self.C
+            np.subtract(d2y_buf[inicio - a:fim - a], bloco, out=bloco)
+            np.abs(bloco, out=bloco)
+            inicio = fim
+
+        if polinomio is not None:
+            dados[4] = polinomio(x_vals)
+            np.subtract(y_vals, dados[4], out=dados[5])
+            np.abs(dados[5], out=dados[5])
+        dados.flush()
+        return caminho_bin
 
-    def exportar_dados(self, x_vals, y_vals, dydx_vals, residuos, polinomio=None):
+    @_etapa('exportacao')
+    def exportar_dados(self, x_vals, y_vals, dydx_vals, residuos, polinomio=None,
+                       formato='csv', escritor=None):
         """
         Exporta os dados para um arquivo CSV
+
+        Com ``formato='binario'`` os dados vão para um arquivo binário
+        mapeado em memória (``exportar_binario``) em vez do CSV. Com
+        ``formato='colunar'`` o vão é acrescentado ao conjunto de dados
+        de ``escritor`` (um ``EscritorColunar``), cuja tabela de metadados
+        substitui o relatório em texto.
+        """
+        if formato not in ('csv', 'binario', 'colunar'):
+            raise ValueError("Formato deve ser 'csv', 'binario' ou 'colunar'")
+
+        if formato == 'colunar':
+            if escritor is None:
+                raise ValueError(
+                    "formato='colunar' requer um EscritorColunar em 'escritor'")
+            vao_id = escritor.adicionar(self, x_vals, y_vals, dydx_vals,
+                                        residuos, polinomio)
+            self._imprimir(f"\nVão {vao_id} acrescentado a: {escritor.caminho_dados}")
+            return escritor.caminho_dados, None
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        if formato == 'binario':
+            nome_arquivo = self.exportar_binario(
+                x_vals, y_vals, dydx_vals, residuos, polinomio,
+                nome_base=f'dados_cabo_{timestamp}')
+            self._imprimir(f"\nDados exportados para: {nome_arquivo}")
+        else:
+            nome_arquivo = self._exportar_csv(
+                x_vals, y_vals, dydx_vals, residuos, polinomio, timestamp)
+
+        # Calcula e mostra propriedades do cabo
+        return self._relatorio_propriedades(
+            x_vals, y_vals, dydx_vals, nome_arquivo, timestamp)
+
+    def _exportar_csv(self, x_vals, y_vals, dydx_vals, residuos, polinomio,
+                      timestamp):
+        """
+        Grava os dados em CSV com pandas
         """
         # Preparação dos dados
         dados = {
@@ -525,31 +3735,41 @@ class CaboProblem:
             dados['diferenca_abs'] = np.abs(y_vals - y_poli)
 
         # Criação do DataFrame
+        import pandas as pd
         df = pd.DataFrame(dados)
 
         # Exportação com timestamp
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
         nome_arquivo = f'dados_cabo_{timestamp}.csv'
         df.to_csv(nome_arquivo, index=False, float_format='%.8f')
-        print(f"\nDados exportados para: {nome_arquivo}")
+        self._imprimir(f"\nDados exportados para: {nome_arquivo}")
+        return nome_arquivo
 
-        # Calcula e mostra propriedades do cabo
+    def _relatorio_propriedades(self, x_vals, y_vals, dydx_vals, nome_arquivo,
+                                timestamp):
+        """
+        Mostra as propriedades físicas e grava o relatório completo
+
+        Retorna:
+        --------
+        tuple
+            (nome_arquivo, nome_relatorio)
+        """
         propriedades = self.calcular_propriedades_cabo(
             x_vals, y_vals, dydx_vals)
 
-        print("\n" + "="*50)
-        print("PROPRIEDADES FÍSICAS DO CABO")
-        print("="*50)
-        print(f"Comprimento do arco: {propriedades['comprimento_arco']:.6f} m")
-        print(
+        self._imprimir("\n" + "="*50)
+        self._imprimir("PROPRIEDADES FÍSICAS DO CABO")
+        self._imprimir("="*50)
+        self._imprimir(f"Comprimento do arco: {propriedades['comprimento_arco']:.6f} m")
+        self._imprimir(
             f"Ponto mais baixo: x = {propriedades['ponto_mais_baixo'][0]:.2f} m, y = {propriedades['ponto_mais_baixo'][1]:.6f} m")
-        print(f"Flecha (deflexão máxima): {propriedades['flecha']:.6f} m")
-        print(f"Tensão mínima: {propriedades['tensao_minima']:.3f} (T_H)")
-        print(f"Tensão máxima: {propriedades['tensao_maxima']:.3f} (T_H)")
-        print(f"Curvatura máxima: {propriedades['curvatura_maxima']:.6f} m⁻¹")
-        print(
+        self._imprimir(f"Flecha (deflexão máxima): {propriedades['flecha']:.6f} m")
+        self._imprimir(f"Tensão mínima: {propriedades['tensao_minima']:.3f} (T_H)")
+        self._imprimir(f"Tensão máxima: {propriedades['tensao_maxima']:.3f} (T_H)")
+        self._imprimir(f"Curvatura máxima: {propriedades['curvatura_maxima']:.6f} m⁻¹")
+        self._imprimir(
             f"Parâmetro da catenária (a = 1/C): {propriedades['parametro_a']:.3f} m")
-        print("="*50)
+        self._imprimir("="*50)
 
         # Salva relatório completo
         nome_relatorio = f'relatorio_cabo_{timestamp}.txt'
@@ -561,6 +3781,19 @@ class CaboProblem:
             f.write(
                 f"- Condições de contorno: y({self.x0}) = {self.y0} m, y({self.xf}) = {self.yf} m\n")
             f.write(f"- Passo de integração: {self.h}\n")
+            if self.selecao_passo is not None:
+                f.write(
+                    f"- Passo automático (Richardson): erro estimado "
+                    f"{self.selecao_passo['erro_y_final']:.2e} em y(xf), "
+                    f"{self.selecao_passo['erro_flecha']:.2e} na flecha, "
+                    f"{self.selecao_passo['erro_comprimento_arco']:.2e} no "
+                    f"comprimento, {self.selecao_passo['erro_x_mais_baixo']:.2e} "
+                    f"em x do ponto mais baixo\n")
+            if self.integrador == 'dopri5':
+                f.write(
+                    f"- Integrador adaptativo: rtol = {self.rtol}, atol = {self.atol} "
+                    f"({self.passos_aceitos} passos aceitos, "
+                    f"{self.passos_rejeitados} rejeitados)\n")
             f.write(f"- Tolerância: {self.tol}\n")
             f.write(
                 f"- Tempo de execução: {self.tempo_execucao:.3f} segundos\n")
@@ -575,7 +3808,7 @@ class CaboProblem:
                 else:
                     f.write(f"- {chave}: {valor:.6f}\n")
 
-        print(f"Relatório completo salvo em: {nome_relatorio}")
+        self._imprimir(f"Relatório completo salvo em: {nome_relatorio}")
 
         return nome_arquivo, nome_relatorio
 
@@ -604,6 +3837,760 @@ class CaboProblem:
         return y_analitica, a, b, d
 
 
+def consultar_folgas(solucoes, alturas, x_inicio=None, x_fim=None):
+    """
+    Cruzamentos de alturas e ponto mais baixo para um lote de cabos
+
+    Parâmetros:
+    -----------
+    solucoes : sequência de SolucaoDensa ou ResultadoCabo
+        Cabos resolvidos
+    alturas : float ou array_like
+        Alturas de referência, comuns a todos os cabos
+    x_inicio, x_fim : float, opcional
+        Corredor (padrão: vão inteiro de cada cabo)
+
+    Retorna:
+    --------
+    dict
+        'cruzamentos' (n_cabos, n_alturas, 2) com colunas (descida,
+        subida) e NaN onde não há cruzamento; 'x_minimo' e 'y_minimo'
+        (n_cabos,) no corredor
+    """
+    alturas = np.atleast_1d(np.asarray(alturas, dtype=np.float64))
+    n = len(solucoes)
+    cruzamentos = np.empty((n, alturas.size, 2))
+    x_minimo = np.empty(n)
+    y_minimo = np.empty(n)
+    for i, solucao in enumerate(solucoes):
+        if isinstance(solucao, ResultadoCabo):
+            solucao = solucao.densa
+        cruzamentos[i] = solucao.cruzamentos(alturas, x_inicio, x_fim)
+        x_minimo[i], y_minimo[i] = solucao.minimo(x_inicio, x_fim)
+    return {'cruzamentos': cruzamentos, 'x_minimo': x_minimo,
+            'y_minimo': y_minimo}
+
+
+def ler_trajetoria_binaria(caminho):
+    """
+    Abre preguiçosamente um arquivo gravado por ``exportar_binario``
+
+    Parâmetros:
+    -----------
+    caminho : str
+        Caminho do .bin (ou do .json, ou o nome base sem extensão)
+
+    Retorna:
+    --------
+    tuple
+        (colunas, cabecalho): ``colunas`` mapeia o nome de cada coluna a
+        uma visão somente leitura do ``numpy.memmap`` (nada é lido do
+        disco até o acesso); ``cabecalho`` é o JSON com dtype, shape e
+        parâmetros do problema
+    """
+    base = str(caminho)
+    if base.endswith('.bin') or base.endswith('.json'):
+        base = base.rsplit('.', 1)[0]
+    with open(f'{base}.json', encoding='utf-8') as f:
+        cabecalho = json.load(f)
+    dados = np.memmap(f'{base}.bin', dtype=cabecalho['dtype'], mode='r',
+                      shape=tuple(cabecalho['shape']))
+    colunas = {nome: dados[i] for i, nome in enumerate(cabecalho['colunas'])}
+    return colunas, cabecalho
+
+
+def _lttb(x, y, n_saida):
+    """
+    Reduz a série (x, y) a ``n_saida`` pontos por Largest-Triangle-Three-
+    Buckets, preservando a forma visual (picos e vales)
+    """
+    n = len(x)
+    if n_saida >= n or n_saida < 3:
+        return x, y
+
+    # n_saida - 2 baldes para os pontos interiores; extremos mantidos
+    bordas = np.linspace(1, n - 1, n_saida - 1).astype(np.intp)
+    indices = np.empty(n_saida, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_saida - 2):
+        ini, fim = bordas[i], bordas[i + 1]
+        if i + 2 < len(bordas):
+            prox = slice(bordas[i + 1], bordas[i + 2])
+        else:
+            prox = slice(n - 1, n)
+        x_med, y_med = x[prox].mean(), y[prox].mean()
+
+        areas = np.abs((x[a] - x_med) * (y[ini:fim] - y[a])
+                       - (x[a] - x[ini:fim]) * (y_med - y[a]))
+        a = ini + int(np.argmax(areas))
+        indices[i + 1] = a
+    return x[indices], y[indices]
+
+
+class _ModeloFigura:
+    """
+    Figura de quatro painéis (layout de ``plotar_resultados``) criada uma
+    vez por processo e reaproveitada entre vãos: a cada desenho só os
+    dados das linhas são trocados.
+    """
+
+    def __init__(self, dpi):
+        with _contexto_estilo():
+            self._criar(dpi)
+
+    def _criar(self, dpi):
+        """Monta a figura e os artistas vazios"""
+        # Figure com canvas Agg próprio: não passa pelo pyplot, então não
+        # troca o backend do processo nem registra a figura no
+        # gerenciador de figuras
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.dpi = dpi
+        self.fig = Figure(figsize=(16, 10), dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.fig.suptitle('Análise Completa do Cabo Suspenso (Catenária)',
+                          fontsize=16, fontweight='bold', y=0.96)
+        ax1, ax2, ax3, ax4 = (self.fig.add_subplot(2, 2, i)
+                              for i in range(1, 5))
+        self.eixos = (ax1, ax2, ax3, ax4)
+
+        self.linha_y, = ax1.plot([], [], 'b-', linewidth=2.5,
+                                 label='Solução RK4')
+        self.linha_poli, = ax1.plot([], [], 'r--', linewidth=2,
+                                    label='Polinômio 4º grau')
+        self.contorno = ax1.scatter(
+            [], [], color='red', s=120, zorder=5,
+            label='Condições de contorno', edgecolor='darkred', linewidth=1)
+        self.minimo = ax1.scatter(
+            [], [], color='green', s=100, marker='v', zorder=5,
+            label='Ponto mais baixo', edgecolor='darkgreen', linewidth=1)
+        ax1.set_xlabel('Posição x (m)', fontweight='bold')
+        ax1.set_ylabel('Altura y (m)', fontweight='bold')
+        ax1.set_title('Forma do Cabo Suspenso (Catenária)',
+                      fontweight='bold', pad=15)
+
+        self.linha_dydx, = ax2.plot([], [], 'g-', linewidth=2.5,
+                                    label='dy/dx')
+        ax2.axhline(y=0, color='k', linestyle='--', alpha=0.6, linewidth=1)
+        ax2.set_xlabel('Posição x (m)', fontweight='bold')
+        ax2.set_ylabel('Inclinação dy/dx', fontweight='bold')
+        ax2.set_title('Inclinação do Cabo', fontweight='bold', pad=15)
+
+        self.linha_res, = ax3.plot([], [], 'b-', linewidth=2.5,
+                                   label='Diferenciação numérica')
+        self.linha_res_poli, = ax3.plot([], [], 'r--', linewidth=2,
+                                        label='Polinômio 4º grau')
+        ax3.set_yscale('log')
+        ax3.set_xlabel('Posição x (m)', fontweight='bold')
+        ax3.set_ylabel('|Resíduo| (escala log)', fontweight='bold')
+        ax3.set_title('Resíduos da Equação Diferencial',
+                      fontweight='bold', pad=15)
+
+        self.linha_4, = ax4.plot([], [], linewidth=2.5)
+        ax4.set_xlabel('Posição x (m)', fontweight='bold')
+
+        for ax in self.eixos:
+            ax.grid(True, alpha=0.4, linestyle='-', linewidth=0.5)
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+
+        self.fig.tight_layout(rect=[0, 0.02, 1, 0.94])
+        # Largura útil de cada painel em pixels: limite de pontos por série
+        self.n_pontos = max(3, int(min(ax.bbox.width for ax in self.eixos)))
+
+    def desenhar(self, cabo, x_vals, y_vals, dydx_vals, residuos, y_poli,
+                 residuos_poli, nome_arquivo):
+        """Atualiza as séries para um vão e grava o PNG"""
+        with _contexto_estilo():
+            self._desenhar(cabo, x_vals, y_vals, dydx_vals, residuos,
+                           y_poli, residuos_poli, nome_arquivo)
+
+    def _desenhar(self, cabo, x_vals, y_vals, dydx_vals, residuos, y_poli,
+                  residuos_poli, nome_arquivo):
+        ax1, ax2, ax3, ax4 = self.eixos
+        n = self.n_pontos
+
+        self.linha_y.set_data(*_lttb(x_vals, y_vals, n))
+        tem_poli = y_poli is not None
+        self.linha_poli.set_data(*(_lttb(x_vals, y_poli, n) if tem_poli
+                                   else ([], [])))
+        self.linha_poli.set_label('Polinômio 4º grau' if tem_poli
+                                  else '_nolegend_')
+        self.contorno.set_offsets([[cabo.x0, cabo.y0], [cabo.xf, cabo.yf]])
+        idx_min = np.argmin(y_vals)
+        self.minimo.set_offsets([[x_vals[idx_min], y_vals[idx_min]]])
+
+        self.linha_dydx.set_data(*_lttb(x_vals, dydx_vals, n))
+
+        self.linha_res.set_data(*_lttb(x_vals, residuos, n))
+        tem_res_poli = residuos_poli is not None
+        self.linha_res_poli.set_data(
+            *(_lttb(x_vals, residuos_poli, n) if tem_res_poli else ([], [])))
+        self.linha_res_poli.set_label('Polinômio 4º grau' if tem_res_poli
+                                      else '_nolegend_')
+
+        if tem_poli:
+            self.linha_4.set_data(*_lttb(x_vals, np.abs(y_vals - y_poli), n))
+            self.linha_4.set_color('purple')
+            ax4.set_yscale('log')
+            ax4.set_ylabel('|y_RK4 - y_polinômio| (escala log)',
+                           fontweight='bold')
+            ax4.set_title('Diferença entre Solução RK4 e Polinômio',
+                          fontweight='bold', pad=15)
+        else:
+            _, d2y_dx2_num = cabo.diferenciacao_numerica(x_vals, y_vals)
+            self.linha_4.set_data(*_lttb(x_vals, d2y_dx2_num, n))
+            self.linha_4.set_color('orange')
+            ax4.set_yscale('linear')
+            ax4.set_ylabel('d²y/dx² (m⁻¹)', fontweight='bold')
+            ax4.set_title('Curvatura do Cabo', fontweight='bold', pad=15)
+
+        for ax in self.eixos:
+            ax.relim()
+            ax.autoscale_view()
+        if not ax1.yaxis_inverted():
+            ax1.invert_yaxis()  # Para mostrar o cabo "pendurado"
+        ax1.legend(loc='best', framealpha=0.9)
+        ax3.legend(loc='best', framealpha=0.9)
+
+        self.fig.savefig(nome_arquivo, dpi=self.dpi, facecolor='white',
+                         edgecolor='none')
+
+
+# Figura reaproveitada pelo modo headless (uma por processo)
+_MODELO_FIGURA = None
+
+
+def _modelo_figura(dpi):
+    """Devolve a figura-modelo do processo, criando-a se necessário"""
+    global _MODELO_FIGURA
+    if _MODELO_FIGURA is None or _MODELO_FIGURA.dpi != dpi:
+        _MODELO_FIGURA = _ModeloFigura(dpi)
+    return _MODELO_FIGURA
+
+
+def _renderizar_vao(tarefa):
+    """Desenha um vão de ``resolver_frota`` (processos de trabalho)"""
+    resultado, nome_arquivo, dpi = tarefa
+    x_vals = resultado['x_vals']
+    cabo = CaboProblem(**resultado['parametros'], h=x_vals[1] - x_vals[0],
+                       verbose=False)
+    dy_num, d2y_num = cabo.diferenciacao_numerica(x_vals, resultado['y_vals'])
+    residuos = np.abs(d2y_num - cabo.C * np.sqrt(1 + dy_num**2))
+    return cabo.plotar_resultados(
+        x_vals, resultado['y_vals'], resultado['dydx_vals'], residuos,
+        headless=True, nome_arquivo=nome_arquivo, dpi=dpi)
+
+
+def plotar_frota(resultados, diretorio='.', max_workers=None, dpi=100):
+    """
+    Gera as figuras de vários vãos em paralelo, sem display
+
+    Parâmetros:
+    -----------
+    resultados : list of dict
+        Saída de ``resolver_frota(..., retornar_trajetoria=True)``
+    diretorio : str, default='.'
+        Pasta dos PNGs (``resultados_cabo_vao_<indice>.png``)
+    max_workers : int, opcional
+        Número de processos (padrão: os.cpu_count()); com 1, desenha no
+        próprio processo
+    dpi : int, default=100
+        Resolução das figuras
+
+    Retorna:
+    --------
+    list
+        Caminho do PNG de cada vão, na ordem de entrada (None para vãos
+        que falharam ou sem trajetória)
+    """
+    Path(diretorio).mkdir(parents=True, exist_ok=True)
+    tarefas, posicoes = [], []
+    for i, resultado in enumerate(resultados):
+        if resultado.get('erro') is None and 'x_vals' in resultado:
+            nome = str(Path(diretorio) /
+                       f"resultados_cabo_vao_{resultado['indice']}.png")
+            tarefas.append((resultado, nome, dpi))
+            posicoes.append(i)
+
+    arquivos = [None] * len(resultados)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(tarefas)))
+
+    if max_workers == 1:
+        gerados = [_renderizar_vao(tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            gerados = list(executor.map(_renderizar_vao, tarefas))
+
+    for i, nome in zip(posicoes, gerados):
+        arquivos[i] = nome
+    return arquivos
+
+
+def _importar_pyarrow():
+    """Importa pyarrow e pyarrow.parquet, ou devolve None se ausente"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow, pyarrow.parquet
+
+
+class EscritorColunar:
+    """
+    Conjunto de dados colunar e comprimido com as trajetórias de vários vãos
+
+    Com pyarrow instalado, cada vão vira um row group de
+    ``<caminho>.parquet`` (compressão zstd) e os parâmetros do problema
+    e as propriedades de ``calcular_propriedades_cabo`` vão para a tabela
+    ``<caminho>_metadados.parquet``. Sem pyarrow, tudo é gravado ao
+    fechar em ``<caminho>.npz`` com ``np.savez_compressed``, com uma
+    entrada por vão e coluna (``vao<id>_<coluna>``), para que a leitura
+    de alguns vãos não descomprima os demais.
+
+    Todas as linhas levam a coluna ``vao_id``, que as liga à tabela de
+    metadados. Use como gerenciador de contexto ou chame ``fechar()``.
+
+    Parâmetros:
+    -----------
+    caminho : str
+        Caminho base do conjunto de dados (sem extensão)
+    formato : str, opcional
+        'parquet' ou 'npz' (padrão: 'parquet' se pyarrow estiver
+        disponível)
+    """
+
+    COLUNAS = ('x', 'y', 'dydx', 'residuo_numerico', 'y_polinomio',
+               'diferenca_abs')
+
+    def __init__(self, caminho, formato=None):
+        self._arrow = _importar_pyarrow()
+        if formato is None:
+            formato = 'parquet' if self._arrow is not None else 'npz'
+        if formato not in ('parquet', 'npz'):
+            raise ValueError("Formato deve ser 'parquet' ou 'npz'")
+        if formato == 'parquet' and self._arrow is None:
+            raise ImportError("formato 'parquet' requer pyarrow")
+
+        self.caminho = str(caminho)
+        self.formato = formato
+        self.caminho_dados = f'{self.caminho}.{formato}'
+        self._metadados = []
+        self._blocos = []  # usado só no formato npz
+        self._escritor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    @property
+    def n_vaos(self):
+        """Número de vãos registrados (o próximo vão recebe este vao_id)"""
+        return len(self._metadados)
+
+    def adicionar(self, cabo, x_vals, y_vals, dydx_vals, residuos,
+                  polinomio=None):
+        """
+        Acrescenta um vão resolvido ao conjunto de dados
+
+        Retorna:
+        --------
+        int : identificador do vão (vao_id)
+        """
+        vao_id = self.n_vaos
+        self.adicionar_bloco(vao_id, x_vals, y_vals, dydx_vals, residuos,
+                             polinomio)
+        return self.registrar_vao(cabo, cabo.calcular_propriedades_cabo(
+            x_vals, y_vals, dydx_vals))
+
+    def adicionar_bloco(self, vao_id, x_vals, y_vals, dydx_vals, residuos,
+                        polinomio=None):
+        """
+        Grava um trecho das linhas de um vão
+
+        Permite gravar um vão em blocos (ver
+        ``CaboProblem.processar_em_blocos``), sem a trajetória inteira em
+        memória; cada bloco vira um row group. O vão só entra na tabela
+        de metadados com ``registrar_vao``.
+        """
+        n = len(x_vals)
+        if polinomio is not None:
+            y_poli = polinomio(x_vals)
+            diferenca = np.abs(y_vals - y_poli)
+        else:
+            y_poli = diferenca = np.full(n, np.nan)
+        colunas = {
+            'vao_id': np.full(n, vao_id, dtype=np.int64),
+            'x': x_vals, 'y': y_vals, 'dydx': dydx_vals,
+            'residuo_numerico': residuos,
+            'y_polinomio': y_poli, 'diferenca_abs': diferenca,
+        }
+
+        if self.formato == 'parquet':
+            pa, pq = self._arrow
+            tabela = pa.table(colunas)
+            if self._escritor is None:
+                self._escritor = pq.ParquetWriter(
+                    self.caminho_dados, tabela.schema, compression='zstd')
+            self._escritor.write_table(tabela, row_group_size=n)
+        else:
+            self._blocos.append(
+                {k: np.array(v, copy=True) for k, v in colunas.items()})
+
+    def registrar_vao(self, cabo, propriedades):
+        """
+        Acrescenta à tabela de metadados os parâmetros de ``cabo`` e as
+        ``propriedades`` (como as de ``calcular_propriedades_cabo``)
+
+        Retorna:
+        --------
+        int : identificador do vão (vao_id)
+        """
+        vao_id = self.n_vaos
+        propriedades = dict(propriedades)
+        x_min, y_min = propriedades.pop('ponto_mais_baixo')
+        meta = {'vao_id': vao_id, **cabo._parametros_problema(),
+                'iteracoes_tiro': cabo.iteracoes_tiro,
+                'tempo_execucao': cabo.tempo_execucao,
+                'x_mais_baixo': x_min, 'y_mais_baixo': y_min}
+        meta.update(propriedades)
+        self._metadados.append(
+            {k: (v.item() if isinstance(v, np.generic) else v)
+             for k, v in meta.items()})
+        return vao_id
+
+    def fechar(self):
+        """Finaliza o arquivo de dados e grava a tabela de metadados"""
+        chaves = list(self._metadados[0]) if self._metadados else ['vao_id']
+        metadados = {k: [m[k] for m in self._metadados] for k in chaves}
+
+        if self.formato == 'parquet':
+            pa, pq = self._arrow
+            if self._escritor is not None:
+                self._escritor.close()
+                self._escritor = None
+            pq.write_table(pa.table(metadados),
+                           f'{self.caminho}_metadados.parquet',
+                           compression='zstd')
+        else:
+            # Blocos agrupados por vão, na ordem da primeira aparição
+            por_vao = {}
+            for bloco in self._blocos:
+                por_vao.setdefault(int(bloco['vao_id'][0]), []).append(bloco)
+            arrays = {
+                'vaos': np.array(list(por_vao), dtype=np.int64),
+                'linhas': np.array([sum(len(b['x']) for b in blocos)
+                                    for blocos in por_vao.values()],
+                                   dtype=np.int64),
+            }
+            for vao_id, blocos in por_vao.items():
+                for k in self.COLUNAS:
+                    arrays[f'vao{vao_id}_{k}'] = np.concatenate(
+                        [b[k] for b in blocos])
+            for k, v in metadados.items():
+                arrays[f'meta_{k}'] = np.asarray(v)
+            np.savez_compressed(self.caminho_dados, **arrays)
+            self._blocos = []
+
+
+def ler_dataset_colunar(caminho, colunas=None, vaos=None):
+    """
+    Lê colunas selecionadas de um conjunto gravado por ``EscritorColunar``
+
+    Parâmetros:
+    -----------
+    caminho : str
+        Caminho base (sem extensão) ou o arquivo .parquet/.npz
+    colunas : list of str, opcional
+        Colunas desejadas (padrão: todas); ``vao_id`` é sempre incluída
+    vaos : list of int, opcional
+        Restringe a leitura a esses vao_id
+
+    Retorna:
+    --------
+    tuple
+        (dados, metadados): dicionários coluna -> ndarray
+    """
+    base = str(caminho)
+    if base.endswith('.parquet') or base.endswith('.npz'):
+        base = base.rsplit('.', 1)[0]
+    if colunas is not None:
+        colunas = ['vao_id'] + [c for c in colunas if c != 'vao_id']
+
+    if os.path.exists(f'{base}.parquet'):
+        arrow = _importar_pyarrow()
+        if arrow is None:
+            raise ImportError("Leitura de Parquet requer pyarrow")
+        _, pq = arrow
+        filtros = [('vao_id', 'in', list(vaos))] if vaos is not None else None
+        tabela = pq.read_table(f'{base}.parquet', columns=colunas,
+                               filters=filtros)
+        dados = {k: tabela.column(k).to_numpy() for k in tabela.column_names}
+        meta = pq.read_table(f'{base}_metadados.parquet')
+        metadados = {k: meta.column(k).to_numpy() for k in meta.column_names}
+    else:
+        # O NpzFile descomprime cada entrada só quando ela é acessada:
+        # apenas as colunas dos vãos pedidos são lidas
+        with np.load(f'{base}.npz') as arquivo:
+            gravados, linhas = arquivo['vaos'], arquivo['linhas']
+            if vaos is not None:
+                pedidos = np.isin(gravados, list(vaos))
+                gravados, linhas = gravados[pedidos], linhas[pedidos]
+            nomes = colunas[1:] if colunas is not None else \
+                list(EscritorColunar.COLUNAS)
+            partes = {k: [arquivo[f'vao{v}_{k}'] for v in gravados]
+                      for k in nomes}
+            metadados = {k[5:]: arquivo[k] for k in arquivo.files
+                         if k.startswith('meta_')}
+        dados = {'vao_id': np.repeat(gravados, linhas)}
+        for k in nomes:
+            dados[k] = (np.concatenate(partes[k]) if partes[k]
+                        else np.empty(0))
+
+    if vaos is not None:
+        mascara = np.isin(metadados['vao_id'], list(vaos))
+        metadados = {k: v[mascara] for k, v in metadados.items()}
+    return dados, metadados
+
+
+def _resolver_vao(tarefa):
+    """
+    Resolve um único vão da frota (executado nos processos de trabalho)
+
+    Exceções são capturadas e devolvidas no resultado para que a falha de
+    um vão não interrompa os demais.
+    """
+    indice, vao, opcoes, retornar_trajetoria = tarefa
+    C, x0, y0, xf, yf = (float(v) for v in vao)
+    resultado = {
+        'indice': indice,
+        'parametros': {'C': C, 'x0': x0, 'y0': y0, 'xf': xf, 'yf': yf},
+        'erro': None,
+    }
+    try:
+        cabo = CaboProblem(C=C, x0=x0, y0=y0, xf=xf, yf=yf,
+                           verbose=False, **opcoes)
+        # Só os RuntimeWarning do numpy (overflow em vãos extremos) são
+        # silenciados; os avisos do solucionador são registrados e um aviso
+        # de não convergência vira ``erro`` em vez de sumir
+        with warnings.catch_warnings(record=True) as capturados:
+            warnings.simplefilter('always')
+            warnings.simplefilter('ignore', RuntimeWarning)
+            dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+        avisos = [str(aviso.message) for aviso in capturados]
+        erro_contorno = abs(y_vals[-1] - yf)
+        resultado.update({
+            'dydx_otimo': dydx_otimo,
+            'iteracoes': cabo.iteracoes_tiro,
+            'integracoes': cabo.integracoes_tiro,
+            'h': cabo.h,
+            'selecao_passo': cabo.selecao_passo,
+            'erro_contorno': erro_contorno,
+            'tempo_execucao': cabo.tempo_execucao,
+            'propriedades': cabo.calcular_propriedades_cabo(
+                x_vals, y_vals, dydx_vals),
+            'avisos': avisos,
+        })
+        falhas = [aviso for aviso in avisos if 'não converg' in aviso]
+        if falhas:
+            resultado['erro'] = falhas[-1]
+        elif not erro_contorno <= cabo.tol:
+            resultado['erro'] = (f"Erro no contorno "
+                                 f"{erro_contorno:.2e} m maior que a "
+                                 f"tolerância {cabo.tol:.2e}")
+        if retornar_trajetoria:
+            resultado.update({'x_vals': x_vals, 'y_vals': y_vals,
+                              'dydx_vals': dydx_vals})
+    except Exception as e:
+        resultado['erro'] = f"{type(e).__name__}: {e}"
+    return resultado
+
+
+def resolver_frota(vaos, max_workers=None, chunksize=None,
+                   retornar_trajetoria=False, **opcoes):
+    """
+    Resolve uma frota de vãos independentes em paralelo
+
+    Parâmetros:
+    -----------
+    vaos : sequência ou ndarray, shape (n_vaos, 5)
+        Especificação de cada vão como (C, x0, y0, xf, yf)
+    max_workers : int, opcional
+        Número de processos (padrão: os.cpu_count()). Com 1, os vãos são
+        resolvidos em série no próprio processo.
+    chunksize : int, opcional
+        Vãos enviados por tarefa ao pool (padrão: ~4 lotes por processo)
+    retornar_trajetoria : bool, default=False
+        Inclui x_vals, y_vals e dydx_vals em cada resultado
+    **opcoes
+        Argumentos repassados a ``CaboProblem`` (h, tol, metodo,
+        integrador, raiz, segmentos, paralelo, ...)
+
+    Retorna:
+    --------
+    list of dict
+        Um resultado por vão, na ordem de entrada. Vãos que falharam têm
+        a mensagem em 'erro' (None nos demais); um vão que não convergiu
+        (aviso do solucionador ou erro no contorno acima de ``tol``) também
+        conta como falha, com os valores calculados mantidos. Os avisos
+        emitidos ao resolver cada vão ficam em 'avisos'.
+    """
+    vaos = [tuple(vao) for vao in vaos]
+    for vao in vaos:
+        if len(vao) != 5:
+            raise ValueError("Cada vão deve ser especificado como "
+                             "(C, x0, y0, xf, yf)")
+
+    tarefas = [(i, vao, opcoes, retornar_trajetoria)
+               for i, vao in enumerate(vaos)]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(tarefas)))
+
+    if max_workers == 1:
+        return [_resolver_vao(tarefa) for tarefa in tarefas]
+
+    if chunksize is None:
+        chunksize = max(1, len(tarefas) // (4 * max_workers))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_resolver_vao, tarefas, chunksize=chunksize))
+
+
+def varredura_parametros(C, y0, yf, x0=0, xf=20, h=0.01, tol=1e-5,
+                         max_iteracoes=100, tamanho_bloco=1 << 22):
+    """
+    Resolve o método do tiro sobre uma grade de C, y0 e yf de uma só vez
+
+    Todas as combinações são integradas juntas (RK4 em lote, com um C
+    por trajetória) e a busca da inclinação é uma secante em lote: cada
+    iteração integra apenas as combinações ainda não convergidas. As
+    propriedades de ``calcular_propriedades_cabo`` vêm de uma última
+    integração com ``CaboProblem.runge_kutta_4_lote``, em blocos de
+    combinações para não guardar todas as trajetórias ao mesmo tempo.
+
+    Parâmetros:
+    -----------
+    C, y0, yf : array_like
+        Eixos 1-D (combinados como produto cartesiano, na ordem C, y0,
+        yf) ou arrays N-D compatíveis por broadcasting (ex.: meshgrid)
+    x0, xf, h, tol : float
+        Como em ``CaboProblem``
+    max_iteracoes : int, default=100
+        Limite de iterações da secante
+    tamanho_bloco : int, default=2**22
+        Número aproximado de pontos por array de trajetória na varredura
+        final
+
+    Retorna:
+    --------
+    dict
+        'dims' e 'coords' descrevem os eixos (dims é ('C', 'y0', 'yf')
+        para eixos 1-D e None para entradas N-D); 'dydx_otimo', 'flecha',
+        'comprimento_arco', 'tensao_minima', 'tensao_maxima',
+        'x_mais_baixo', 'y_mais_baixo' e 'convergido' são arrays com a
+        forma da grade; 'iteracoes' é o número de iterações da secante.
+    """
+    C, y0, yf = (np.asarray(v, dtype=np.float64) for v in (C, y0, yf))
+    if all(v.ndim <= 1 for v in (C, y0, yf)):
+        coords = {'C': np.atleast_1d(C), 'y0': np.atleast_1d(y0),
+                  'yf': np.atleast_1d(yf)}
+        dims = ('C', 'y0', 'yf')
+        grade = np.meshgrid(coords['C'], coords['y0'], coords['yf'],
+                            indexing='ij')
+    else:
+        grade = np.broadcast_arrays(C, y0, yf)
+        coords = dict(zip(('C', 'y0', 'yf'), grade))
+        dims = None
+    forma = grade[0].shape
+    c, a, b = (np.ascontiguousarray(g).ravel() for g in grade)
+
+    if np.any(c <= 0):
+        raise ValueError("Constante C deve ser positiva")
+
+    # Instância usada só para validar e definir a malha (h, n_steps)
+    modelo = CaboProblem(C=float(c.min()), x0=x0, xf=xf, h=h, tol=tol,
+                         verbose=False)
+
+    def ponto_final(idx, z):
+        c_lote = c[idx]
+
+        def f(x, e):
+            return np.array([e[1], c_lote * np.sqrt(1 + e[1]**2)])
+
+        estado = np.array([a[idx], z], dtype=np.float64)
+        return modelo._rk4_ponto_final(f, estado)[0] - b[idx]
+
+    # Secante em lote com as mesmas estimativas iniciais do método do tiro
+    todos = np.arange(c.size)
+    z_ant = np.full(c.size, -1.0)
+    z_at = np.full(c.size, -0.5)
+    F_ant = ponto_final(todos, z_ant)
+    F_at = ponto_final(todos, z_at)
+
+    iteracoes = 0
+    ativos = np.abs(F_at) > tol
+    while np.any(ativos) and iteracoes < max_iteracoes:
+        idx = np.flatnonzero(ativos)
+        denom = F_at[idx] - F_ant[idx]
+        parados = np.abs(denom) < 1e-14
+        ativos[idx[parados]] = False
+        idx, denom = idx[~parados], denom[~parados]
+        if idx.size == 0:
+            break
+
+        z_novo = z_at[idx] - F_at[idx] * (z_at[idx] - z_ant[idx]) / denom
+        F_novo = ponto_final(idx, z_novo)
+        iteracoes += 1
+
+        z_ant[idx], F_ant[idx] = z_at[idx], F_at[idx]
+        z_at[idx], F_at[idx] = z_novo, F_novo
+        ativos[idx] = np.abs(F_novo) > tol
+
+    # Varredura final: trajetórias em blocos de combinações (limitando a
+    # memória a ~tamanho_bloco valores por array) e as propriedades com
+    # as mesmas definições de calcular_propriedades_cabo
+    comprimento = np.empty(c.size)
+    y_min = np.empty(c.size)
+    x_min = np.empty(c.size)
+    tensao_min = np.empty(c.size)
+    tensao_max = np.empty(c.size)
+    linhas = max(1, tamanho_bloco // (modelo.n_steps + 1))
+    for inicio in range(0, c.size, linhas):
+        fatia = slice(inicio, inicio + linhas)
+        x_vals, y_vals, dydx_vals = modelo.runge_kutta_4_lote(
+            a[fatia], z_at[fatia], C=c[fatia])
+        raiz = np.sqrt(1 + dydx_vals**2)
+        comprimento[fatia] = np.sum(raiz[:, :-1] * modelo.h, axis=1)
+        idx_min = np.argmin(y_vals, axis=1)
+        y_min[fatia] = y_vals[np.arange(len(idx_min)), idx_min]
+        x_min[fatia] = x_vals[idx_min]
+        tensao = raiz / c[fatia, None]
+        tensao_min[fatia] = tensao.min(axis=1)
+        tensao_max[fatia] = tensao.max(axis=1)
+
+    return {
+        'dims': dims,
+        'coords': coords,
+        'dydx_otimo': z_at.reshape(forma),
+        'flecha': (a - y_min).reshape(forma),
+        'comprimento_arco': comprimento.reshape(forma),
+        'tensao_minima': tensao_min.reshape(forma),
+        'tensao_maxima': tensao_max.reshape(forma),
+        'x_mais_baixo': x_min.reshape(forma),
+        'y_mais_baixo': y_min.reshape(forma),
+        'convergido': (np.abs(F_at) <= tol).reshape(forma),
+        'iteracoes': iteracoes,
+    }
+
+
 def main():
     """
     Função principal que resolve o problema completo
@@ -622,8 +4609,8 @@ def main():
         # Criar instância do problema
         cabo = CaboProblem()
 
-        # Resolver usando método do tiro
-        dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver_metodo_tiro()
+        # Resolver usando o método configurado (tiro por padrão)
+        dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
 
         # Comparação com solução analítica aproximada
         y_analitica, a, b, d = cabo.solucao_analitica_aproximada(
@@ -0,0 +1,528 @@
+"""
+Testes do solucionador do cabo suspenso
+
+Uso:
+    python -m pytest src
+"""
+
+import json
+import warnings
+
+import numpy as np
+import pytest
+
+from solucao_cabo import (CaboProblem, CacheInclinacoes, Instrumentacao,
+                          _passo_newton_segmentos,
+                          EscritorColunar, ler_dataset_colunar,
+                          ler_trajetoria_binaria, resolver_frota,
+                          varredura_parametros)
+
+
+def test_resultado_independe_de_alteracoes_posteriores():
+    cabo = CaboProblem(verbose=False)
+    resultado = cabo.resolver_resultado()
+    comprimento = resultado.propriedades['comprimento_arco']
+    flecha = resultado.flecha
+
+    # Alterações do problema depois da solução não afetam o resultado,
+    # nem as grandezas ainda não calculadas
+    resultado_2 = cabo.resolver_resultado()
+    cabo.selecionar_passo()
+    assert cabo.h != 0.01
+    assert resultado.propriedades['comprimento_arco'] == comprimento
+    cabo.resolver_inverso('flecha', 8.0)
+    assert cabo.C != 0.041
+    assert resultado.flecha == flecha
+    assert resultado_2.propriedades['comprimento_arco'] == comprimento
+    assert resultado_2.C == 0.041 and resultado_2.h == 0.01
+    assert np.max(resultado_2.residuos) < 1e-8
+    assert resultado_2.comparacao_analitica['erro_maximo'] < 1e-8
+
+
+def test_passo_automatico_controla_grandezas_reportadas():
+    cabo = CaboProblem(h='auto', verbose=False)
+    a, b, d = cabo._parametros_catenaria()
+    x_vals, y_vals, dydx_vals = cabo.runge_kutta_4(
+        cabo.y0, np.sinh((cabo.x0 - b) / a))
+    propriedades = cabo.calcular_propriedades_cabo(x_vals, y_vals, dydx_vals)
+
+    flecha_exata = cabo.y0 - (a + d)
+    comprimento_exato = a * (np.sinh((cabo.xf - b) / a)
+                             - np.sinh((cabo.x0 - b) / a))
+    selecao = cabo.selecao_passo
+    assert selecao['erro_flecha'] <= cabo.tol
+    assert abs(propriedades['flecha'] - flecha_exata) <= cabo.tol
+    # O erro do comprimento não é controlado, mas a estimativa é fiel
+    erro_comprimento = abs(propriedades['comprimento_arco']
+                           - comprimento_exato)
+    assert 0.5 < selecao['erro_comprimento_arco'] / erro_comprimento < 2
+
+
+def test_passo_automatico_rejeitado_em_diferencas_finitas():
+    with pytest.raises(ValueError):
+        CaboProblem(h='auto', metodo='diferencas_finitas', verbose=False)
+
+
+def test_solucao_densa_dopri5_entre_nos():
+    cabo = CaboProblem(integrador='dopri5', verbose=False)
+    a, b, d = cabo._parametros_catenaria()
+    densa = cabo.solucao_densa(np.sinh((cabo.x0 - b) / a))
+
+    # Pontos fora dos nós, comparados com a catenária em forma fechada
+    x = np.random.default_rng(0).uniform(cabo.x0, cabo.xf, 2000)
+    y, dydx = densa.avaliar(x)
+    assert np.max(np.abs(y - (a * np.cosh((x - b) / a) + d))) <= cabo.tol
+    assert np.max(np.abs(dydx - np.sinh((x - b) / a))) <= cabo.tol
+
+
+def test_cruzamento_tangente_no_minimo():
+    densa = CaboProblem(verbose=False).resolver_resultado().densa
+    x_min, y_min = densa.minimo()
+
+    # Altura igual ao mínimo, exatamente ou a menos de arredondamento:
+    # um único cruzamento, no ponto mais baixo
+    for altura in (y_min, y_min + 1e-11, y_min - 1e-11):
+        descida, subida = densa.cruzamentos(altura)[0]
+        assert descida == x_min
+        assert np.isnan(subida)
+
+    # Acima da precisão continuam dois cruzamentos
+    descida, subida = densa.cruzamentos(y_min + 1e-3)[0]
+    assert descida < x_min < subida
+
+
+VAOS_DIFICEIS = [
+    dict(C=1.0, xf=30, h=0.05),
+    dict(C=2.0, xf=20),
+    dict(C=1.2, xf=30),
+    dict(C=1.5, xf=20),
+    dict(C=3.0, xf=10),
+    dict(C=0.8, xf=40, y0=0, yf=50),
+]
+
+
+@pytest.mark.parametrize('segmentos', [1, 2, 4, 8, 12, 16, 32, 64])
+@pytest.mark.parametrize('vao', VAOS_DIFICEIS)
+def test_tiro_multiplo_converge_em_vaos_dificeis(vao, segmentos):
+    cabo = CaboProblem(metodo='tiro_multiplo', segmentos=segmentos,
+                       verbose=False, **vao)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+
+    # y cresce como cosh(C*(xf - x0)/2) (até ~1e8 m nesses vãos); o
+    # erro de y(xf) é absoluto e a inclinação só difere da analítica
+    # pelo erro de discretização do RK4
+    assert abs(y_vals[-1] - cabo.yf) < cabo.tol
+    dydx_analitico = CaboProblem(verbose=False, **vao).resolver_analitico()[0]
+    assert dydx_otimo == pytest.approx(dydx_analitico, rel=1e-5)
+    assert cabo.iteracoes_tiro < 50
+
+
+def test_tiro_multiplo_avisa_quando_nao_converge():
+    cabo = CaboProblem(metodo='tiro_multiplo', verbose=False,
+                       **VAOS_DIFICEIS[1])
+    with pytest.warns(UserWarning, match="não convergiu"):
+        cabo.resolver_tiro_multiplo(max_iteracoes=3)
+
+
+@pytest.mark.parametrize('alvo, valor', [('comprimento_arco', 320.0),
+                                         ('flecha', 30.0)])
+def test_inverso_recua_quando_o_primeiro_tiro_falha(alvo, valor):
+    # Com C = 1 num vão de 300 m o tiro não converge (cosh(CL) ~ 1e130)
+    cabo = CaboProblem(xf=300, h=0.5, verbose=False)
+    C, _, x_vals, y_vals, dydx_vals = cabo.resolver_inverso(
+        alvo, valor, C_inicial=1.0)
+    assert C < 0.01 and cabo.C == C
+    propriedades = cabo.calcular_propriedades_cabo(x_vals, y_vals, dydx_vals)
+    assert abs(propriedades[alvo] - valor) <= cabo.tol
+
+
+def test_inverso_restaura_C_quando_falha():
+    cabo = CaboProblem(verbose=False)
+    with pytest.raises(ValueError, match="falhou"):
+        cabo.resolver_inverso('flecha', 8.0, C_inicial=1e3, max_iteracoes=1)
+    assert cabo.C == 0.041
+
+
+def test_passo_tiro_multiplo_banda_igual_ao_denso():
+    rng = np.random.default_rng(3)
+    K = 7
+    s, s_linha = rng.uniform(0.5, 3, K), rng.uniform(0.5, 3, K)
+    r_y, r_d = rng.normal(size=K), rng.normal(size=K - 1)
+
+    # Jacobiana densa do sistema G_k Δs_k - Δs_{k+1} = -r_k
+    J = np.zeros((2 * K - 1, 2 * K - 1))
+    for k in range(K):
+        if k > 0:
+            J[2 * k, 2 * k - 1] = 1.0
+        J[2 * k, 2 * k] = s[k]
+        if k < K - 1:
+            J[2 * k, 2 * k + 1] = -1.0
+            J[2 * k + 1, 2 * k] = s_linha[k]
+            J[2 * k + 1, 2 * k + 2] = -1.0
+    rhs = np.empty(2 * K - 1)
+    rhs[0::2], rhs[1::2] = -r_y, -r_d
+    u = np.linalg.solve(J, rhs)
+
+    delta_y, delta_d = _passo_newton_segmentos(s, s_linha, r_y, r_d)
+    np.testing.assert_allclose(delta_y, np.concatenate(([0.0], u[1::2])),
+                               rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(delta_d, u[0::2], rtol=1e-12, atol=1e-12)
+
+
+def test_brent_rejeita_vao_com_estouro():
+    # C*(xf - x0) = 1000: y(xf) estoura para qualquer inclinação
+    cabo = CaboProblem(C=10, xf=100, h=0.05, raiz='brent', verbose=False)
+    with pytest.raises(ValueError, match="não é finito"):
+        cabo.resolver()
+
+
+def test_brent_recua_quando_a_expansao_estoura():
+    class CaboEstouro(CaboProblem):
+        # F linear com estouro à direita de z = 2.5
+        def funcao_erro(self, z):
+            self.integracoes_tiro += 1
+            return z - 2.0 if z < 2.5 else np.inf
+
+    cabo = CaboEstouro(verbose=False)
+    a, F_a, b, F_b, _ = cabo._expandir_intervalo(-100.0, 60)
+    assert np.isfinite(F_a) and np.isfinite(F_b)
+    assert np.sign(F_a) != np.sign(F_b) or abs(F_b) <= cabo.tol
+    z, F = cabo._raiz_brent(100, -100.0)
+    assert abs(F) <= cabo.tol and abs(z - 2.0) <= cabo.tol
+
+
+def test_figura_headless_nao_altera_o_pyplot(tmp_path):
+    import matplotlib
+    import matplotlib.pyplot as plt
+    backend = matplotlib.get_backend()
+    figuras = plt.get_fignums()
+    cabo = CaboProblem(verbose=False, h=0.01)
+    _, x_vals, y_vals, dydx_vals = cabo.resolver()
+    dy_num, d2y_num = cabo.diferenciacao_numerica(x_vals, y_vals)
+    residuos = np.abs(d2y_num - cabo.C * np.sqrt(1 + dy_num**2))
+    nome = cabo.plotar_resultados(
+        x_vals, y_vals, dydx_vals, residuos, headless=True,
+        nome_arquivo=str(tmp_path / 'vao.png'))
+    assert (tmp_path / 'vao.png').stat().st_size > 0
+    assert nome == str(tmp_path / 'vao.png')
+    assert matplotlib.get_backend() == backend
+    assert plt.get_fignums() == figuras
+
+
+def test_frota_reporta_vao_que_nao_convergiu():
+    vaos = [(0.041, 0, 15, 20, 10), (2.0, 0, 0, 60, 0)]
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        ok, falhou = resolver_frota(vaos, max_workers=1,
+                                    metodo='diferencas_finitas')
+    assert ok['erro'] is None
+    assert ok['avisos'] == []
+    assert 'não convergiram' in falhou['erro']
+    assert falhou['avisos'] == [falhou['erro']]
+    assert 'propriedades' in falhou
+
+
+@pytest.mark.parametrize('tamanho_bloco', [4, 7, 1998, 2001, 65536])
+def test_binario_em_blocos_igual_a_memoria(tmp_path, tamanho_bloco):
+    cabo = CaboProblem(verbose=False)
+    dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+    dy_num, d2y_num = cabo.diferenciacao_numerica(x_vals, y_vals)
+    residuos = np.abs(d2y_num - cabo.C * np.sqrt(1 + dy_num**2))
+    caminho = cabo.integrar_para_binario(
+        dydx_otimo, nome_base=str(tmp_path / 'vao'),
+        tamanho_bloco=tamanho_bloco)
+    colunas, _ = ler_trajetoria_binaria(caminho)
+    assert len(x_vals) == 2001
+    assert np.array_equal(colunas['y'], y_vals)
+    assert np.array_equal(colunas['residuo_numerico'], residuos)
+
+
+def test_colunar_npz_le_so_os_vaos_pedidos(tmp_path):
+    trajetorias = []
+    with EscritorColunar(tmp_path / 'frota', formato='npz') as escritor:
+        for C in (0.03, 0.041, 0.05):
+            cabo = CaboProblem(C=C, verbose=False, h=0.1)
+            _, x_vals, y_vals, dydx_vals = cabo.resolver()
+            residuos = np.zeros_like(x_vals)
+            escritor.adicionar(cabo, x_vals, y_vals, dydx_vals, residuos)
+            trajetorias.append(y_vals)
+
+    with np.load(tmp_path / 'frota.npz') as arquivo:
+        assert {'vao1_y', 'vao2_x'} <= set(arquivo.files)
+        assert 'y' not in arquivo.files
+    dados, metadados = ler_dataset_colunar(tmp_path / 'frota',
+                                           colunas=['y'], vaos=[2, 0])
+    assert set(dados) == {'vao_id', 'y'}
+    assert np.array_equal(dados['y'],
+                          np.concatenate([trajetorias[0], trajetorias[2]]))
+    assert np.array_equal(np.unique(dados['vao_id']), [0, 2])
+    assert list(metadados['vao_id']) == [0, 2]
+    assert metadados['C'][1] == 0.05
+
+    todos, _ = ler_dataset_colunar(tmp_path / 'frota.npz')
+    assert np.array_equal(todos['y'], np.concatenate(trajetorias))
+    assert np.isnan(todos['y_polinomio']).all()
+
+
+@pytest.mark.parametrize('vao', [{}] + VAOS_DIFICEIS[::2])
+def test_analitico_impoe_contornos_sem_integrar(vao):
+    cabo = CaboProblem(metodo='analitico', verbose=False, **vao)
+    dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+    escala = np.abs(y_vals).max()
+    assert y_vals[0] == cabo.y0
+    assert abs(y_vals[-1] - cabo.yf) <= 1e-14 * escala
+    assert dydx_vals[0] == dydx_otimo
+    assert cabo.integracoes_tiro == 0
+    # Mesma inclinação do método do tiro, a menos do erro do RK4
+    dydx_tiro = CaboProblem(verbose=False, **vao).resolver()[0]
+    assert dydx_otimo == pytest.approx(dydx_tiro, rel=1e-5)
+
+
+@pytest.mark.parametrize('vao', [{}, dict(C=0.01, xf=200, yf=40)])
+def test_dopri5_atinge_tolerancia_com_poucos_passos(vao):
+    cabo = CaboProblem(integrador='dopri5', verbose=False, **vao)
+    dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+    dydx_analitico = CaboProblem(metodo='analitico', verbose=False,
+                                 **vao).resolver()[0]
+    assert abs(y_vals[-1] - cabo.yf) <= cabo.tol
+    assert dydx_otimo == pytest.approx(dydx_analitico, rel=1e-6)
+    # Passos aceitos e rejeitados da integração final são reportados
+    assert 0 < cabo.passos_aceitos < cabo.n_steps / 10
+    assert cabo.passos_rejeitados >= 0
+
+
+def test_newton_converge_quadraticamente():
+    newton = CaboProblem(raiz='newton', verbose=False)
+    dydx_otimo = newton.resolver()[0]
+    secante = CaboProblem(verbose=False)
+    secante.resolver()
+    residuos = [abs(F) for _, _, F in newton.historico_tiro]
+    assert len(residuos) == newton.iteracoes_tiro + 1
+    assert residuos[-1] <= newton.tol
+    # Perto da raiz cada resíduo fica abaixo do quadrado do anterior
+    for anterior, atual in zip(residuos[-3:-1], residuos[-2:]):
+        assert atual <= anterior**2
+    assert newton.integracoes_tiro < secante.integracoes_tiro
+    dydx_analitico = CaboProblem(metodo='analitico',
+                                 verbose=False).resolver()[0]
+    assert dydx_otimo == pytest.approx(dydx_analitico, rel=1e-5)
+
+
+def test_varredura_igual_ao_laco_por_instancia():
+    varredura = varredura_parametros([0.03, 0.06], [15, 12], [10, 20])
+    assert varredura['dims'] == ('C', 'y0', 'yf')
+    assert varredura['convergido'].all()
+    for i, j, k in np.ndindex(varredura['dydx_otimo'].shape):
+        C, y0, yf = (varredura['coords'][nome][n]
+                     for nome, n in zip(varredura['dims'], (i, j, k)))
+        cabo = CaboProblem(C=C, y0=y0, yf=yf, verbose=False)
+        dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+        propriedades = cabo.calcular_propriedades_cabo(x_vals, y_vals,
+                                                       dydx_vals)
+        assert varredura['dydx_otimo'][i, j, k] == pytest.approx(
+            dydx_otimo, abs=1e-12)
+        for nome in ('flecha', 'comprimento_arco', 'tensao_minima',
+                     'tensao_maxima'):
+            assert varredura[nome][i, j, k] == pytest.approx(
+                propriedades[nome], rel=1e-12)
+
+
+def test_cache_acerto_exato_e_vizinho():
+    cache = CacheInclinacoes(tamanho_max=2)
+    frio = CaboProblem(cache=cache, verbose=False)
+    dydx_frio = frio.resolver()[0]
+    assert (cache.acertos, cache.falhas) == (0, 1)
+
+    # Acerto exato: inclinação devolvida sem nenhuma integração de busca
+    repetido = CaboProblem(cache=cache, verbose=False)
+    assert repetido.resolver()[0] == dydx_frio
+    assert repetido.integracoes_tiro == 0
+    assert (cache.acertos, cache.falhas) == (1, 1)
+
+    # Falha: o vizinho mais próximo serve de estimativa inicial
+    vizinho = CaboProblem(C=0.042, cache=cache, verbose=False)
+    sem_cache = CaboProblem(C=0.042, verbose=False)
+    assert vizinho.resolver()[0] == pytest.approx(sem_cache.resolver()[0],
+                                                  abs=1e-6)
+    assert vizinho.integracoes_tiro < sem_cache.integracoes_tiro
+    assert len(cache) == 2
+
+    CaboProblem(C=0.05, cache=cache, verbose=False).resolver()
+    assert len(cache) == 2
+    repetido.resolver()
+    assert cache.acertos == 1  # a entrada mais antiga foi descartada
+
+
+@pytest.mark.parametrize('C, dydx_inicial', [(0.041, -0.7), (0.3, -2.1),
+                                             (1.0, -40.0)])
+def test_backends_rk4_bit_a_bit_iguais(C, dydx_inicial):
+    cabos = {backend: CaboProblem(C=C, backend=backend, verbose=False)
+             for backend in CaboProblem.BACKENDS}
+    referencia = cabos['numpy'].runge_kutta_4(15.0, dydx_inicial)
+    final = tuple(v[-1] for v in referencia[1:])
+    for cabo in cabos.values():
+        trajetoria = cabo.runge_kutta_4(15.0, dydx_inicial)
+        assert all(np.array_equal(a, b)
+                   for a, b in zip(trajetoria, referencia))
+        assert tuple(cabo.integrar_ponto_final(15.0, dydx_inicial)) == final
+    # Lote: cada linha igual à integração isolada
+    _, y_lote, dydx_lote = cabos['numpy'].runge_kutta_4_lote(
+        np.array([15.0, 3.0]), np.array([dydx_inicial, 0.5]))
+    assert np.array_equal(y_lote[0], referencia[1])
+    assert np.array_equal(dydx_lote[0], referencia[2])
+    assert np.array_equal(y_lote[1],
+                          cabos['escalar'].runge_kutta_4(3.0, 0.5)[1])
+
+
+@pytest.mark.parametrize('ordem', [2, 4])
+def test_estenceis_tem_a_ordem_declarada(ordem):
+    erros = []
+    for h in (0.1, 0.05):
+        cabo = CaboProblem(h=h, verbose=False)
+        x = np.linspace(cabo.x0, cabo.xf, cabo.n_steps + 1)
+        saida = (np.empty_like(x), np.empty_like(x))
+        dy, d2y = cabo.diferenciacao_numerica(x, np.sin(0.3 * x),
+                                              ordem=ordem, saida=saida)
+        assert dy is saida[0] and d2y is saida[1]
+        # Erro máximo inclui os estênceis laterais dos extremos
+        erros.append(np.array([
+            np.abs(dy - 0.3 * np.cos(0.3 * x)).max(),
+            np.abs(d2y + 0.09 * np.sin(0.3 * x)).max()]))
+    ordem_observada = np.log2(erros[0] / erros[1])
+    assert np.all(np.abs(ordem_observada - ordem) < 0.3)
+
+
+@pytest.mark.parametrize('tamanho_bloco', [2, 7, 65536])
+def test_processamento_em_blocos_igual_a_memoria(tmp_path, tamanho_bloco):
+    cabo = CaboProblem(verbose=False)
+    dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver()
+    dy_num, d2y_num = cabo.diferenciacao_numerica(x_vals, y_vals)
+    residuos = np.abs(d2y_num - cabo.C * np.sqrt(1 + dy_num**2))
+    propriedades = cabo.calcular_propriedades_cabo(x_vals, y_vals, dydx_vals)
+
+    blocos = list(cabo.gerar_trajetoria_em_blocos(cabo.y0, dydx_otimo,
+                                                  tamanho_bloco))
+    assert max(len(x) for x, _, _ in blocos) <= tamanho_bloco
+    for coluna, completa in zip(zip(*blocos), (x_vals, y_vals, dydx_vals)):
+        assert np.array_equal(np.concatenate(coluna), completa)
+
+    resumo = cabo.processar_em_blocos(
+        dydx_otimo, nome_arquivo=str(tmp_path / 'vao'),
+        tamanho_bloco=tamanho_bloco, formato='binario')
+    colunas, _ = ler_trajetoria_binaria(resumo['arquivo'])
+    assert resumo['n_pontos'] == len(x_vals)
+    assert np.array_equal(colunas['y'], y_vals)
+    assert np.allclose(colunas['residuo_numerico'], residuos,
+                       rtol=1e-12, atol=1e-15)
+    assert resumo['residuo_maximo'] == pytest.approx(residuos.max(),
+                                                     rel=1e-12)
+    for nome in ('comprimento_arco', 'flecha', 'tensao_minima',
+                 'tensao_maxima'):
+        assert resumo['propriedades'][nome] == pytest.approx(
+            propriedades[nome], rel=1e-12)
+    assert resumo['propriedades']['ponto_mais_baixo'] == \
+        propriedades['ponto_mais_baixo']
+
+
+@pytest.mark.parametrize('formato', ['parquet', 'npz'])
+def test_colunar_ida_e_volta_igual_a_memoria(tmp_path, formato):
+    if formato == 'parquet':
+        pytest.importorskip('pyarrow')
+    cabo = CaboProblem(verbose=False, h=0.1)
+    _, x_vals, y_vals, dydx_vals = cabo.resolver()
+    residuos = np.abs(y_vals - cabo.solucao_analitica_aproximada(
+        x_vals, dydx_vals[0])[0])
+    polinomio = np.poly1d(np.polyfit(x_vals, y_vals, 4))
+    with EscritorColunar(tmp_path / 'frota', formato=formato) as escritor:
+        for _ in range(2):
+            escritor.adicionar(cabo, x_vals, y_vals, dydx_vals, residuos,
+                               polinomio)
+
+    dados, metadados = ler_dataset_colunar(tmp_path / 'frota', vaos=[1])
+    assert np.array_equal(dados['vao_id'], np.ones(len(x_vals)))
+    for nome, esperado in (('x', x_vals), ('y', y_vals), ('dydx', dydx_vals),
+                           ('residuo_numerico', residuos),
+                           ('y_polinomio', polinomio(x_vals))):
+        assert np.array_equal(dados[nome], esperado)
+    propriedades = cabo.calcular_propriedades_cabo(x_vals, y_vals, dydx_vals)
+    assert list(metadados['vao_id']) == [1]
+    assert metadados['flecha'][0] == propriedades['flecha']
+    assert metadados['C'][0] == cabo.C
+
+
+def test_instrumentacao_exporta_json(tmp_path):
+    iteracoes = []
+    instrumentacao = Instrumentacao(
+        callback=lambda i, z, F: iteracoes.append((i, z, F)))
+    cabo = CaboProblem(instrumentacao=instrumentacao, verbose=False)
+    dydx_otimo, x_vals, y_vals, dydx_vals = cabo.resolver_metodo_tiro()
+    cabo.verificar_equacao_diferencial(x_vals, y_vals, dydx_vals)
+
+    assert iteracoes == cabo.historico_tiro
+    assert iteracoes[-1][1] == dydx_otimo
+    caminho = instrumentacao.como_json(tmp_path / 'metricas.json')
+    with open(caminho, encoding='utf-8') as f:
+        metricas = json.load(f)
+    contadores = metricas['contadores']
+    assert contadores['iteracoes_tiro'] == cabo.iteracoes_tiro
+    # Busca de raiz mais a trajetória final, todas com n_steps passos RK4
+    assert contadores['integracoes'] == cabo.integracoes_tiro + 1
+    assert contadores['passos_rk4'] == \
+        contadores['integracoes'] * cabo.n_steps
+    assert contadores['avaliacoes_rhs'] == 4 * contadores['passos_rk4']
+    assert set(metricas['tempos']) == {'solucao', 'verificacao'}
+    assert all(t['chamadas'] == 1 and t['total_s'] > 0
+               for t in metricas['tempos'].values())
+
+
+@pytest.mark.parametrize('vao', VAOS_DIFICEIS + [
+    dict(y0=0, yf=200), dict(C=0.2, y0=100, yf=0, xf=60)])
+def test_brent_converge_com_integracoes_limitadas(vao):
+    # Backend escalar: mesmo resultado bit a bit, bem mais rápido para
+    # uma trajetória por vez
+    brent = CaboProblem(raiz='brent', backend='escalar', verbose=False,
+                        **vao)
+    dydx_otimo, _, y_vals, _ = brent.resolver()
+    assert abs(y_vals[-1] - brent.yf) <= brent.tol
+    # Limite de _raiz_brent: 2 + max_expansoes + max_iteracoes
+    assert brent.integracoes_tiro <= 2 + 60 + 100
+    assert len(brent.historico_tiro) == brent.iteracoes_tiro + 1
+    secante = CaboProblem(backend='escalar', verbose=False, **vao)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        secante.resolver()
+    assert brent.integracoes_tiro <= secante.integracoes_tiro
+    dydx_analitico = CaboProblem(metodo='analitico', verbose=False,
+                                 **vao).resolver()[0]
+    assert dydx_otimo == pytest.approx(dydx_analitico, rel=1e-5)
+
+
+@pytest.mark.parametrize('vao', [{}] + VAOS_DIFICEIS + [
+    dict(y0=0, yf=200), dict(C=0.2, y0=100, yf=0, xf=60)])
+def test_diferencas_finitas_convergem_em_vaos_dificeis(vao):
+    cabo = CaboProblem(metodo='diferencas_finitas', verbose=False, **vao)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        _, x_vals, y_vals, dydx_vals = cabo.resolver()
+    assert (y_vals[0], y_vals[-1]) == (cabo.y0, cabo.yf)
+    # A verificação de 2ª ordem usa o mesmo estêncil da discretização: no
+    # interior sobra só o arredondamento de y'' (~eps·max|y|/h²)
+    residuos, dy_num, _ = cabo.verificar_equacao_diferencial(
+        x_vals, y_vals, dydx_vals)
+    lado_direito = cabo.C * np.sqrt(1 + dy_num[1:-1]**2)
+    piso = np.finfo(float).eps * np.abs(y_vals).max() / cabo.h**2
+    assert np.all(residuos[1:-1] <= 1e-8 * lado_direito + 8 * piso)
+
+
+def test_diferencas_finitas_tem_segunda_ordem():
+    vao = dict(C=1.5, xf=20)
+    y_exato = CaboProblem(metodo='analitico', verbose=False, h=0.02,
+                          **vao).resolver()[2]
+    erros = []
+    for h in (0.02, 0.01):
+        y_vals = CaboProblem(metodo='diferencas_finitas', verbose=False,
+                             h=h, **vao).resolver()[2]
+        erros.append(np.max(np.abs(y_vals[::round(0.02 / h)] - y_exato)))
+    assert np.log2(erros[0] / erros[1]) == pytest.approx(2, abs=0.1)